@@ -396,14 +396,14 @@ def stubs(
     """Manage exception stubs for external libraries."""
     import shutil
 
-    from bubble.stubs import load_stubs, validate_stub_file
+    from bubble.stubs import load_stubs
 
     directory = directory.resolve()
     builtin_dir = Path(__file__).parent / "stubs"
     user_dir = directory / ".flow" / "stubs"
 
     if action == StubAction.LIST:
-        stub_library = load_stubs(directory)
+        stub_library = load_stubs(directory, use_cache=False)
         if not stub_library.stubs:
             console.print("[yellow]No stubs loaded[/yellow]")
             console.print()
@@ -414,10 +414,15 @@ def stubs(
             return
 
         console.print("\n[bold]Loaded exception stubs:[/bold]\n")
-        for module, functions in sorted(stub_library.stubs.items()):
-            exc_count = sum(len(excs) for excs in functions.values())
+        function_counts: dict[str, int] = {}
+        exception_counts: dict[str, int] = {}
+        for (module, _), excs in stub_library.stubs.items():
+            function_counts[module] = function_counts.get(module, 0) + 1
+            exception_counts[module] = exception_counts.get(module, 0) + len(excs)
+        for module in sorted(function_counts):
             console.print(
-                f"  [cyan]{module}[/cyan]: {len(functions)} functions, {exc_count} exceptions"
+                f"  [cyan]{module}[/cyan]: {function_counts[module]} functions, "
+                f"{exception_counts[module]} exceptions"
             )
         console.print()
 
@@ -444,17 +449,16 @@ def stubs(
 
     elif action == StubAction.VALIDATE:
         errors_found = False
-        for stub_dir in [builtin_dir, user_dir]:
-            if stub_dir.exists():
-                for yaml_file in stub_dir.glob("*.yaml"):
-                    errors = validate_stub_file(yaml_file)
-                    if errors:
-                        errors_found = True
-                        console.print(f"[red]Errors in {yaml_file.name}:[/red]")
-                        for error in errors:
-                            console.print(f"  - {error}")
-                    else:
-                        console.print(f"[green]v[/green] {yaml_file.name}")
+        validated = load_stubs(directory, use_cache=False, validate=True)
+        for yaml_file, errors in validated.errors.items():
+            file_name = Path(yaml_file).name
+            if errors:
+                errors_found = True
+                console.print(f"[red]Errors in {file_name}:[/red]")
+                for error in errors:
+                    console.print(f"  - {error}")
+            else:
+                console.print(f"[green]v[/green] {file_name}")
 
         if not errors_found:
             console.print("\n[green]All stub files are valid[/green]")
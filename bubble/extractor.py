@@ -7,13 +7,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper, PositionProvider
+from libcst.metadata import PositionProvider
 
 if TYPE_CHECKING:
     pass
 
 from bubble.detectors import detect_entrypoints, detect_global_handlers
 from bubble.enums import Framework, ResolutionKind, ViewType
+from bubble.integrations.base import parse_source
 from bubble.integrations.flask import correlate_flask_restful_entrypoints
 from bubble.loader import load_detectors
 from bubble.models import (
@@ -595,17 +596,22 @@ class FileExtraction:
         self.detected_frameworks: set[str] = set()
 
 
-def extract_from_file(file_path: Path, relative_path: str | None = None) -> FileExtraction:
-    """Extract structural information from a single Python file."""
+def extract_from_file(
+    file_path: Path, relative_path: str | None = None, source: str | None = None
+) -> FileExtraction:
+    """Extract structural information from a single Python file.
+
+    Pass source when the caller has already read the file.
+    """
     result = FileExtraction()
 
     try:
-        source = file_path.read_text()
-        module = cst.parse_module(source)
+        if source is None:
+            source = file_path.read_text()
+        wrapper = parse_source(source)
     except Exception:
         return result
 
-    wrapper = MetadataWrapper(module)
     extractor = CodeExtractor(str(file_path), relative_path)
 
     try:
@@ -648,6 +654,22 @@ def _should_exclude(path_str: str, exclude_dirs: Sequence[str]) -> bool:
     return False
 
 
+def _discover_python_files(directory: Path, exclude_dirs: Sequence[str]) -> list[tuple[Path, str]]:
+    """Find Python files to extract, as (path, relative path string) pairs.
+
+    Excluded and hidden directories are pruned during the walk, so
+    virtualenvs, node_modules and .git are never traversed.
+    """
+    work_items: list[tuple[Path, str]] = []
+    for root, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [d for d in dirnames if not _should_exclude(d, exclude_dirs)]
+        for filename in filenames:
+            if filename.endswith(".py") and not _should_exclude(filename, exclude_dirs):
+                file_path = Path(root, filename)
+                work_items.append((file_path, str(file_path.relative_to(directory))))
+    return work_items
+
+
 def _build_known_class_names(model: ProgramModel) -> set[str]:
     """Build set of all known class names (builtins + project-defined)."""
     known: set[str] = set(BUILTIN_EXCEPTION_HIERARCHY.keys())
@@ -757,6 +779,7 @@ DRF_DISPATCH_METHODS = DRF_HTTP_METHODS | DRF_ACTION_METHODS
 def _extract_single_file_for_process(
     file_path_str: str,
     relative_path: str,
+    source: str | None = None,
 ) -> tuple[str, FileExtraction]:
     """Extract from a single file without cache access.
 
@@ -764,7 +787,7 @@ def _extract_single_file_for_process(
     Cache lookups are done in the main process before dispatching.
     """
     file_path = Path(file_path_str)
-    extraction = extract_from_file(file_path, relative_path)
+    extraction = extract_from_file(file_path, relative_path, source)
     return (relative_path, extraction)
 
 
@@ -872,14 +895,18 @@ def extract_from_directory(
         cache = FileCache(directory / ".flow")
 
     with timing.timed("file_discovery"):
-        python_files = list(directory.rglob("*.py"))
-
-    work_items: list[tuple[Path, str]] = []
-    for file_path in python_files:
-        relative_path = file_path.relative_to(directory)
-        path_str = str(relative_path)
-        if not _should_exclude(path_str, exclude_dirs):
-            work_items.append((file_path, path_str))
+        work_items = _discover_python_files(directory, exclude_dirs)
+
+    has_custom_detectors = bool(
+        custom_detectors.entrypoint_detectors or custom_detectors.global_handler_detectors
+    )
+    sources: dict[str, str] = {}
+    if has_custom_detectors:
+        for file_path, _path_str in work_items:
+            try:
+                sources[str(file_path)] = file_path.read_text()
+            except Exception:
+                pass
 
     extractions: list[tuple[str, FileExtraction]] = []
     cache_misses: list[tuple[Path, str, FileExtraction]] = []
@@ -895,13 +922,15 @@ def extract_from_directory(
     else:
         work_to_process = [(str(fp), rp) for fp, rp in work_items]
 
-    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    max_workers = min(32, (os.cpu_count() or 1) + 4, len(work_to_process))
 
     with timing.timed("parallel_extraction"):
         if work_to_process:
             with ProcessPoolExecutor(max_workers=max_workers) as executor:
                 futures = {
-                    executor.submit(_extract_single_file_for_process, fp_str, rp): (fp_str, rp)
+                    executor.submit(
+                        _extract_single_file_for_process, fp_str, rp, sources.get(fp_str)
+                    ): (fp_str, rp)
                     for fp_str, rp in work_to_process
                 }
                 for future in as_completed(futures):
@@ -936,18 +965,14 @@ def extract_from_directory(
             model.return_types.update(extraction.return_types)
             model.detected_frameworks.update(extraction.detected_frameworks)
 
-    for file_path, _path_str in work_items:
-        if custom_detectors.entrypoint_detectors or custom_detectors.global_handler_detectors:
-            try:
-                source = file_path.read_text()
-                model.entrypoints.extend(
-                    custom_detectors.detect_entrypoints(source, str(file_path))
-                )
-                model.global_handlers.extend(
-                    custom_detectors.detect_global_handlers(source, str(file_path))
-                )
-            except Exception:
-                pass
+    for file_path_str, source in sources.items():
+        try:
+            model.entrypoints.extend(custom_detectors.detect_entrypoints(source, file_path_str))
+            model.global_handlers.extend(
+                custom_detectors.detect_global_handlers(source, file_path_str)
+            )
+        except Exception:
+            pass
 
     if cache:
         cache.close()
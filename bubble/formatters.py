@@ -5,6 +5,7 @@ All Rich console output is contained here.
 """
 
 import json
+import os
 from pathlib import Path
 
 from rich.console import Console
@@ -29,10 +30,19 @@ from bubble.results import (
 )
 
 
-def _rel_path(file: str, directory: Path) -> str:
-    """Get relative path for display."""
-    if file.startswith(str(directory)):
-        return str(Path(file).relative_to(directory))
+def _dir_prefix(directory: Path) -> str:
+    """The project directory as a string prefix, with one trailing separator."""
+    return os.fspath(directory).rstrip(os.sep) + os.sep
+
+
+def _rel_path(file: str, prefix: str) -> str:
+    """Get relative path for display.
+
+    Takes the prefix from _dir_prefix(), built once per formatter, so row
+    loops only compare and slice.
+    """
+    if file.startswith(prefix):
+        return file[len(prefix) :]
     return file
 
 
@@ -43,6 +53,7 @@ def raises(
     console: Console,
 ) -> None:
     """Format raises query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "raises",
@@ -74,7 +85,7 @@ def raises(
     )
 
     for r in sorted(result.matches, key=lambda x: (x.file, x.line)):
-        rel = _rel_path(r.file, directory)
+        rel = _rel_path(r.file, prefix)
         console.print(f"  [cyan]{rel}:{r.line}[/cyan]  in [green]{r.function}()[/green]")
         if r.code:
             console.print(f"    [dim]{r.code}[/dim]")
@@ -90,6 +101,7 @@ def audit(
     console: Console,
 ) -> None:
     """Format audit query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "audit",
@@ -135,14 +147,14 @@ def audit(
                 path = ep.metadata.get("http_path", "?")
                 label = f"[green]{method}[/green] [cyan]{path}[/cyan]"
             else:
-                rel = _rel_path(ep.file, directory)
+                rel = _rel_path(ep.file, prefix)
                 label = f"[magenta]{rel}[/magenta]:[bold]{ep.function}[/bold]"
 
             console.print(f"  {label}")
             for exc_type, raise_sites in issue.uncaught.items():
                 exc_simple = exc_type.split(".")[-1]
                 for rs in raise_sites[:2]:
-                    rel = _rel_path(rs.file, directory)
+                    rel = _rel_path(rs.file, prefix)
                     console.print(f"    └─ [red]{exc_simple}[/red] [dim]({rel}:{rs.line})[/dim]")
                 if len(raise_sites) > 2:
                     console.print(f"    └─ [dim]...and {len(raise_sites) - 2} more[/dim]")
@@ -166,6 +178,7 @@ def exceptions(
     console: Console,
 ) -> None:
     """Format exceptions query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "exceptions",
@@ -195,7 +208,7 @@ def exceptions(
         for child in sorted(children):
             exc = result.classes[child]
             if exc.file:
-                rel = _rel_path(exc.file, directory)
+                rel = _rel_path(exc.file, prefix)
                 label = f"{child} ([dim]{rel}:{exc.line}[/dim])"
             else:
                 label = child
@@ -205,7 +218,7 @@ def exceptions(
     for root in sorted(result.roots):
         exc = result.classes.get(root)
         if exc and exc.file:
-            rel = _rel_path(exc.file, directory)
+            rel = _rel_path(exc.file, prefix)
             label = f"[bold]{root}[/bold] ([dim]{rel}:{exc.line}[/dim])"
         else:
             label = f"[bold]{root}[/bold]"
@@ -262,6 +275,7 @@ def callers(
     show_resolution: bool = False,
 ) -> None:
     """Format callers query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "callers",
@@ -297,7 +311,7 @@ def callers(
     )
 
     for c in sorted(result.calls, key=lambda x: (x.file, x.line)):
-        rel = _rel_path(c.file, directory)
+        rel = _rel_path(c.file, prefix)
         call_type = "method" if c.is_method_call else "function"
         resolution = (
             f" [dim]\\[{c.resolution_kind}][/dim]"
@@ -318,6 +332,7 @@ def entrypoints_to(
     console: Console,
 ) -> None:
     """Format entrypoints-to query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         json_traces = []
         for trace in result.traces:
@@ -359,7 +374,7 @@ def entrypoints_to(
     )
 
     for trace in result.traces:
-        rel = _rel_path(trace.raise_site.file, directory)
+        rel = _rel_path(trace.raise_site.file, prefix)
 
         if not trace.entrypoints:
             console.print(
@@ -385,6 +400,7 @@ def entrypoints(
     console: Console,
 ) -> None:
     """Format entrypoints query result."""
+    prefix = _dir_prefix(directory)
     total = (
         len(result.http_routes)
         + len(result.cli_scripts)
@@ -431,7 +447,7 @@ def entrypoints(
         for e in sorted_routes:
             method = e.metadata.get("http_method", "?")
             path = e.metadata.get("http_path", "?")
-            rel = _rel_path(e.file, directory)
+            rel = _rel_path(e.file, prefix)
             console.print(
                 f"  [green]{method:6}[/green] [cyan]{path:40}[/cyan] {rel}:[bold]{e.function}[/bold]"
             )
@@ -441,7 +457,7 @@ def entrypoints(
         console.print(f"\n[bold]CLI Scripts ({len(result.cli_scripts)} total):[/bold]\n")
         sorted_scripts = sorted(result.cli_scripts, key=lambda e: e.file)
         for e in sorted_scripts:
-            rel = _rel_path(e.file, directory)
+            rel = _rel_path(e.file, prefix)
             if e.metadata.get("inline"):
                 console.print(
                     f"  [magenta]{rel}[/magenta]:[bold]{e.line}[/bold] [dim](inline code)[/dim]"
@@ -454,7 +470,7 @@ def entrypoints(
         kind_label = kind.replace("_", " ").title()
         console.print(f"\n[bold]{kind_label} ({len(entries)} total):[/bold]\n")
         for e in sorted(entries, key=lambda x: x.file):
-            rel = _rel_path(e.file, directory)
+            rel = _rel_path(e.file, prefix)
             framework = e.metadata.get("framework", "")
             framework_note = f" [dim]({framework})[/dim]" if framework else ""
             console.print(f"  [yellow]{rel}[/yellow]:[bold]{e.function}[/bold](){framework_note}")
@@ -486,6 +502,7 @@ def escapes(
     console: Console,
 ) -> None:
     """Format escapes query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         entrypoint_info = None
         if result.entrypoint:
@@ -558,7 +575,7 @@ def escapes(
         path = result.entrypoint.metadata.get("http_path", "?")
         console.print(f"\n[bold]Exceptions that can escape from {method} {path}:[/bold]\n")
     elif result.entrypoint and result.entrypoint.kind == EntrypointKind.CLI_SCRIPT:
-        rel = _rel_path(result.entrypoint.file, directory)
+        rel = _rel_path(result.entrypoint.file, prefix)
         console.print(
             f"\n[bold]Exceptions that can escape from CLI script {rel}:{result.function_name}():[/bold]\n"
         )
@@ -587,7 +604,7 @@ def escapes(
             handler_info = f" (@errorhandler({handler.handled_type}))" if handler else ""
             console.print(f"    [cyan]{exc_type}[/cyan]{handler_info}")
             for r in raise_sites[:3]:
-                rel = _rel_path(r.file, directory)
+                rel = _rel_path(r.file, prefix)
                 console.print(f"      └─ raised in: [dim]{rel}:{r.line}[/dim] ({r.function})")
             if len(raise_sites) > 3:
                 console.print(f"      └─ [dim]...and {len(raise_sites) - 3} more[/dim]")
@@ -601,7 +618,7 @@ def escapes(
             console.print(f"    [cyan]{exc_simple}[/cyan]")
             console.print(f"      └─ becomes: [green]{response}[/green]")
             for rs, _ in handled_list[:3]:
-                rel = _rel_path(rs.file, directory)
+                rel = _rel_path(rs.file, prefix)
                 console.print(f"      └─ raised in: [dim]{rel}:{rs.line}[/dim] ({rs.function})")
             if len(handled_list) > 3:
                 console.print(f"      └─ [dim]...and {len(handled_list) - 3} more[/dim]")
@@ -618,7 +635,7 @@ def escapes(
                 evidence_list = result.flow.evidence.get(exc_type, [])
                 console.print(f"    [cyan]{exc_type}[/cyan]")
                 for r in raise_sites[:3]:
-                    rel = _rel_path(r.file, directory)
+                    rel = _rel_path(r.file, prefix)
                     matching_evidence = next(
                         (
                             ev
@@ -664,6 +681,7 @@ def catches(
     console: Console,
 ) -> None:
     """Format catches query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "catches",
@@ -711,7 +729,7 @@ def catches(
     if result.global_handlers:
         console.print("  [green]GLOBAL HANDLERS:[/green]")
         for h in result.global_handlers:
-            rel = _rel_path(h.file, directory)
+            rel = _rel_path(h.file, prefix)
             console.print(
                 f"    [cyan]{rel}:{h.line}[/cyan]  @errorhandler({h.handled_type}) → [green]{h.function}()[/green]"
             )
@@ -720,7 +738,7 @@ def catches(
     if result.local_catches:
         console.print("  [blue]LOCAL TRY/EXCEPT:[/blue]")
         for c in sorted(result.local_catches, key=lambda x: (x.file, x.line)):
-            rel = _rel_path(c.file, directory)
+            rel = _rel_path(c.file, prefix)
             reraise_note = " [yellow](re-raises)[/yellow]" if c.has_reraise else ""
             caught = ", ".join(c.caught_types) if c.caught_types else "bare except"
             console.print(f"    [cyan]{rel}:{c.line}[/cyan]  in [green]{c.function}()[/green]")
@@ -822,6 +840,7 @@ def subclasses(
     console: Console,
 ) -> None:
     """Format subclasses query result."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "subclasses",
@@ -863,7 +882,7 @@ def subclasses(
         abstract_note = " [dim](abstract)[/dim]" if s.is_abstract else ""
         console.print(f"  [cyan]{s.name}[/cyan]{abstract_note}")
         if s.file:
-            rel = _rel_path(s.file, directory)
+            rel = _rel_path(s.file, prefix)
             console.print(f"    [dim]{rel}:{s.line}[/dim]")
 
     console.print()
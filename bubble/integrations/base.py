@@ -5,9 +5,12 @@ how framework-specific exceptions map to HTTP responses.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Protocol
 
+import libcst as cst
 import typer
+from libcst.metadata import MetadataWrapper
 
 from bubble.enums import EntrypointKind
 
@@ -26,6 +29,17 @@ class Entrypoint:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=8)
+def parse_source(source: str) -> MetadataWrapper:
+    """Parse source into a MetadataWrapper shared by every visitor that reads it.
+
+    Extraction runs its own visitor and each framework detector over the same
+    file in turn. Sharing the wrapper parses the file once and resolves its
+    position metadata once. Raises libcst.ParserSyntaxError on invalid source.
+    """
+    return MetadataWrapper(cst.parse_module(source))
+
+
 GENERIC_EXCEPTION_TYPES = frozenset({"Exception", "BaseException"})
 
 
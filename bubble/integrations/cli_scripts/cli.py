@@ -58,7 +58,7 @@ def audit(
     directory = directory.resolve()
     model = _build_model(directory, use_cache=not no_cache)
     entrypoints = _get_cli_entrypoints(model)
-    stub_library = load_stubs(directory)
+    stub_library = load_stubs(directory, use_cache=not no_cache)
     result = audit_integration(model, integration, entrypoints, [], stub_library=stub_library)
     formatters.audit(result, OutputFormat(output_format), directory, console)
 
@@ -1,10 +1,10 @@
 """CLI entrypoint detection (if __name__ == "__main__" blocks)."""
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper, PositionProvider
+from libcst.metadata import PositionProvider
 
 from bubble.enums import EntrypointKind, Framework
-from bubble.integrations.base import Entrypoint
+from bubble.integrations.base import Entrypoint, parse_source
 
 
 class CLIEntrypointVisitor(cst.CSTVisitor):
@@ -135,11 +135,10 @@ class CLIEntrypointVisitor(cst.CSTVisitor):
 def detect_cli_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
     """Detect CLI entrypoints in a Python source file."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = CLIEntrypointVisitor(file_path)
 
     try:
@@ -1,10 +1,10 @@
 """Django and Django REST Framework route detection."""
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper, PositionProvider
+from libcst.metadata import PositionProvider
 
 from bubble.enums import EntrypointKind, Framework, ViewType
-from bubble.integrations.base import Entrypoint, GlobalHandler
+from bubble.integrations.base import Entrypoint, GlobalHandler, parse_source
 
 DRF_BASE_CLASSES = {
     "APIView",
@@ -318,13 +318,12 @@ class DjangoExceptionHandlerVisitor(cst.CSTVisitor):
 def detect_django_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
     """Detect Django view entrypoints in a Python source file."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
     entrypoints: list[Entrypoint] = []
 
-    wrapper = MetadataWrapper(module)
     class_visitor = DjangoViewVisitor(file_path)
     try:
         wrapper.visit(class_visitor)
@@ -332,7 +331,6 @@ def detect_django_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
     except Exception:
         pass
 
-    wrapper = MetadataWrapper(module)
     func_visitor = DjangoFunctionViewVisitor(file_path)
     try:
         wrapper.visit(func_visitor)
@@ -346,11 +344,10 @@ def detect_django_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
 def detect_django_global_handlers(source: str, file_path: str) -> list[GlobalHandler]:
     """Detect Django exception handlers in a Python source file."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = DjangoExceptionHandlerVisitor(file_path)
 
     try:
@@ -363,11 +360,10 @@ def detect_django_global_handlers(source: str, file_path: str) -> list[GlobalHan
 def detect_django_url_patterns(source: str, file_path: str) -> list[dict[str, str]]:
     """Detect Django URL patterns in a urls.py file."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = DjangoURLPatternVisitor(file_path)
 
     try:
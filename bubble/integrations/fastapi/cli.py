@@ -88,7 +88,7 @@ def audit(
             console.print(f"[yellow]No FastAPI routes found in {filter_arg}[/yellow]")
         return
 
-    stub_library = load_stubs(directory)
+    stub_library = load_stubs(directory, use_cache=not no_cache)
     result = audit_integration(model, integration, entrypoints, handlers, stub_library=stub_library)
     formatters.audit(result, OutputFormat(output_format), directory, console)
 
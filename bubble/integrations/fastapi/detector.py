@@ -1,10 +1,10 @@
 """FastAPI route and exception handler detection."""
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper, PositionProvider
+from libcst.metadata import PositionProvider
 
 from bubble.enums import EntrypointKind, Framework
-from bubble.integrations.base import Entrypoint, GlobalHandler
+from bubble.integrations.base import Entrypoint, GlobalHandler, parse_source
 
 
 class FastAPIRouteVisitor(cst.CSTVisitor):
@@ -145,11 +145,10 @@ class FastAPIExceptionHandlerVisitor(cst.CSTVisitor):
 def detect_fastapi_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
     """Detect FastAPI route entrypoints in a Python source file."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = FastAPIRouteVisitor(file_path)
 
     try:
@@ -162,11 +161,10 @@ def detect_fastapi_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
 def detect_fastapi_global_handlers(source: str, file_path: str) -> list[GlobalHandler]:
     """Detect FastAPI exception handlers in a Python source file."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = FastAPIExceptionHandlerVisitor(file_path)
 
     try:
@@ -1,10 +1,10 @@
 """Flask route and error handler detection."""
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper, PositionProvider
+from libcst.metadata import PositionProvider
 
 from bubble.enums import EntrypointKind, Framework
-from bubble.integrations.base import Entrypoint, GlobalHandler
+from bubble.integrations.base import Entrypoint, GlobalHandler, parse_source
 
 HTTP_METHODS = {"get", "post", "put", "delete", "patch", "head", "options"}
 
@@ -28,7 +28,7 @@ class FlaskRouteVisitor(cst.CSTVisitor):
 
     def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
         for decorator in node.decorators:
-            route_info = self._parse_route_decorator(decorator)
+            route_info = FlaskRouteVisitor._parse_route_decorator(decorator)
             if route_info:
                 pos = self.get_metadata(PositionProvider, node)
                 self.entrypoints.append(
@@ -46,17 +46,18 @@ class FlaskRouteVisitor(cst.CSTVisitor):
                 )
         return True
 
-    def _parse_route_decorator(self, decorator: cst.Decorator) -> dict[str, str] | None:
+    @staticmethod
+    def _parse_route_decorator(decorator: cst.Decorator) -> dict[str, str] | None:
         if not isinstance(decorator.decorator, cst.Call):
             return None
 
         call = decorator.decorator
 
         if isinstance(call.func, cst.Attribute):
-            if call.func.attr.value not in self.ROUTE_DECORATOR_NAMES:
+            if call.func.attr.value not in FlaskRouteVisitor.ROUTE_DECORATOR_NAMES:
                 return None
         elif isinstance(call.func, cst.Name):
-            if call.func.value not in self.ROUTE_DECORATOR_NAMES:
+            if call.func.value not in FlaskRouteVisitor.ROUTE_DECORATOR_NAMES:
                 return None
         else:
             return None
@@ -76,13 +77,14 @@ class FlaskRouteVisitor(cst.CSTVisitor):
         methods = ["GET"]
         for arg in call.args:
             if arg.keyword and arg.keyword.value == "methods":
-                methods = self._extract_methods(arg.value)
+                methods = FlaskRouteVisitor._extract_methods(arg.value)
 
         if path:
             return {"path": path, "method": methods[0] if methods else "GET"}
         return None
 
-    def _extract_methods(self, value: cst.BaseExpression) -> list[str]:
+    @staticmethod
+    def _extract_methods(value: cst.BaseExpression) -> list[str]:
         """
         Extract HTTP methods from a list or tuple.
 
@@ -111,7 +113,7 @@ class FlaskErrorHandlerVisitor(cst.CSTVisitor):
 
     def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
         for decorator in node.decorators:
-            handler_info = self._parse_errorhandler_decorator(decorator)
+            handler_info = FlaskErrorHandlerVisitor._parse_errorhandler_decorator(decorator)
             if handler_info:
                 pos = self.get_metadata(PositionProvider, node)
                 self.handlers.append(
@@ -124,7 +126,8 @@ class FlaskErrorHandlerVisitor(cst.CSTVisitor):
                 )
         return True
 
-    def _parse_errorhandler_decorator(self, decorator: cst.Decorator) -> dict[str, str] | None:
+    @staticmethod
+    def _parse_errorhandler_decorator(decorator: cst.Decorator) -> dict[str, str] | None:
         if not isinstance(decorator.decorator, cst.Call):
             return None
 
@@ -143,16 +146,17 @@ class FlaskErrorHandlerVisitor(cst.CSTVisitor):
             return None
 
         first_arg = call.args[0].value
-        exception_type = self._get_name_from_expr(first_arg)
+        exception_type = FlaskErrorHandlerVisitor._get_name_from_expr(first_arg)
         if exception_type:
             return {"exception_type": exception_type}
         return None
 
-    def _get_name_from_expr(self, expr: cst.BaseExpression) -> str:
+    @staticmethod
+    def _get_name_from_expr(expr: cst.BaseExpression) -> str:
         if isinstance(expr, cst.Name):
             return expr.value
         elif isinstance(expr, cst.Attribute):
-            base = self._get_name_from_expr(expr.value)
+            base = FlaskErrorHandlerVisitor._get_name_from_expr(expr.value)
             if base:
                 return f"{base}.{expr.attr.value}"
             return expr.attr.value
@@ -316,12 +320,11 @@ def detect_flask_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
     Flask-RESTful call-based routes (api.add_resource).
     """
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
     entrypoints: list[Entrypoint] = []
-    wrapper = MetadataWrapper(module)
 
     route_visitor = FlaskRouteVisitor(file_path)
     try:
@@ -343,11 +346,10 @@ def detect_flask_entrypoints(source: str, file_path: str) -> list[Entrypoint]:
 def detect_flask_global_handlers(source: str, file_path: str) -> list[GlobalHandler]:
     """Detect Flask error handlers in a Python source file."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = FlaskErrorHandlerVisitor(file_path)
 
     try:
@@ -4,6 +4,7 @@ Shared formatting logic for audit, entrypoints, and routes-to results.
 """
 
 import json
+import os
 from pathlib import Path
 
 from rich.console import Console
@@ -12,10 +13,19 @@ from bubble.enums import EntrypointKind, OutputFormat
 from bubble.integrations.models import AuditResult, EntrypointsResult, RoutesToResult
 
 
-def _rel_path(file: str, directory: Path) -> str:
-    """Get relative path for display."""
-    if file.startswith(str(directory)):
-        return str(Path(file).relative_to(directory))
+def _dir_prefix(directory: Path) -> str:
+    """The project directory as a string prefix, with one trailing separator."""
+    return os.fspath(directory).rstrip(os.sep) + os.sep
+
+
+def _rel_path(file: str, prefix: str) -> str:
+    """Get relative path for display.
+
+    Takes the prefix from _dir_prefix(), built once per formatter, so row
+    loops only compare and slice.
+    """
+    if file.startswith(prefix):
+        return file[len(prefix) :]
     return file
 
 
@@ -26,6 +36,7 @@ def audit(
     console: Console,
 ) -> None:
     """Format audit result for an integration."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "audit",
@@ -87,7 +98,7 @@ def audit(
                 path = ep.metadata.get("http_path", "?")
                 label = f"[green]{method}[/green] [cyan]{path}[/cyan]"
             else:
-                rel = _rel_path(ep.file, directory)
+                rel = _rel_path(ep.file, prefix)
                 label = f"[magenta]{rel}[/magenta]:[bold]{ep.function}[/bold]"
 
             console.print(f"  {label}")
@@ -95,7 +106,7 @@ def audit(
             for exc_type, raise_sites in issue.uncaught.items():
                 exc_simple = exc_type.split(".")[-1]
                 for rs in raise_sites[:2]:
-                    rel = _rel_path(rs.file, directory)
+                    rel = _rel_path(rs.file, prefix)
                     console.print(f"    [red]{exc_simple}[/red] [dim]({rel}:{rs.line})[/dim]")
                 if len(raise_sites) > 2:
                     console.print(f"    [dim]...and {len(raise_sites) - 2} more[/dim]")
@@ -103,7 +114,7 @@ def audit(
             for exc_type, raise_sites in issue.caught_by_generic.items():
                 exc_simple = exc_type.split(".")[-1]
                 for rs in raise_sites[:2]:
-                    rel = _rel_path(rs.file, directory)
+                    rel = _rel_path(rs.file, prefix)
                     console.print(
                         f"    [yellow]{exc_simple}[/yellow] [dim]({rel}:{rs.line}) "
                         f"- only caught by generic handler[/dim]"
@@ -128,6 +139,7 @@ def entrypoints(
     console: Console,
 ) -> None:
     """Format entrypoints result for an integration."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         data = {
             "query": "entrypoints",
@@ -175,7 +187,7 @@ def entrypoints(
         for e in sorted_routes:
             method = e.metadata.get("http_method", "?")
             path = e.metadata.get("http_path", "?")
-            rel = _rel_path(e.file, directory)
+            rel = _rel_path(e.file, prefix)
             console.print(
                 f"  [green]{method:6}[/green] [cyan]{path:40}[/cyan] {rel}:[bold]{e.function}[/bold]"
             )
@@ -185,7 +197,7 @@ def entrypoints(
         console.print(f"\n[bold]CLI Scripts ({len(cli_scripts)} total):[/bold]\n")
         sorted_scripts = sorted(cli_scripts, key=lambda e: e.file)
         for e in sorted_scripts:
-            rel = _rel_path(e.file, directory)
+            rel = _rel_path(e.file, prefix)
             if e.metadata.get("inline"):
                 console.print(
                     f"  [magenta]{rel}[/magenta]:[bold]{e.line}[/bold] [dim](inline code)[/dim]"
@@ -197,7 +209,7 @@ def entrypoints(
     if other:
         console.print(f"\n[bold]Other ({len(other)} total):[/bold]\n")
         for e in sorted(other, key=lambda x: x.file):
-            rel = _rel_path(e.file, directory)
+            rel = _rel_path(e.file, prefix)
             console.print(f"  [yellow]{rel}[/yellow]:[bold]{e.function}[/bold]()")
         console.print()
 
@@ -209,6 +221,7 @@ def routes_to(
     console: Console,
 ) -> None:
     """Format routes-to result for an integration."""
+    prefix = _dir_prefix(directory)
     if output_format == OutputFormat.JSON:
         json_traces = []
         for trace in result.traces:
@@ -252,7 +265,7 @@ def routes_to(
     )
 
     for trace in result.traces:
-        rel = _rel_path(trace.raise_site.file, directory)
+        rel = _rel_path(trace.raise_site.file, prefix)
 
         if not trace.entrypoints:
             console.print(
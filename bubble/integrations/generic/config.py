@@ -1,7 +1,32 @@
 """Configuration schema for generic framework detection."""
 
+import re
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str] | None:
+    """Compile a glob pattern, or return None for an exact name without glob characters."""
+    if _GLOB_CHARS.isdisjoint(pattern):
+        return None
+    return re.compile(translate(pattern))
+
+
+def _matches_glob(name: str, pattern: str) -> bool:
+    """Match a decorator or call name against a glob pattern, case-sensitively.
+
+    Same semantics as fnmatchcase on every platform, unlike fnmatch, which
+    ignores case on Windows. Patterns without glob characters are compared
+    directly.
+    """
+    compiled = _compile_glob(pattern)
+    if compiled is None:
+        return name == pattern
+    return compiled.match(name) is not None
 
 
 @dataclass
@@ -37,12 +62,12 @@ class DecoratorRoutePattern:
     default_method: str = "GET"
 
     def matches_decorator(self, decorator_name: str) -> bool:
-        """Check if this pattern matches a decorator name.
+        """Check if this pattern matches a decorator name, case-sensitively.
 
         Args:
             decorator_name: Name like "route", "get", or "expose"
         """
-        return fnmatch(decorator_name, self.decorator_pattern)
+        return _matches_glob(decorator_name, self.decorator_pattern)
 
 
 @dataclass
@@ -83,16 +108,16 @@ class HandlerPattern:
     exception_arg: str = "arg[0]"
 
     def matches_decorator(self, decorator_name: str) -> bool:
-        """Check if this pattern matches a decorator name."""
+        """Check if this pattern matches a decorator name, case-sensitively."""
         if not self.decorator_pattern:
             return False
-        return fnmatch(decorator_name, self.decorator_pattern)
+        return _matches_glob(decorator_name, self.decorator_pattern)
 
     def matches_call(self, call_name: str) -> bool:
-        """Check if this pattern matches a function call name."""
+        """Check if this pattern matches a function call name, case-sensitively."""
         if not self.call_pattern:
             return False
-        return fnmatch(call_name, self.call_pattern)
+        return _matches_glob(call_name, self.call_pattern)
 
 
 @dataclass
@@ -1,10 +1,10 @@
 """Generic entrypoint and handler detection based on configuration."""
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper, PositionProvider
+from libcst.metadata import PositionProvider
 
 from bubble.enums import EntrypointKind
-from bubble.integrations.base import Entrypoint, GlobalHandler
+from bubble.integrations.base import Entrypoint, GlobalHandler, parse_source
 from bubble.integrations.generic.config import (
     DecoratorRoutePattern,
     FrameworkConfig,
@@ -314,11 +314,10 @@ def _extract_list_of_strings(value: cst.BaseExpression) -> list[str]:
 def detect_entrypoints(source: str, file_path: str, config: FrameworkConfig) -> list[Entrypoint]:
     """Detect entrypoints using the generic detector with given configuration."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = GenericRouteVisitor(file_path, config)
 
     try:
@@ -333,11 +332,10 @@ def detect_global_handlers(
 ) -> list[GlobalHandler]:
     """Detect global handlers using the generic detector with given configuration."""
     try:
-        module = cst.parse_module(source)
+        wrapper = parse_source(source)
     except Exception:
         return []
 
-    wrapper = MetadataWrapper(module)
     visitor = GenericHandlerVisitor(file_path, config)
 
     try:
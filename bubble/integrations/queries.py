@@ -45,6 +45,24 @@ def _filter_async_boundaries(
     return filtered
 
 
+def _match_global_handler(
+    exc_simple: str, model: ProgramModel, global_handlers: list[GlobalHandler]
+) -> GlobalHandler | None:
+    """Find the global handler that catches an exception, by simple class name."""
+    global_handler_types: dict[str, GlobalHandler] = {}
+    for handler in global_handlers:
+        global_handler_types[handler.handled_type] = handler
+        global_handler_types[handler.handled_type.split(".")[-1]] = handler
+
+    for handler_type, handler in global_handler_types.items():
+        handler_simple = handler_type.split(".")[-1]
+        if exc_simple == handler_simple:
+            return handler
+        if model.exception_hierarchy.is_subclass_of(exc_simple, handler_simple):
+            return handler
+    return None
+
+
 def _compute_exception_flow_for_integration(
     function_name: str,
     model: ProgramModel,
@@ -55,6 +73,7 @@ def _compute_exception_flow_for_integration(
     name_to_qualified: dict[str, list[str]] | None = None,
     config: FlowConfig | None = None,
     entrypoint_file: str | None = None,
+    handler_matches: dict[str, GlobalHandler | None] | None = None,
 ) -> ExceptionFlow:
     """Compute exception flow for a function with integration-specific handling.
 
@@ -65,7 +84,8 @@ def _compute_exception_flow_for_integration(
     - uncaught: Will escape
 
     For better performance when calling repeatedly, pre-compute forward_graph and
-    name_to_qualified using build_forward_call_graph() and build_name_to_qualified().
+    name_to_qualified using build_forward_call_graph() and build_name_to_qualified(),
+    and pass the same handler_matches dict to every call with the same global_handlers.
     """
     from bubble.models import ExceptionEvidence, compute_confidence
 
@@ -94,10 +114,8 @@ def _compute_exception_flow_for_integration(
     escaping_exceptions = propagation.propagated_raises.get(func_key, set())
     func_evidence = propagation.propagated_with_evidence.get(func_key, {})
 
-    global_handler_types: dict[str, GlobalHandler] = {}
-    for handler in global_handlers:
-        global_handler_types[handler.handled_type] = handler
-        global_handler_types[handler.handled_type.split(".")[-1]] = handler
+    if handler_matches is None:
+        handler_matches = {}
 
     for exc_type in escaping_exceptions:
         exc_simple = exc_type.split(".")[-1]
@@ -112,11 +130,12 @@ def _compute_exception_flow_for_integration(
         evidence_list: list[ExceptionEvidence] = []
         for key, prop_raise in func_evidence.items():
             if key[0] == exc_type:
+                call_path = prop_raise.edges()
                 evidence_list.append(
                     ExceptionEvidence(
                         raise_site=prop_raise.raise_site,
-                        call_path=list(prop_raise.path),
-                        confidence=compute_confidence(list(prop_raise.path)),
+                        call_path=call_path,
+                        confidence=compute_confidence(call_path),
                     )
                 )
 
@@ -125,15 +144,9 @@ def _compute_exception_flow_for_integration(
                 flow.evidence[exc_type] = []
             flow.evidence[exc_type].extend(evidence_list)
 
-        caught_by_handler = None
-        for handler_type, handler in global_handler_types.items():
-            handler_simple = handler_type.split(".")[-1]
-            if exc_simple == handler_simple:
-                caught_by_handler = handler
-                break
-            if model.exception_hierarchy.is_subclass_of(exc_simple, handler_simple):
-                caught_by_handler = handler
-                break
+        if exc_simple not in handler_matches:
+            handler_matches[exc_simple] = _match_global_handler(exc_simple, model, global_handlers)
+        caught_by_handler = handler_matches[exc_simple]
 
         if caught_by_handler:
             if caught_by_handler.is_generic:
@@ -224,6 +237,7 @@ def audit_integration(
         forward_graph = _filter_async_boundaries(forward_graph, config)
     name_to_qualified = build_name_to_qualified(propagation)
 
+    handler_matches: dict[str, GlobalHandler | None] = {}
     issues: list[AuditIssue] = []
     clean_count = 0
 
@@ -238,6 +252,7 @@ def audit_integration(
             name_to_qualified,
             config,
             entrypoint_file=entrypoint.file,
+            handler_matches=handler_matches,
         )
 
         real_uncaught = {k: v for k, v in flow.uncaught.items() if k not in reraise_patterns}
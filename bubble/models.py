@@ -1,9 +1,12 @@
 """Data models for code flow analysis."""
 
+import time
 from dataclasses import dataclass, field
 from difflib import get_close_matches
+from functools import cached_property
 from typing import NewType
 
+from bubble import timing
 from bubble.enums import ConfidenceLevel, EntrypointKind, ResolutionKind
 from bubble.integrations.base import (
     Entrypoint,
@@ -91,6 +94,43 @@ BUILTIN_EXCEPTION_HIERARCHY: dict[str, list[str]] = {
     "ZeroDivisionError": ["ArithmeticError"],
 }
 
+
+def _builtin_child_map() -> dict[str, tuple[str, ...]]:
+    """Invert BUILTIN_EXCEPTION_HIERARCHY into parent -> children."""
+    children: dict[str, list[str]] = {}
+    for exc_name, parents in BUILTIN_EXCEPTION_HIERARCHY.items():
+        for parent in parents:
+            if parent not in children:
+                children[parent] = []
+            children[parent].append(exc_name)
+    return {parent: tuple(names) for parent, names in children.items()}
+
+
+def _builtin_ancestors() -> dict[str, frozenset[str]]:
+    """Close BUILTIN_EXCEPTION_HIERARCHY into each exception's full set of ancestors."""
+    ancestors: dict[str, frozenset[str]] = {}
+
+    def visit(exc_name: str) -> frozenset[str]:
+        if exc_name not in ancestors:
+            found: set[str] = set()
+            for parent in BUILTIN_EXCEPTION_HIERARCHY[exc_name]:
+                found.add(parent)
+                found.update(visit(parent))
+            ancestors[exc_name] = frozenset(found)
+        return ancestors[exc_name]
+
+    for exc_name in BUILTIN_EXCEPTION_HIERARCHY:
+        visit(exc_name)
+    return ancestors
+
+
+_BUILTIN_CHILD_MAP = _builtin_child_map()
+_BUILTIN_ANCESTORS = _builtin_ancestors()
+
+HEURISTIC_RESOLUTION_KINDS: frozenset[ResolutionKind] = frozenset(
+    {ResolutionKind.NAME_FALLBACK, ResolutionKind.POLYMORPHIC}
+)
+
 __all__ = [
     "FunctionKey",
     "FunctionNotFoundError",
@@ -100,6 +140,7 @@ __all__ = [
     "RaiseSite",
     "CatchSite",
     "ResolutionKind",
+    "HEURISTIC_RESOLUTION_KINDS",
     "CallSite",
     "ResolutionEdge",
     "ExceptionEvidence",
@@ -166,6 +207,11 @@ class CatchSite:
     has_bare_except: bool
     has_reraise: bool
 
+    @cached_property
+    def simple_caught_types(self) -> tuple[str, ...]:
+        """Caught type names with any module prefix stripped, computed once."""
+        return tuple(t.split(".")[-1] for t in self.caught_types)
+
 
 @dataclass
 class CallSite:
@@ -181,7 +227,7 @@ class CallSite:
     resolution_kind: ResolutionKind = ResolutionKind.UNRESOLVED
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResolutionEdge:
     """An edge in the call path with resolution metadata."""
 
@@ -204,30 +250,24 @@ class ExceptionEvidence:
 
 
 def compute_confidence(edges: list[ResolutionEdge]) -> ConfidenceLevel:
-    """Compute confidence level based on resolution kinds in the path."""
-    if not edges:
-        return ConfidenceLevel.HIGH
-
-    has_ambiguous_fallback = any(
-        e.resolution_kind == ResolutionKind.NAME_FALLBACK and e.match_count > 1 for e in edges
-    )
-    if has_ambiguous_fallback:
-        return ConfidenceLevel.LOW
-
-    has_polymorphic = any(e.resolution_kind == ResolutionKind.POLYMORPHIC for e in edges)
-    if has_polymorphic:
-        return ConfidenceLevel.LOW
-
-    has_unambiguous_fallback = any(
-        e.resolution_kind == ResolutionKind.NAME_FALLBACK and e.match_count == 1 for e in edges
-    )
-    if has_unambiguous_fallback:
-        return ConfidenceLevel.MEDIUM
-
-    if any(e.resolution_kind == ResolutionKind.RETURN_TYPE for e in edges):
-        return ConfidenceLevel.MEDIUM
-
-    return ConfidenceLevel.HIGH
+    """Compute confidence level based on resolution kinds in the path.
+
+    Single pass over the path: returns LOW as soon as an ambiguous fallback or
+    polymorphic edge is seen, otherwise MEDIUM if any edge was a heuristic
+    single-match fallback or return-type resolution.
+    """
+    found_medium = False
+    for e in edges:
+        kind = e.resolution_kind
+        if kind in HEURISTIC_RESOLUTION_KINDS:
+            if kind is ResolutionKind.POLYMORPHIC or e.match_count > 1:
+                return ConfidenceLevel.LOW
+            if e.match_count == 1:
+                found_medium = True
+        elif kind is ResolutionKind.RETURN_TYPE:
+            found_medium = True
+
+    return ConfidenceLevel.MEDIUM if found_medium else ConfidenceLevel.HIGH
 
 
 @dataclass
@@ -259,18 +299,22 @@ class ClassHierarchy:
     parent_map: dict[str, list[str]] = field(default_factory=dict)
     child_map: dict[str, list[str]] = field(default_factory=dict)
     _subclass_cache: dict[tuple[str, str], bool] = field(default_factory=dict, repr=False)
+    _descendants_cache: dict[str, frozenset[str]] = field(default_factory=dict, repr=False)
+    _simple_child_map: dict[str, list[str]] | None = field(default=None, repr=False)
+    _builtins_intact: bool = field(default=True, repr=False)
 
     def __post_init__(self) -> None:
         """Bootstrap with built-in Python exceptions."""
         self._bootstrap_builtins()
 
     def _bootstrap_builtins(self) -> None:
-        """Add built-in Python exception hierarchy."""
-        for exc_name, parents in BUILTIN_EXCEPTION_HIERARCHY.items():
-            self.parent_map[exc_name] = parents
-            for parent in parents:
-                if parent not in self.child_map:
-                    self.child_map[parent] = []
+        """Add built-in Python exception hierarchy from the precomputed maps."""
+        self.parent_map.update(BUILTIN_EXCEPTION_HIERARCHY)
+        for parent, children in _BUILTIN_CHILD_MAP.items():
+            if parent not in self.child_map:
+                self.child_map[parent] = list(children)
+                continue
+            for exc_name in children:
                 if exc_name not in self.child_map[parent]:
                     self.child_map[parent].append(exc_name)
 
@@ -278,6 +322,8 @@ class ClassHierarchy:
         """Add a class to the hierarchy."""
         self.classes[cls.name] = cls
         self.parent_map[cls.name] = cls.bases
+        if cls.name in BUILTIN_EXCEPTION_HIERARCHY:
+            self._builtins_intact = False
 
         for base in cls.bases:
             base_simple = base.split(".")[-1]
@@ -287,6 +333,8 @@ class ClassHierarchy:
                 self.child_map[base_simple].append(cls.name)
 
         self._subclass_cache.clear()
+        self._descendants_cache.clear()
+        self._simple_child_map = None
 
     def get_all_subclasses(self, class_name: str) -> set[str]:
         """Get all subclasses of a class (direct and indirect)."""
@@ -302,24 +350,62 @@ class ClassHierarchy:
 
         return result
 
+    def descendants_of(self, class_name: str) -> frozenset[str]:
+        """Get every class name that is_subclass_of() would accept for class_name.
+
+        The result includes class_name itself. It is derived from parent_map
+        (not child_map) so it agrees with is_subclass_of() even when a class
+        name is defined more than once, and is memoized until add_class().
+        """
+        cached = self._descendants_cache.get(class_name)
+        if cached is not None:
+            return cached
+
+        if self._simple_child_map is None:
+            simple_child_map: dict[str, list[str]] = {}
+            for child, parents in self.parent_map.items():
+                for p in parents:
+                    p_simple = p.split(".")[-1]
+                    if p_simple not in simple_child_map:
+                        simple_child_map[p_simple] = []
+                    simple_child_map[p_simple].append(child)
+            self._simple_child_map = simple_child_map
+
+        result: set[str] = {class_name}
+        to_visit = [class_name]
+        while to_visit:
+            current = to_visit.pop()
+            for child in self._simple_child_map.get(current, []):
+                if child not in result:
+                    result.add(child)
+                    to_visit.append(child)
+
+        descendants = frozenset(result)
+        self._descendants_cache[class_name] = descendants
+        return descendants
+
     def get_subclasses(self, class_name: str) -> set[str]:
         """Alias for get_all_subclasses for backwards compatibility."""
         return self.get_all_subclasses(class_name)
 
     def is_subclass_of(self, child: str, parent: str) -> bool:
-        """Check if child is a subclass of parent."""
-        import time
-
-        from bubble import timing
+        """Check if child is a subclass of parent, memoized until add_class().
 
+        Built-in children are answered from their precomputed ancestors unless
+        a user class has redefined a built-in name.
+        """
         if child == parent:
             return True
 
+        builtin_ancestors = _BUILTIN_ANCESTORS.get(child)
+        if builtin_ancestors is not None and self._builtins_intact:
+            return parent in builtin_ancestors
+
         cache_key = (child, parent)
-        if cache_key in self._subclass_cache:
-            if timing.is_enabled():
-                timing.record("hierarchy_cache_hit", 0)
-            return self._subclass_cache[cache_key]
+        cached = self._subclass_cache.get(cache_key)
+        if cached is not None:
+            timing.record("hierarchy_cache_hit", 0)
+            return cached
 
         start = time.perf_counter()
 
@@ -344,10 +430,7 @@ class ClassHierarchy:
             to_check.extend(p.split(".")[-1] for p in parents)
 
         self._subclass_cache[cache_key] = result
-
-        if timing.is_enabled():
-            timing.record("hierarchy_lookup", time.perf_counter() - start)
-
+        timing.record("hierarchy_lookup", time.perf_counter() - start)
         return result
 
     def is_abstract_method(self, class_name: str, method_name: str) -> bool:
@@ -5,8 +5,13 @@ Computes which exceptions can escape from each function and entrypoint.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import heapq
+import sys
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,7 +19,7 @@ if TYPE_CHECKING:
 
 from bubble.enums import ResolutionKind, ResolutionMode
 from bubble.models import (
-    CallSite,
+    HEURISTIC_RESOLUTION_KINDS,
     CatchSite,
     ClassHierarchy,
     ExceptionEvidence,
@@ -25,16 +30,62 @@ from bubble.models import (
     compute_confidence,
 )
 
-_propagation_cache: dict[tuple[int, ResolutionMode, int | None, bool], PropagationResult] = {}
+PropagationCacheKey = tuple[int, ResolutionMode, int | None, bool]
+
+_propagation_cache: dict[PropagationCacheKey, PropagationResult] = {}
+_cache_finalizers: dict[int, weakref.finalize[[int], object]] = {}
+
+
+def _evict_cached_results(object_id: int) -> None:
+    """Drop cached results keyed on a model or stub library that is being collected.
+
+    Runs before the object's id can be reused, so a later object with the same
+    id never sees a stale result.
+    """
+    del _cache_finalizers[object_id]
+    stale = [key for key in _propagation_cache if object_id in (key[0], key[2])]
+    for key in stale:
+        del _propagation_cache[key]
+
+
+def _track_cache_owner(owner: object) -> None:
+    """Evict cached results when owner is garbage collected."""
+    if id(owner) not in _cache_finalizers:
+        _cache_finalizers[id(owner)] = weakref.finalize(owner, _evict_cached_results, id(owner))
+
+
+@dataclass(frozen=True, slots=True)
+class PathNode:
+    """One edge of a propagation path, linked to the rest of the path.
+
+    Propagating a raise one more call up shares the callee's path as the tail
+    instead of copying it.
+    """
+
+    edge: ResolutionEdge
+    tail: PathNode | None = None
 
 
 @dataclass(frozen=True)
 class PropagatedRaise:
-    """A raise site propagated to a function with its call path."""
+    """A raise site propagated to a function with its call path.
+
+    path is the first edge (from this function toward the raise site), or None
+    for a direct raise. Use edges() to get the whole path as a list.
+    """
 
     exception_type: str
     raise_site: RaiseSite
-    path: tuple[ResolutionEdge, ...]
+    path: PathNode | None
+
+    def edges(self) -> list[ResolutionEdge]:
+        """Materialize the call path from this function down to the raise site."""
+        result: list[ResolutionEdge] = []
+        node = self.path
+        while node is not None:
+            result.append(node.edge)
+            node = node.tail
+        return result
 
 
 @dataclass
@@ -71,6 +122,24 @@ class PropagationResult:
     )
 
 
+def _func_key(file: str, function: str) -> str:
+    """Build the interned ``file::function`` key for a function."""
+    return sys.intern(f"{file}::{function}")
+
+
+@lru_cache(maxsize=1 << 16)
+def _decompose(key: str) -> tuple[str, bool, str]:
+    """Split a function key into (simple name, is method, file).
+
+    Memoized in a bounded LRU, so a long-lived process such as the LSP server
+    does not keep keys of renamed or deleted functions forever. Cleared by
+    clear_propagation_cache().
+    """
+    parts = key.split("::")
+    tail = parts[-1]
+    return tail.split(".")[-1], len(parts) > 1 and "." in tail, parts[0]
+
+
 def _build_func_name_index(model: ProgramModel) -> dict[str, list[str]]:
     """Build an index from function name suffixes to qualified keys."""
     index: dict[str, list[str]] = {}
@@ -125,23 +194,105 @@ def _normalize_callee_to_file_format(
     return callee_qualified
 
 
-def build_forward_call_graph(model: ProgramModel) -> dict[str, set[str]]:
-    """Build a map from caller to callees."""
-    graph: dict[str, set[str]] = {}
-    func_index = _build_func_name_index(model)
+@dataclass
+class CallSiteTable:
+    """Call sites flattened into parallel columns, one row per CallSite.
 
+    callers holds the canonical caller key used by the forward graph, and
+    caller_names the caller as recorded (qualified name or bare function name)
+    used by the reverse graphs. callees is callee_qualified or callee_name.
+    """
+
+    callers: list[str] = field(default_factory=list)
+    caller_names: list[str] = field(default_factory=list)
+    callees: list[str] = field(default_factory=list)
+    callee_qualified: list[str | None] = field(default_factory=list)
+    callee_names: list[str] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)
+    lines: list[int] = field(default_factory=list)
+    resolution_kinds: list[ResolutionKind] = field(default_factory=list)
+    is_method: list[bool] = field(default_factory=list)
+
+
+def build_call_site_table(model: ProgramModel) -> CallSiteTable:
+    """Flatten model.call_sites into a CallSiteTable."""
+    table = CallSiteTable()
     for call_site in model.call_sites:
-        caller = call_site.caller_qualified or f"{call_site.file}::{call_site.caller_function}"
-        callee = call_site.callee_qualified or call_site.callee_name
+        table.callers.append(
+            call_site.caller_qualified or _func_key(call_site.file, call_site.caller_function)
+        )
+        table.caller_names.append(call_site.caller_qualified or call_site.caller_function)
+        table.callees.append(call_site.callee_qualified or call_site.callee_name)
+        table.callee_qualified.append(call_site.callee_qualified)
+        table.callee_names.append(call_site.callee_name)
+        table.files.append(call_site.file)
+        table.lines.append(call_site.line)
+        table.resolution_kinds.append(call_site.resolution_kind)
+        table.is_method.append(call_site.is_method_call)
+    return table
+
+
+@dataclass
+class CallGraphBundle:
+    """Every call-site derived structure, built in a single pass over call sites.
+
+    forward and the two reverse graphs are what build_forward_call_graph() and
+    build_reverse_call_graph() return. first_call_site maps (caller,
+    unnormalized callee) to the row of its first call site in table.
+    """
+
+    table: CallSiteTable = field(default_factory=CallSiteTable)
+    forward: dict[str, set[str]] = field(default_factory=dict)
+    reverse_qualified: dict[str, set[str]] = field(default_factory=dict)
+    reverse_by_name: dict[str, set[str]] = field(default_factory=dict)
+    first_call_site: dict[tuple[str, str], int] = field(default_factory=dict)
+
+
+def build_call_graph_bundle(model: ProgramModel) -> CallGraphBundle:
+    """Build the forward graph, reverse graphs and call-site index in one pass."""
+    table = build_call_site_table(model)
+    bundle = CallGraphBundle(table=table)
+    forward = bundle.forward
+    reverse_qualified = bundle.reverse_qualified
+    reverse_by_name = bundle.reverse_by_name
+    first_call_site = bundle.first_call_site
+    func_index = _build_func_name_index(model)
 
-        if call_site.callee_qualified and "::" not in call_site.callee_qualified:
-            callee = _normalize_callee_to_file_format(call_site.callee_qualified, model, func_index)
+    rows = zip(
+        table.callers,
+        table.caller_names,
+        table.callees,
+        table.callee_qualified,
+        table.callee_names,
+        strict=True,
+    )
+    for row, (caller, caller_name, callee, callee_qualified, callee_name) in enumerate(rows):
+        pair = (caller, callee)
+        if pair not in first_call_site:
+            first_call_site[pair] = row
+
+        forward_callee = callee
+        if callee_qualified and "::" not in callee_qualified:
+            forward_callee = _normalize_callee_to_file_format(callee_qualified, model, func_index)
+        if caller not in forward:
+            forward[caller] = set()
+        forward[caller].add(forward_callee)
+
+        if callee_qualified:
+            if callee_qualified not in reverse_qualified:
+                reverse_qualified[callee_qualified] = set()
+            reverse_qualified[callee_qualified].add(caller_name)
 
-        if caller not in graph:
-            graph[caller] = set()
-        graph[caller].add(callee)
+        if callee_name not in reverse_by_name:
+            reverse_by_name[callee_name] = set()
+        reverse_by_name[callee_name].add(caller_name)
 
-    return graph
+    return bundle
+
+
+def build_forward_call_graph(model: ProgramModel) -> dict[str, set[str]]:
+    """Build a map from caller to callees."""
+    return build_call_graph_bundle(model).forward
 
 
 def compute_forward_reachability(
@@ -161,17 +312,13 @@ def compute_forward_reachability(
 
     simple_to_qualified: dict[str, list[str]] = {}
     for key in forward_graph:
-        simple = key.split("::")[-1].split(".")[-1] if "::" in key else key.split(".")[-1]
+        simple = _decompose(key)[0]
         if simple not in simple_to_qualified:
             simple_to_qualified[simple] = []
         simple_to_qualified[simple].append(key)
 
     reachable: set[str] = set()
-    start_simple = (
-        start_func.split("::")[-1].split(".")[-1]
-        if "::" in start_func
-        else start_func.split(".")[-1]
-    )
+    start_simple = _decompose(start_func)[0]
     worklist = [start_func] + simple_to_qualified.get(start_simple, [])
 
     while worklist:
@@ -180,9 +327,7 @@ def compute_forward_reachability(
             continue
         reachable.add(current)
 
-        current_simple = (
-            current.split("::")[-1].split(".")[-1] if "::" in current else current.split(".")[-1]
-        )
+        current_simple = _decompose(current)[0]
         reachable.add(current_simple)
 
         callees = forward_graph.get(current, set())
@@ -205,7 +350,7 @@ def build_name_to_qualified(propagation: PropagationResult) -> dict[str, list[st
     """Build a map from simple function names to their qualified names."""
     name_to_qualified: dict[str, list[str]] = {}
     for key in propagation.propagated_raises:
-        simple = key.split("::")[-1].split(".")[-1] if "::" in key else key.split(".")[-1]
+        simple = _decompose(key)[0]
         if simple not in name_to_qualified:
             name_to_qualified[simple] = []
         name_to_qualified[simple].append(key)
@@ -216,22 +361,8 @@ def build_reverse_call_graph(
     model: ProgramModel,
 ) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
     """Build maps from callee to callers (both qualified and name-based)."""
-    qualified_graph: dict[str, set[str]] = {}
-    name_graph: dict[str, set[str]] = {}
-
-    for call_site in model.call_sites:
-        caller = call_site.caller_qualified or call_site.caller_function
-
-        if call_site.callee_qualified:
-            if call_site.callee_qualified not in qualified_graph:
-                qualified_graph[call_site.callee_qualified] = set()
-            qualified_graph[call_site.callee_qualified].add(caller)
-
-        if call_site.callee_name not in name_graph:
-            name_graph[call_site.callee_name] = set()
-        name_graph[call_site.callee_name].add(caller)
-
-    return qualified_graph, name_graph
+    bundle = build_call_graph_bundle(model)
+    return bundle.reverse_qualified, bundle.reverse_by_name
 
 
 def compute_direct_raises(model: ProgramModel) -> dict[str, set[str]]:
@@ -239,7 +370,7 @@ def compute_direct_raises(model: ProgramModel) -> dict[str, set[str]]:
     direct_raises: dict[str, set[str]] = {}
 
     for raise_site in model.raise_sites:
-        func_key = f"{raise_site.file}::{raise_site.function}"
+        func_key = _func_key(raise_site.file, raise_site.function)
         if func_key not in direct_raises:
             direct_raises[func_key] = set()
         direct_raises[func_key].add(raise_site.exception_type)
@@ -252,7 +383,7 @@ def compute_catches_by_function(model: ProgramModel) -> dict[str, list[CatchSite
     catches: dict[str, list[CatchSite]] = {}
 
     for catch_site in model.catch_sites:
-        func_key = f"{catch_site.file}::{catch_site.function}"
+        func_key = _func_key(catch_site.file, catch_site.function)
         if func_key not in catches:
             catches[func_key] = []
         catches[func_key].append(catch_site)
@@ -260,15 +391,40 @@ def compute_catches_by_function(model: ProgramModel) -> dict[str, list[CatchSite
     return catches
 
 
+def build_implementation_index(
+    method_to_qualified: dict[str, list[str]],
+) -> dict[str, dict[str, str]]:
+    """Index qualified method names by method name, then by owning class name.
+
+    The owning class is the segment immediately before the method name. When
+    several qualified names share a class name, the first one listed wins.
+    """
+    index: dict[str, dict[str, str]] = {}
+    for method_name, qualified_names in method_to_qualified.items():
+        by_class: dict[str, str] = {}
+        for qualified in qualified_names:
+            parts = qualified.split("::")[-1].split(".")
+            if len(parts) < 2:
+                continue
+            if parts[-2] not in by_class:
+                by_class[parts[-2]] = qualified
+        index[method_name] = by_class
+    return index
+
+
 def expand_polymorphic_call(
     callee: str,
     hierarchy: ClassHierarchy,
     method_to_qualified: dict[str, list[str]],
+    implementation_index: dict[str, dict[str, str]] | None = None,
 ) -> list[str]:
     """Expand a polymorphic method call to all concrete implementations.
 
     If callee is a method on an abstract class, returns qualified names of
     all concrete implementations. Otherwise returns [callee].
+
+    Pass implementation_index (from build_implementation_index) when expanding
+    many calls against the same method_to_qualified map.
     """
     if "." not in callee:
         return [callee]
@@ -290,18 +446,23 @@ def expand_polymorphic_call(
     if not implementations:
         return [callee]
 
+    if implementation_index is None:
+        implementation_index = build_implementation_index(
+            {method_name: method_to_qualified.get(method_name, [])}
+        )
+    by_class = implementation_index.get(method_name, {})
+
     result: list[str] = []
     for impl_class, _ in implementations:
-        for qualified in method_to_qualified.get(method_name, []):
-            if impl_class in qualified:
-                result.append(qualified)
-                break
-        else:
-            result.append(f"{impl_class}.{method_name}")
+        qualified = by_class.get(impl_class)
+        result.append(qualified if qualified else f"{impl_class}.{method_name}")
 
     return result if result else [callee]
 
 
+_CATCH_ALL_TYPES = frozenset({"Exception", "BaseException"})
+
+
 def exception_is_caught(
     exception_type: str,
     catch_site: CatchSite,
@@ -313,53 +474,16 @@ def exception_is_caught(
 
     exception_simple = exception_type.split(".")[-1]
 
-    for caught_type in catch_site.caught_types:
-        caught_simple = caught_type.split(".")[-1]
-
-        if exception_type == caught_type or exception_simple == caught_simple:
-            return True
-
-        if caught_simple in ("Exception", "BaseException"):
+    for caught_simple in catch_site.simple_caught_types:
+        if caught_simple in _CATCH_ALL_TYPES:
             return True
 
-        if hierarchy.is_subclass_of(exception_simple, caught_simple):
+        if exception_simple in hierarchy.descendants_of(caught_simple):
             return True
 
     return False
 
 
-def _build_call_site_lookup(
-    model: ProgramModel,
-) -> dict[tuple[str, str], list[CallSite]]:
-    """Build a lookup from (caller, callee) pairs to CallSite objects."""
-    lookup: dict[tuple[str, str], list[CallSite]] = {}
-    for cs in model.call_sites:
-        caller = cs.caller_qualified or f"{cs.file}::{cs.caller_function}"
-        callee = cs.callee_qualified or cs.callee_name
-        key = (caller, callee)
-        if key not in lookup:
-            lookup[key] = []
-        lookup[key].append(cs)
-    return lookup
-
-
-def _build_is_method_lookup(model: ProgramModel) -> dict[tuple[str, str], bool]:
-    """Build a lookup for is_method_call by (caller, callee) pairs.
-
-    This is always needed for correct fallback resolution, even when
-    skip_evidence=True. When a call is in the form obj.method(), we
-    should prefer matching methods over standalone functions.
-    """
-    lookup: dict[tuple[str, str], bool] = {}
-    for cs in model.call_sites:
-        caller = cs.caller_qualified or f"{cs.file}::{cs.caller_function}"
-        callee = cs.callee_qualified or cs.callee_name
-        key = (caller, callee)
-        if key not in lookup:
-            lookup[key] = cs.is_method_call
-    return lookup
-
-
 def _build_raise_site_lookup(
     model: ProgramModel,
 ) -> dict[tuple[str, str, int], RaiseSite]:
@@ -371,50 +495,114 @@ def _build_raise_site_lookup(
 
 
 def _create_resolution_edge(
-    call_site: CallSite,
+    table: CallSiteTable,
+    row: int,
     caller: str,
     callee: str,
     used_name_fallback: bool,
     is_polymorphic: bool,
     match_count: int = 1,
 ) -> ResolutionEdge:
-    """Create a ResolutionEdge from a CallSite."""
+    """Create a ResolutionEdge from a row of the call-site table."""
     if used_name_fallback:
         kind = ResolutionKind.NAME_FALLBACK
     elif is_polymorphic:
         kind = ResolutionKind.POLYMORPHIC
     else:
-        kind = call_site.resolution_kind
+        kind = table.resolution_kinds[row]
 
-    is_heuristic = kind in (ResolutionKind.NAME_FALLBACK, ResolutionKind.POLYMORPHIC)
+    is_heuristic = kind in HEURISTIC_RESOLUTION_KINDS
 
     return ResolutionEdge(
         caller=caller,
         callee=callee,
-        file=call_site.file,
-        line=call_site.line,
+        file=table.files[row],
+        line=table.lines[row],
         resolution_kind=kind,
         is_heuristic=is_heuristic,
         match_count=match_count,
     )
 
 
+def _exception_bits(
+    exception_types: Iterable[str],
+    exc_id: dict[str, int],
+    exc_names: list[str],
+) -> int:
+    """Encode exception types as a bitmask, assigning bit indexes to new types."""
+    bits = 0
+    for exc_type in exception_types:
+        bit = exc_id.get(exc_type)
+        if bit is None:
+            bit = len(exc_names)
+            exc_id[exc_type] = bit
+            exc_names.append(exc_type)
+        bits |= 1 << bit
+    return bits
+
+
+def _exception_names(bits: int, exc_names: list[str]) -> set[str]:
+    """Decode a bitmask built by _exception_bits back into exception type names."""
+    names: set[str] = set()
+    while bits:
+        low = bits & -bits
+        names.add(exc_names[low.bit_length() - 1])
+        bits ^= low
+    return names
+
+
 FallbackKey = tuple[str, bool]
+CallTarget = tuple[str, tuple[str, ...], bool, int]
+CallEdge = tuple[int | None, bool, tuple[CallTarget, ...]]
 FallbackCacheKey = tuple[str, bool, str]
-_fallback_cache: dict[FallbackCacheKey, tuple[list[str], str]] = {}
+
+
+def _collect_may_raise(
+    seeded: Iterable[str],
+    direct_callers: dict[str, set[str]],
+    name_callers: dict[FallbackKey, set[str]],
+) -> set[str]:
+    """Close the seeded keys over every caller that can reach them.
+
+    A caller reaches a key through a resolved call to it, or through a name
+    fallback call on its (simple name, is method) pair, whichever tier that
+    call would pick. The result covers every function that can end up with
+    propagated raises and only depends on the call graph, so fallback tiers
+    chosen from it stay fixed for the whole fixpoint.
+    """
+    may_raise = set(seeded)
+    pending = list(may_raise)
+    while pending:
+        key = pending.pop()
+        simple_name, is_method, _ = _decompose(key)
+        for caller in direct_callers.get(key, ()):
+            if caller not in may_raise:
+                may_raise.add(caller)
+                pending.append(caller)
+        for caller in name_callers.get((simple_name, is_method), ()):
+            if caller not in may_raise:
+                may_raise.add(caller)
+                pending.append(caller)
+    return may_raise
 
 
 def _scoped_fallback_lookup(
     callee_simple: str,
     is_method: bool,
     caller_file: str,
-    import_map: dict[str, str],
+    imported_modules: tuple[str, ...],
     name_to_qualified: dict[FallbackKey, list[str]],
+    fallback_cache: dict[FallbackCacheKey, tuple[list[str], str]],
 ) -> tuple[list[str], str]:
-    """Scoped fallback: same_file > direct_import > same_package > project."""
+    """Scoped fallback: same_file > direct_import > same_package > project.
+
+    imported_modules holds the distinct module targets of caller_file's imports.
+    fallback_cache is owned by a single propagation run, since its entries are
+    only valid for that run's name_to_qualified.
+    """
     cache_key: FallbackCacheKey = (callee_simple, is_method, caller_file)
-    if cache_key in _fallback_cache:
-        return _fallback_cache[cache_key]
+    if cache_key in fallback_cache:
+        return fallback_cache[cache_key]
 
     fallback_key = (callee_simple, is_method)
     candidates = name_to_qualified.get(fallback_key, [])
@@ -425,14 +613,13 @@ def _scoped_fallback_lookup(
     same_file = [c for c in candidates if c.startswith(f"{caller_file}::")]
     if same_file:
         result = (same_file, "same_file")
-        _fallback_cache[cache_key] = result
+        fallback_cache[cache_key] = result
         return result
 
-    imported_modules = set(import_map.values())
-    direct_imports = [c for c in candidates if any(c.startswith(mod) for mod in imported_modules)]
+    direct_imports = [c for c in candidates if c.startswith(imported_modules)]
     if direct_imports:
         result = (direct_imports, "direct_import")
-        _fallback_cache[cache_key] = result
+        fallback_cache[cache_key] = result
         return result
 
     caller_dir = "/".join(caller_file.split("/")[:-1]) if "/" in caller_file else ""
@@ -440,14 +627,303 @@ def _scoped_fallback_lookup(
         same_package = [c for c in candidates if c.split("::")[0].startswith(caller_dir + "/")]
         if same_package:
             result = (same_package, "same_package")
-            _fallback_cache[cache_key] = result
+            fallback_cache[cache_key] = result
             return result
 
     result = (candidates, "project")
-    _fallback_cache[cache_key] = result
+    fallback_cache[cache_key] = result
     return result
 
 
+def _run_fixpoint(
+    model: ProgramModel,
+    *,
+    forward_graph: dict[str, set[str]],
+    call_graphs: CallGraphBundle,
+    effective_catches: dict[str, list[CatchSite]],
+    imported_modules_by_file: dict[str, tuple[str, ...]],
+    propagated_bits: dict[str, int],
+    propagated_evidence: dict[str, dict[tuple[str, str, int], PropagatedRaise]],
+    exc_id: dict[str, int],
+    exc_names: list[str],
+    resolution_mode: ResolutionMode,
+    stub_library: StubLibrary | None,
+    skip_evidence: bool,
+    max_iterations: int,
+) -> None:
+    """Run the propagation fixpoint over seeded exception bitsets.
+
+    Resolves every call up front to a (call-site row, is polymorphic, targets)
+    edge, where each target lists the keys whose raises flow through it plus
+    any stub raises. A callee falls back to name matching only when it can
+    never hold raises itself, and the fallback tiers are picked among the
+    functions that may raise, so each target's sources stay fixed and the
+    result does not depend on the order callers are visited in. A caller is
+    never its own fallback match, and its calls to its own name do not count
+    toward it possibly raising, so same-named methods that only call each
+    other (super().__init__()) cannot shadow a tier that does raise. Then grows
+    propagated_bits and propagated_evidence in place until no caller changes.
+    Inputs are the plain dicts, lists and ints prepared by
+    propagate_exceptions().
+    """
+    from bubble import timing
+
+    table = call_graphs.table
+    first_call_site = call_graphs.first_call_site
+    callers_with_catches = frozenset(effective_catches)
+    strict = resolution_mode == ResolutionMode.STRICT
+
+    method_to_qualified: dict[str, list[str]] = {}
+    for qualified_key in propagated_bits:
+        if "::" in qualified_key:
+            simple_name = _decompose(qualified_key)[0]
+            if simple_name not in method_to_qualified:
+                method_to_qualified[simple_name] = []
+            method_to_qualified[simple_name].append(qualified_key)
+
+    implementation_index = build_implementation_index(method_to_qualified)
+    resolvable = set(forward_graph).union(propagated_bits)
+
+    with timing.timed("propagation_fixpoint"):
+        record_counters = timing.is_enabled()
+        iteration_count = 0
+        total_fallback_lookups = 0
+        total_catch_checks = 0
+        total_propagations = 0
+
+        expand_cache: dict[str, tuple[str, ...]] = {}
+        stub_bits_by_callee: dict[str, int] = {}
+        expanded_edges: dict[str, list[tuple[int | None, bool, tuple[str, ...]]]] = {}
+        direct_callers: dict[str, set[str]] = {}
+        name_callers: dict[FallbackKey, set[str]] = {}
+        stub_callers: list[str] = []
+        for caller, callees in forward_graph.items():
+            edges: list[tuple[int | None, bool, tuple[str, ...]]] = []
+            for callee in callees:
+                expanded_callees = expand_cache.get(callee)
+                if expanded_callees is None:
+                    expanded_callees = tuple(
+                        expand_polymorphic_call(
+                            callee,
+                            model.exception_hierarchy,
+                            method_to_qualified,
+                            implementation_index,
+                        )
+                    )
+                    expand_cache[callee] = expanded_callees
+                is_polymorphic = len(expanded_callees) > 1
+                if strict and is_polymorphic:
+                    continue
+                call_site_row = first_call_site.get((caller, callee))
+                edges.append((call_site_row, is_polymorphic, expanded_callees))
+                is_method = table.is_method[call_site_row] if call_site_row is not None else False
+                for expanded_callee in expanded_callees:
+                    if expanded_callee in resolvable:
+                        if expanded_callee not in direct_callers:
+                            direct_callers[expanded_callee] = set()
+                        direct_callers[expanded_callee].add(caller)
+                        continue
+                    lookup_key: FallbackKey = (_decompose(expanded_callee)[0], is_method)
+                    if not strict and lookup_key != _decompose(caller)[:2]:
+                        if lookup_key not in name_callers:
+                            name_callers[lookup_key] = set()
+                        name_callers[lookup_key].add(caller)
+                    if expanded_callee not in stub_bits_by_callee:
+                        stub_bits = 0
+                        callee_parts = expanded_callee.split(".")
+                        if stub_library and len(callee_parts) >= 2:
+                            stub_exceptions = stub_library.get_raises(
+                                callee_parts[0], callee_parts[-1]
+                            )
+                            if stub_exceptions:
+                                stub_bits = _exception_bits(stub_exceptions, exc_id, exc_names)
+                        stub_bits_by_callee[expanded_callee] = stub_bits
+                    if stub_bits_by_callee[expanded_callee]:
+                        stub_callers.append(caller)
+            expanded_edges[caller] = edges
+
+        may_raise = _collect_may_raise(
+            [*propagated_bits, *stub_callers], direct_callers, name_callers
+        )
+        name_to_qualified: dict[FallbackKey, list[str]] = {}
+        for qualified_key in dict.fromkeys([*propagated_bits, *forward_graph]):
+            if qualified_key not in may_raise:
+                continue
+            simple_name, is_method, _ = _decompose(qualified_key)
+            fallback_key: FallbackKey = (simple_name, is_method)
+            if fallback_key not in name_to_qualified:
+                name_to_qualified[fallback_key] = []
+            name_to_qualified[fallback_key].append(qualified_key)
+
+        dependents: dict[str, set[str]] = {}
+        fallback_cache: dict[FallbackCacheKey, tuple[list[str], str]] = {}
+        call_edges: dict[str, list[CallEdge]] = {}
+        for caller, edges in expanded_edges.items():
+            caller_file = _decompose(caller)[2]
+            imported_modules = imported_modules_by_file.get(caller_file, ())
+            resolved_edges: list[CallEdge] = []
+            for call_site_row, is_polymorphic, expanded_callees in edges:
+                is_method = table.is_method[call_site_row] if call_site_row is not None else False
+                targets: list[CallTarget] = []
+                for expanded_callee in expanded_callees:
+                    if expanded_callee in resolvable:
+                        targets.append((expanded_callee, (expanded_callee,), False, 0))
+                    else:
+                        if record_counters:
+                            total_fallback_lookups += 1
+                        lookup_key = (_decompose(expanded_callee)[0], is_method)
+                        matched_keys, _ = _scoped_fallback_lookup(
+                            *lookup_key,
+                            caller_file,
+                            imported_modules,
+                            name_to_qualified,
+                            fallback_cache,
+                        )
+                        if caller in matched_keys:
+                            others = [key for key in name_to_qualified[lookup_key] if key != caller]
+                            matched_keys, _ = _scoped_fallback_lookup(
+                                *lookup_key,
+                                caller_file,
+                                imported_modules,
+                                {lookup_key: others},
+                                {},
+                            )
+                        if matched_keys:
+                            if strict:
+                                continue
+                            targets.append((expanded_callee, tuple(matched_keys), True, 0))
+                        elif stub_bits_by_callee[expanded_callee]:
+                            targets.append(
+                                (expanded_callee, (), False, stub_bits_by_callee[expanded_callee])
+                            )
+                        else:
+                            continue
+                    for source in targets[-1][1]:
+                        if source not in dependents:
+                            dependents[source] = set()
+                        dependents[source].add(caller)
+                if targets:
+                    resolved_edges.append((call_site_row, is_polymorphic, tuple(targets)))
+            call_edges[caller] = resolved_edges
+
+        sweep_callers = list(forward_graph)
+        sweep_position = {caller: position for position, caller in enumerate(sweep_callers)}
+        catch_checked_bits = dict.fromkeys(callers_with_catches, 0)
+        caught_bits = dict.fromkeys(callers_with_catches, 0)
+        worklist = list(range(len(sweep_callers)))
+        queued = set(sweep_callers)
+        next_sweep: set[str] = set()
+
+        def schedule(targets: set[str], current_position: int) -> None:
+            for target in targets:
+                target_position = sweep_position.get(target)
+                if target_position is None:
+                    continue
+                if target_position <= current_position:
+                    next_sweep.add(target)
+                elif target not in queued:
+                    queued.add(target)
+                    heapq.heappush(worklist, target_position)
+
+        for _ in range(max_iterations):
+            iteration_count += 1
+            changed = False
+
+            while worklist:
+                position = heapq.heappop(worklist)
+                caller = sweep_callers[position]
+                queued.discard(caller)
+                caller_grew = False
+
+                if caller not in propagated_bits:
+                    propagated_bits[caller] = 0
+                if not skip_evidence and caller not in propagated_evidence:
+                    propagated_evidence[caller] = {}
+
+                for call_site_row, is_polymorphic, call_targets in call_edges[caller]:
+                    for expanded_callee, sources, used_name_fallback, stub_bits in call_targets:
+                        callee_bits = stub_bits
+                        for source in sources:
+                            callee_bits |= propagated_bits.get(source, 0)
+                        if not callee_bits:
+                            continue
+
+                        uncaught_bits = callee_bits
+                        if caller in callers_with_catches:
+                            unchecked_bits = callee_bits & ~catch_checked_bits[caller]
+                            if unchecked_bits:
+                                catch_checked_bits[caller] |= unchecked_bits
+                                while unchecked_bits:
+                                    exc_bit = unchecked_bits & -unchecked_bits
+                                    unchecked_bits ^= exc_bit
+                                    exc_type = exc_names[exc_bit.bit_length() - 1]
+                                    for catch_site in effective_catches[caller]:
+                                        if record_counters:
+                                            total_catch_checks += 1
+                                        if exception_is_caught(
+                                            exc_type, catch_site, model.exception_hierarchy
+                                        ):
+                                            caught_bits[caller] |= exc_bit
+                                            break
+                            uncaught_bits &= ~caught_bits[caller]
+
+                        new_bits = uncaught_bits & ~propagated_bits[caller]
+                        if new_bits:
+                            propagated_bits[caller] |= new_bits
+                            if record_counters:
+                                total_propagations += new_bits.bit_count()
+                            changed = True
+                            caller_grew = True
+
+                        if skip_evidence or call_site_row is None or not uncaught_bits:
+                            continue
+                        callee_evidence: dict[tuple[str, str, int], PropagatedRaise] = {}
+                        if len(sources) == 1:
+                            callee_evidence = propagated_evidence.get(sources[0], callee_evidence)
+                        else:
+                            for source in sources:
+                                callee_evidence.update(propagated_evidence.get(source, {}))
+                        caller_evidence = propagated_evidence[caller]
+                        for key, prop_raise in callee_evidence.items():
+                            if not uncaught_bits >> exc_id[key[0]] & 1:
+                                continue
+                            if key in caller_evidence:
+                                continue
+                            edge = _create_resolution_edge(
+                                table,
+                                call_site_row,
+                                caller,
+                                expanded_callee,
+                                used_name_fallback,
+                                is_polymorphic,
+                                len(sources) if used_name_fallback else 1,
+                            )
+                            caller_evidence[key] = PropagatedRaise(
+                                exception_type=key[0],
+                                raise_site=prop_raise.raise_site,
+                                path=PathNode(edge, prop_raise.path),
+                            )
+                            caller_grew = True
+
+                if caller_grew:
+                    schedule(dependents.get(caller, set()), position)
+
+            if not changed or not next_sweep:
+                break
+            worklist = sorted(sweep_position[caller] for caller in next_sweep)
+            queued = next_sweep
+            next_sweep = set()
+
+        if record_counters:
+            timing.record_count("propagation_iterations", iteration_count)
+            timing.record_count("propagation_fallback_lookups", total_fallback_lookups)
+            timing.record_count("propagation_fallback_cache_entries", len(fallback_cache))
+            timing.record_count("propagation_catch_checks", total_catch_checks)
+            timing.record_count("propagation_new_exceptions", total_propagations)
+            timing.record_count("propagation_call_graph_size", len(forward_graph))
+            timing.record_count("propagation_functions_with_raises", len(propagated_bits))
+
+
 def propagate_exceptions(
     model: ProgramModel,
     max_iterations: int = 100,
@@ -475,224 +951,80 @@ def propagate_exceptions(
     """
     from bubble import timing
 
-    if scope is not None:
-        cache_key = None
-    else:
+    cache_key: PropagationCacheKey | None = None
+    if scope is None:
         cache_key = (
             id(model),
             resolution_mode,
             id(stub_library) if stub_library else None,
             skip_evidence,
         )
-
         if cache_key in _propagation_cache:
             return _propagation_cache[cache_key]
 
     with timing.timed("propagation_setup"):
-        direct_raises = compute_direct_raises(model)
         catches_by_function = compute_catches_by_function(model)
-        full_forward_graph = build_forward_call_graph(model)
+        effective_catches: dict[str, list[CatchSite]] = {}
+        for func, catch_sites in catches_by_function.items():
+            non_reraising = [site for site in catch_sites if not site.has_reraise]
+            if non_reraising:
+                effective_catches[func] = non_reraising
+        call_graphs = build_call_graph_bundle(model)
+        full_forward_graph = call_graphs.forward
 
         if scope is not None:
             forward_graph = {}
             for caller, callees in full_forward_graph.items():
-                caller_simple = (
-                    caller.split("::")[-1].split(".")[-1]
-                    if "::" in caller
-                    else caller.split(".")[-1]
-                )
+                caller_simple = _decompose(caller)[0]
                 if caller in scope or caller_simple in scope:
                     forward_graph[caller] = callees
         else:
             forward_graph = full_forward_graph
 
-        call_site_lookup = _build_call_site_lookup(model) if not skip_evidence else {}
-        is_method_lookup = _build_is_method_lookup(model)
+        imported_modules_by_file = {
+            file: tuple(dict.fromkeys(import_map.values()))
+            for file, import_map in model.import_maps.items()
+        }
 
-    propagated: dict[str, set[str]] = {}
+    exc_id: dict[str, int] = {}
+    exc_names: list[str] = []
+    propagated_bits: dict[str, int] = {}
     propagated_evidence: dict[str, dict[tuple[str, str, int], PropagatedRaise]] = {}
 
-    for func, raises in direct_raises.items():
-        propagated[func] = raises.copy()
-        if skip_evidence:
-            continue
-        propagated_evidence[func] = {}
-        for exc_type in raises:
-            for rs in model.raise_sites:
-                if f"{rs.file}::{rs.function}" == func and rs.exception_type == exc_type:
-                    key = (exc_type, rs.file, rs.line)
-                    propagated_evidence[func][key] = PropagatedRaise(
-                        exception_type=exc_type,
-                        raise_site=rs,
-                        path=(),
-                    )
-
-    name_to_qualified: dict[FallbackKey, list[str]] = {}
-    method_to_qualified: dict[str, list[str]] = {}
-    for qualified_key in propagated:
-        simple_name = qualified_key.split("::")[-1].split(".")[-1]
-        is_method = "." in qualified_key.split("::")[-1] if "::" in qualified_key else False
-        fallback_key: FallbackKey = (simple_name, is_method)
-        if fallback_key not in name_to_qualified:
-            name_to_qualified[fallback_key] = []
-        name_to_qualified[fallback_key].append(qualified_key)
-
-        if "::" in qualified_key:
-            method_name = qualified_key.split("::")[-1].split(".")[-1]
-            if method_name not in method_to_qualified:
-                method_to_qualified[method_name] = []
-            method_to_qualified[method_name].append(qualified_key)
-
-    with timing.timed("propagation_fixpoint"):
-        iteration_count = 0
-        total_fallback_lookups = 0
-        total_catch_checks = 0
-        total_propagations = 0
-
-        for _ in range(max_iterations):
-            iteration_count += 1
-            changed = False
-
-            for caller, callees in forward_graph.items():
-                if caller not in propagated:
-                    propagated[caller] = set()
-                if not skip_evidence and caller not in propagated_evidence:
-                    propagated_evidence[caller] = {}
-
-                for callee in callees:
-                    call_sites = (
-                        call_site_lookup.get((caller, callee), []) if not skip_evidence else []
-                    )
-                    call_site = call_sites[0] if call_sites else None
-                    expanded_callees = expand_polymorphic_call(
-                        callee, model.exception_hierarchy, method_to_qualified
-                    )
-                    is_polymorphic = len(expanded_callees) > 1
-
-                    for expanded_callee in expanded_callees:
-                        used_name_fallback = False
-                        fallback_match_count = 1
-                        callee_exceptions = propagated.get(expanded_callee, set())
-                        callee_evidence = (
-                            propagated_evidence.get(expanded_callee, {})
-                            if not skip_evidence
-                            else {}
-                        )
-
-                        if not callee_exceptions:
-                            callee_simple = (
-                                expanded_callee.split("::")[-1].split(".")[-1]
-                                if "::" in expanded_callee
-                                else expanded_callee.split(".")[-1]
-                            )
-                            is_method = is_method_lookup.get((caller, callee), False)
-                            caller_file = caller.split("::")[0] if "::" in caller else caller
-                            import_map = model.import_maps.get(caller_file, {})
-
-                            total_fallback_lookups += 1
-                            matched_keys, _ = _scoped_fallback_lookup(
-                                callee_simple,
-                                is_method,
-                                caller_file,
-                                import_map,
-                                name_to_qualified,
-                            )
-                            fallback_match_count = len(matched_keys) if matched_keys else 1
-
-                            for qualified_key in matched_keys:
-                                callee_exceptions = callee_exceptions | propagated.get(
-                                    qualified_key, set()
-                                )
-                                callee_evidence = {
-                                    **callee_evidence,
-                                    **propagated_evidence.get(qualified_key, {}),
-                                }
-                                if callee_exceptions:
-                                    used_name_fallback = True
-
-                        if stub_library and not callee_exceptions:
-                            callee_parts = expanded_callee.split(".")
-                            if len(callee_parts) >= 2:
-                                module = callee_parts[0]
-                                func = callee_parts[-1]
-                                stub_exceptions = stub_library.get_raises(module, func)
-                                if stub_exceptions:
-                                    callee_exceptions = set(stub_exceptions)
-
-                        if resolution_mode == ResolutionMode.STRICT and (
-                            used_name_fallback or is_polymorphic
-                        ):
-                            continue
-
-                        for exc_type in callee_exceptions:
-                            catches = catches_by_function.get(caller, [])
-                            is_caught = False
-
-                            for catch_site in catches:
-                                total_catch_checks += 1
-                                if exception_is_caught(
-                                    exc_type, catch_site, model.exception_hierarchy
-                                ):
-                                    if not catch_site.has_reraise:
-                                        is_caught = True
-                                        break
-
-                            if not is_caught and exc_type not in propagated[caller]:
-                                propagated[caller].add(exc_type)
-                                total_propagations += 1
-                                changed = True
-
-                                caller_simple = (
-                                    caller.split("::")[-1].split(".")[-1]
-                                    if "::" in caller
-                                    else caller
-                                )
-                                caller_is_method = (
-                                    "." in caller.split("::")[-1] if "::" in caller else False
-                                )
-                                caller_fallback_key: FallbackKey = (
-                                    caller_simple,
-                                    caller_is_method,
-                                )
-                                if caller_fallback_key not in name_to_qualified:
-                                    name_to_qualified[caller_fallback_key] = []
-                                if caller not in name_to_qualified[caller_fallback_key]:
-                                    name_to_qualified[caller_fallback_key].append(caller)
-
-                            if not is_caught and not skip_evidence:
-                                for key, prop_raise in callee_evidence.items():
-                                    if key[0] != exc_type:
-                                        continue
-                                    if key in propagated_evidence[caller]:
-                                        continue
-                                    if call_site is None:
-                                        continue
-                                    edge = _create_resolution_edge(
-                                        call_site,
-                                        caller,
-                                        expanded_callee,
-                                        used_name_fallback,
-                                        is_polymorphic,
-                                        fallback_match_count,
-                                    )
-                                    new_path = (edge,) + prop_raise.path
-                                    propagated_evidence[caller][key] = PropagatedRaise(
-                                        exception_type=exc_type,
-                                        raise_site=prop_raise.raise_site,
-                                        path=new_path,
-                                    )
-
-            if not changed:
-                break
+    direct_raises: dict[str, set[str]] = {}
+    for rs in model.raise_sites:
+        func = _func_key(rs.file, rs.function)
+        if func not in direct_raises:
+            direct_raises[func] = set()
+            propagated_bits[func] = 0
+            if not skip_evidence:
+                propagated_evidence[func] = {}
+        direct_raises[func].add(rs.exception_type)
+        propagated_bits[func] |= _exception_bits((rs.exception_type,), exc_id, exc_names)
+        if not skip_evidence:
+            propagated_evidence[func][(rs.exception_type, rs.file, rs.line)] = PropagatedRaise(
+                exception_type=rs.exception_type,
+                raise_site=rs,
+                path=None,
+            )
 
-        if timing.is_enabled():
-            timing.record_count("propagation_iterations", iteration_count)
-            timing.record_count("propagation_fallback_lookups", total_fallback_lookups)
-            timing.record_count("propagation_catch_checks", total_catch_checks)
-            timing.record_count("propagation_new_exceptions", total_propagations)
-            timing.record_count("propagation_call_graph_size", len(forward_graph))
-            timing.record_count("propagation_functions_with_raises", len(propagated))
+    _run_fixpoint(
+        model,
+        forward_graph=forward_graph,
+        call_graphs=call_graphs,
+        effective_catches=effective_catches,
+        imported_modules_by_file=imported_modules_by_file,
+        propagated_bits=propagated_bits,
+        propagated_evidence=propagated_evidence,
+        exc_id=exc_id,
+        exc_names=exc_names,
+        resolution_mode=resolution_mode,
+        stub_library=stub_library,
+        skip_evidence=skip_evidence,
+        max_iterations=max_iterations,
+    )
 
+    propagated = {func: _exception_names(bits, exc_names) for func, bits in propagated_bits.items()}
     result = PropagationResult(
         direct_raises=direct_raises,
         propagated_raises=propagated,
@@ -701,6 +1033,9 @@ def propagate_exceptions(
     )
 
     if cache_key is not None:
+        _track_cache_owner(model)
+        if stub_library:
+            _track_cache_owner(stub_library)
         _propagation_cache[cache_key] = result
     return result
 
@@ -711,8 +1046,11 @@ def clear_propagation_cache() -> None:
     Call this when memory management is needed or in tests to ensure
     fresh propagation results.
     """
+    for finalizer in _cache_finalizers.values():
+        finalizer.detach()
+    _cache_finalizers.clear()
     _propagation_cache.clear()
-    _fallback_cache.clear()
+    _decompose.cache_clear()
 
 
 def compute_reachable_functions(
@@ -733,54 +1071,57 @@ def compute_reachable_functions(
     if name_to_qualified is None:
         name_to_qualified = {}
         for key in propagation.propagated_raises:
-            simple = key.split("::")[-1].split(".")[-1] if "::" in key else key.split(".")[-1]
+            simple = _decompose(key)[0]
             if simple not in name_to_qualified:
                 name_to_qualified[simple] = []
             name_to_qualified[simple].append(key)
 
-    simple_to_qualified_graph: dict[str, list[str]] = {}
-    for key in forward_graph:
-        simple = key.split("::")[-1].split(".")[-1] if "::" in key else key.split(".")[-1]
-        if simple not in simple_to_qualified_graph:
-            simple_to_qualified_graph[simple] = []
-        simple_to_qualified_graph[simple].append(key)
-
+    simple_to_qualified_graph: dict[str, list[str]] | None = None
     reachable: set[str] = set()
-    worklist = [start_func]
+    enqueued: set[str] = {start_func}
+    worklist: deque[str] = deque([start_func])
+    expand_cache: dict[str, tuple[str, ...]] = {}
 
     while worklist:
-        current = worklist.pop()
-        if current in reachable:
-            continue
+        current = worklist.popleft()
         reachable.add(current)
 
-        current_simple = (
-            current.split("::")[-1].split(".")[-1] if "::" in current else current.split(".")[-1]
-        )
+        current_simple = _decompose(current)[0]
         reachable.add(current_simple)
 
         callees = forward_graph.get(current, set())
         if not callees:
+            if simple_to_qualified_graph is None:
+                simple_to_qualified_graph = {}
+                for key in forward_graph:
+                    simple = _decompose(key)[0]
+                    if simple not in simple_to_qualified_graph:
+                        simple_to_qualified_graph[simple] = []
+                    simple_to_qualified_graph[simple].append(key)
             for qualified_key in simple_to_qualified_graph.get(current_simple, []):
                 callees = forward_graph.get(qualified_key, set())
                 if callees:
                     break
 
         for callee in callees:
-            expanded = expand_polymorphic_call(
-                callee,
-                model.exception_hierarchy,
-                name_to_qualified,
-            )
+            expanded = expand_cache.get(callee)
+            if expanded is None:
+                expanded = tuple(
+                    expand_polymorphic_call(
+                        callee,
+                        model.exception_hierarchy,
+                        name_to_qualified,
+                    )
+                )
+                expand_cache[callee] = expanded
 
             for impl in expanded:
-                if impl not in reachable:
+                if impl not in enqueued:
+                    enqueued.add(impl)
                     worklist.append(impl)
-                impl_simple = (
-                    impl.split("::")[-1].split(".")[-1] if "::" in impl else impl.split(".")[-1]
-                )
-                for qualified in name_to_qualified.get(impl_simple, []):
-                    if qualified not in reachable:
+                for qualified in name_to_qualified.get(_decompose(impl)[0], []):
+                    if qualified not in enqueued:
+                        enqueued.add(qualified)
                         worklist.append(qualified)
 
     return reachable
@@ -854,11 +1195,12 @@ def compute_exception_flow(
         evidence_list: list[ExceptionEvidence] = []
         for key, prop_raise in func_evidence.items():
             if key[0] == exc_type:
+                call_path = prop_raise.edges()
                 evidence_list.append(
                     ExceptionEvidence(
                         raise_site=prop_raise.raise_site,
-                        call_path=list(prop_raise.path),
-                        confidence=compute_confidence(list(prop_raise.path)),
+                        call_path=call_path,
+                        confidence=compute_confidence(call_path),
                     )
                 )
 
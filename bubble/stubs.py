@@ -1,89 +1,259 @@
 """Exception stubs for external libraries."""
 
+import os
+import sys
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, cast
 
+import msgpack  # type: ignore[import-untyped]
 import yaml
 
+from bubble import __version__
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+STUB_CACHE_FILENAME = "stubs.msgpack"
+
+_STUB_CACHE_FORMAT = 2
+
+_BUILTIN_STUB_DIR = os.path.join(os.path.dirname(__file__), "stubs")
+
+_builtin_yaml_files: dict[int, list[str]] = {}
+
+StubRow = tuple[str, str, list[str]]
+
 
 @dataclass
 class StubLibrary:
     """Collection of exception stubs for external libraries."""
 
-    stubs: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+    stubs: dict[tuple[str, str], tuple[str, ...]] = field(default_factory=dict)
+    errors: dict[str, list[str]] = field(default_factory=dict)
 
-    def get_raises(self, module: str, function: str) -> list[str]:
+    def get_raises(self, module: str, function: str) -> tuple[str, ...]:
         """Get exceptions that a function can raise."""
-        module_stubs = self.stubs.get(module, {})
-        return module_stubs.get(function, [])
+        return self.stubs.get((module, function), ())
 
     def add_stub(self, module: str, function: str, exceptions: list[str]) -> None:
-        """Add a stub for a function."""
-        if module not in self.stubs:
-            self.stubs[module] = {}
-        self.stubs[module][function] = exceptions
+        """Add a stub for a function, interning its names."""
+        self.stubs[(sys.intern(module), sys.intern(function))] = tuple(
+            sys.intern(exc) for exc in exceptions
+        )
 
+    def modules(self) -> set[str]:
+        """Get the modules that have at least one stub."""
+        return {module for module, _ in self.stubs}
 
-def _load_stub_file(library: StubLibrary, yaml_file: Path) -> None:
-    """Load stubs from a YAML file into the library."""
-    with open(yaml_file) as f:
-        data = yaml.safe_load(f)
 
+def _parse_stub(content: bytes) -> Any:
+    """Parse one stub document."""
+    return yaml.load(content, Loader=YamlLoader)
+
+
+def _ingest_stub(library: StubLibrary, data: Any, default_module: str) -> None:
+    """Add the stubs of a parsed stub document to the library."""
     if not data:
         return
 
-    module = data.get("module", yaml_file.stem)
+    module = data.get("module", default_module)
     functions = data.get("functions", {})
 
     for func_name, exceptions in functions.items():
         if isinstance(exceptions, list):
-            library.add_stub(module, func_name, exceptions)
+            library.add_stub(module, func_name, [exc for exc in exceptions if isinstance(exc, str)])
+
+
+def _list_yaml_files(stub_dir: str) -> list[str]:
+    """List the *.yaml files in a directory, sorted, or none if it does not exist."""
+    try:
+        with os.scandir(stub_dir) as entries:
+            return sorted(
+                entry.path for entry in entries if entry.name.endswith(".yaml") and entry.is_file()
+            )
+    except OSError:
+        return []
+
+
+def _builtin_stub_files() -> list[str]:
+    """List the built-in stub files, re-scanning only when the directory changes."""
+    try:
+        mtime = os.stat(_BUILTIN_STUB_DIR).st_mtime_ns
+    except OSError:
+        return []
+
+    if mtime not in _builtin_yaml_files:
+        _builtin_yaml_files.clear()
+        _builtin_yaml_files[mtime] = _list_yaml_files(_BUILTIN_STUB_DIR)
+    return _builtin_yaml_files[mtime]
+
+
+def _stub_cache_key(yaml_files: list[str]) -> list[Any] | None:
+    """Fingerprint stub files by path, mtime and size, in load order.
+
+    Returns None if any file cannot be stat'ed.
+    """
+    fingerprints: list[list[Any]] = []
+    for yaml_file in yaml_files:
+        try:
+            stat = os.stat(yaml_file)
+        except OSError:
+            return None
+        fingerprints.append([yaml_file, stat.st_mtime_ns, stat.st_size])
+    return [__version__, _STUB_CACHE_FORMAT, fingerprints]
+
+
+def _decode_stub_row(row: object) -> StubRow | None:
+    """Type-check one cached [module, function, exceptions] row, or return None."""
+    if not isinstance(row, list):
+        return None
+    fields = cast(list[object], row)
+    if len(fields) != 3:
+        return None
+    module, function, exceptions = fields
+    if not isinstance(module, str) or not isinstance(function, str):
+        return None
+    if not isinstance(exceptions, list):
+        return None
+    names = cast(list[object], exceptions)
+    if not all(isinstance(name, str) for name in names):
+        return None
+    return module, function, cast(list[str], names)
+
+
+def _read_stub_cache(cache_path: Path, key: list[Any]) -> list[StubRow] | None:
+    """Return the cached stub rows if they were written for exactly this key.
+
+    A missing, unreadable or malformed cache returns None, so the stub files
+    are parsed instead.
+    """
+    try:
+        raw = cast(object, msgpack.unpackb(cache_path.read_bytes()))  # pyright: ignore[reportUnknownMemberType]
+        if not isinstance(raw, dict):
+            return None
+        payload = cast(dict[object, object], raw)
+        rows = payload.get("stubs")
+    except (OSError, ValueError, TypeError):
+        return None
 
+    if payload.get("key") != key or not isinstance(rows, list):
+        return None
+    decoded: list[StubRow] = []
+    for row in cast(list[object], rows):
+        stub_row = _decode_stub_row(row)
+        if stub_row is None:
+            return None
+        decoded.append(stub_row)
+    return decoded
 
-def load_stubs(directory: Path) -> StubLibrary:
-    """Load all stub files from built-in and user directories."""
+
+def _write_stub_cache(
+    cache_path: Path, key: list[Any], stubs: dict[tuple[str, str], tuple[str, ...]]
+) -> None:
+    """Write the stub cache atomically into an existing .flow directory.
+
+    Nothing is written if the directory is missing or not writable. Each writer
+    uses its own temporary file, so concurrent writers never share one.
+    """
+    if not cache_path.parent.is_dir():
+        return
+    rows = [
+        [module, function, list(exceptions)] for (module, function), exceptions in stubs.items()
+    ]
+    try:
+        tmp = tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False)
+    except OSError:
+        return
+    try:
+        with tmp:
+            tmp.write(cast(bytes, msgpack.packb({"key": key, "stubs": rows})))  # pyright: ignore[reportUnknownMemberType]
+        os.replace(tmp.name, cache_path)
+    except OSError:
+        Path(tmp.name).unlink(missing_ok=True)
+
+
+def load_stubs(directory: Path, use_cache: bool = False, validate: bool = False) -> StubLibrary:
+    """Load all stub files from built-in and user directories.
+
+    With use_cache, the parsed stubs are stored in .flow/stubs.msgpack and
+    reused until a stub file is added, removed or modified. The cache is only
+    written when the project already has a .flow directory.
+
+    With validate, each file is validated from the same parse that loads it:
+    library.errors maps every stub file to its errors, and invalid files are
+    not loaded. Validation always reads the stub files, bypassing the cache.
+    """
     library = StubLibrary()
 
-    builtin_dir = Path(__file__).parent / "stubs"
     user_dir = directory / ".flow" / "stubs"
+    yaml_files = _builtin_stub_files() + _list_yaml_files(str(user_dir))
 
-    for stub_dir in [builtin_dir, user_dir]:
-        if stub_dir.exists():
-            for yaml_file in stub_dir.glob("*.yaml"):
-                _load_stub_file(library, yaml_file)
+    cache_key = _stub_cache_key(yaml_files) if use_cache and not validate else None
+    cache_path = directory / ".flow" / STUB_CACHE_FILENAME
+    if cache_key is not None:
+        cached = _read_stub_cache(cache_path, cache_key)
+        if cached is not None:
+            for module, func_name, exceptions in cached:
+                library.add_stub(module, func_name, exceptions)
+            return library
 
-    return library
+    for yaml_file in yaml_files:
+        with open(yaml_file, "rb") as f:
+            content = f.read()
+        if validate:
+            try:
+                data = _parse_stub(content)
+            except yaml.YAMLError as e:
+                library.errors[yaml_file] = [f"YAML syntax error: {e}"]
+                continue
+            library.errors[yaml_file] = _validate_stub_data(data)
+            if library.errors[yaml_file]:
+                continue
+        else:
+            data = _parse_stub(content)
+        _ingest_stub(library, data, Path(yaml_file).stem)
 
+    if cache_key is not None:
+        _write_stub_cache(cache_path, cache_key, library.stubs)
 
-def validate_stub_file(yaml_file: Path) -> list[str]:
-    """Validate a stub file and return any errors."""
-    errors: list[str] = []
+    return library
 
-    try:
-        with open(yaml_file) as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        errors.append(f"YAML syntax error: {e}")
-        return errors
 
+def _validate_stub_data(data: Any) -> list[str]:
+    """Validate a parsed stub document and return any errors."""
     if not isinstance(data, dict):
-        errors.append("Root must be a dictionary")
-        return errors
+        return ["Root must be a dictionary"]
 
+    errors: list[str] = []
     if "module" not in data:
         errors.append("Missing 'module' key")
 
+    functions: Any = data.get("functions")
     if "functions" not in data:
         errors.append("Missing 'functions' key")
-    elif not isinstance(data["functions"], dict):
+    elif not isinstance(functions, dict):
         errors.append("'functions' must be a dictionary")
     else:
-        for func_name, exceptions in data["functions"].items():
+        for func_name, exceptions in functions.items():
             if not isinstance(exceptions, list):
                 errors.append(f"'{func_name}' must map to a list of exceptions")
-            else:
-                for exc in exceptions:
-                    if not isinstance(exc, str):
-                        errors.append(f"Exception in '{func_name}' must be a string")
+                continue
+            non_strings = sum(not isinstance(exc, str) for exc in exceptions)
+            errors.extend([f"Exception in '{func_name}' must be a string"] * non_strings)
 
     return errors
+
+
+def validate_stub_file(yaml_file: Path) -> list[str]:
+    """Validate a stub file and return any errors."""
+    try:
+        with open(yaml_file, "rb") as f:
+            data = _parse_stub(f.read())
+    except yaml.YAMLError as e:
+        return [f"YAML syntax error: {e}"]
+
+    return _validate_stub_data(data)
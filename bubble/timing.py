@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import atexit
 import time
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -13,31 +13,44 @@ if TYPE_CHECKING:
     from rich.console import Console
 
 
+def _new_entry() -> list[int]:
+    """Create a [total_ns, count] entry for a timed region."""
+    return [0, 0]
+
+
 @dataclass
 class TimingStats:
-    """Collected timing statistics."""
+    """Collected timing statistics, as [total_ns, count] per name."""
 
-    timings: dict[str, float] = field(default_factory=dict)
-    counts: dict[str, int] = field(default_factory=dict)
+    stats: defaultdict[str, list[int]] = field(default_factory=lambda: defaultdict(_new_entry))
     enabled: bool = False
     _console: Console | None = None
 
 
 _stats = TimingStats()
 
+_TIMED_PROPAGATION_PHASES = frozenset({"propagation_setup", "propagation_fixpoint"})
+
 
 def enable(console: Console | None = None) -> None:
     """Enable timing collection."""
+    global timed, record, record_count
     _stats.enabled = True
-    _stats.timings.clear()
-    _stats.counts.clear()
+    timed = _Timed
+    record = _record_enabled
+    record_count = _record_count_enabled
+    _stats.stats.clear()
     _stats._console = console
     atexit.register(_print_report_on_exit)
 
 
 def disable() -> None:
     """Disable timing collection."""
+    global timed, record, record_count
     _stats.enabled = False
+    timed = _timed_disabled
+    record = _record_disabled
+    record_count = _record_disabled
 
 
 def is_enabled() -> bool:
@@ -45,96 +58,128 @@ def is_enabled() -> bool:
     return _stats.enabled
 
 
-@contextmanager
-def timed(name: str) -> Generator[None, None, None]:
-    """Context manager to time a block of code."""
-    if not _stats.enabled:
-        yield
-        return
+class _Timed:
+    """Context manager that adds the elapsed time of its block to the stats."""
 
-    start = time.perf_counter()
-    yield
-    elapsed = time.perf_counter() - start
+    __slots__ = ("name", "start")
 
-    _stats.timings[name] = _stats.timings.get(name, 0.0) + elapsed
-    _stats.counts[name] = _stats.counts.get(name, 0) + 1
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0
 
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
 
-def record(name: str, elapsed: float) -> None:
-    """Record a timing directly."""
-    if not _stats.enabled:
-        return
-    _stats.timings[name] = _stats.timings.get(name, 0.0) + elapsed
-    _stats.counts[name] = _stats.counts.get(name, 0) + 1
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = time.perf_counter_ns() - self.start
+        entry = _stats.stats[self.name]
+        entry[0] += elapsed
+        entry[1] += 1
 
 
-def record_count(name: str, count: int) -> None:
-    """Record a counter value (not a timing)."""
-    if not _stats.enabled:
-        return
-    _stats.timings[name] = 0.0
-    _stats.counts[name] = count
+class _NullTimed:
+    """Context manager that does nothing, used while timing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_TIMED = _NullTimed()
+
+
+def _timed_disabled(name: str) -> _Timed | _NullTimed:
+    """Return the shared no-op context manager while timing is disabled."""
+    return _NULL_TIMED
+
+
+def _record_enabled(name: str, elapsed: float) -> None:
+    """Add a timing, given in seconds, to the stats."""
+    entry = _stats.stats[name]
+    entry[0] += round(elapsed * 1e9)
+    entry[1] += 1
+
+
+def _record_count_enabled(name: str, count: int) -> None:
+    """Set a counter value in the stats."""
+    _stats.stats[name] = [0, count]
+
+
+def _record_disabled(name: str, value: float) -> None:
+    """Ignore a timing or counter while timing is disabled."""
+    return None
+
+
+timed: Callable[[str], _Timed | _NullTimed] = _timed_disabled
+"""Context manager to time a block of code. Rebound by enable() and disable()."""
+
+record: Callable[[str, float], None] = _record_disabled
+"""Record a timing directly. Rebound by enable() and disable()."""
+
+record_count: Callable[[str, int], None] = _record_disabled
+"""Record a counter value (not a timing). Rebound by enable() and disable()."""
 
 
 def get_report() -> dict[str, dict[str, float | int]]:
     """Get timing report as dict."""
+    items = sorted(_stats.stats.items(), key=lambda item: item[1][0], reverse=True)
     return {
         name: {
-            "total_seconds": _stats.timings[name],
-            "count": _stats.counts[name],
-            "avg_ms": (_stats.timings[name] / _stats.counts[name]) * 1000,
+            "total_seconds": total_ns / 1e9,
+            "count": count,
+            "avg_ms": total_ns / count / 1e6 if count else 0.0,
         }
-        for name in sorted(_stats.timings, key=lambda k: _stats.timings[k], reverse=True)
+        for name, (total_ns, count) in items
     }
 
 
+def _is_counter(name: str, total: float) -> bool:
+    """Check if a report entry is a counter rather than a timed region."""
+    return total == 0.0 or (
+        name.startswith("propagation_") and name not in _TIMED_PROPAGATION_PHASES
+    )
+
+
+def _format_time(total: float, count: int, avg_ms: float) -> str:
+    """Format the total time of a region, with call stats if it ran more than once."""
+    if count == 1:
+        return f"{total:>8.3f}s"
+    return f"{total:>8.3f}s  ({count:,} calls, {avg_ms:.2f}ms avg)"
+
+
 def format_report() -> str:
     """Format timing report as a string."""
     report = get_report()
     if not report:
         return "No timing data collected."
 
-    time_metrics = []
-    counter_metrics = []
-
-    for name, data in report.items():
-        total = data["total_seconds"]
-        count = data["count"]
-        is_counter = (
-            total == 0.0
-            or name.startswith("propagation_")
-            and name
-            not in (
-                "propagation_setup",
-                "propagation_fixpoint",
-            )
-        )
-
-        if is_counter:
-            counter_metrics.append((name, count))
-        elif count == 1:
-            time_metrics.append((name, f"{total:>8.3f}s"))
-        else:
-            avg_ms = data["avg_ms"]
-            time_metrics.append((name, f"{total:>8.3f}s  ({count:,} calls, {avg_ms:.2f}ms avg)"))
-
-    lines = ["", "Timing breakdown:"]
-    for name, value in time_metrics:
-        lines.append(f"  {name:30s} {value}")
-
-    if counter_metrics:
-        lines.append("")
-        lines.append("Propagation stats:")
-        for name, count in counter_metrics:
-            display_name = name.replace("propagation_", "  ")
-            lines.append(f"  {display_name:30s} {count:,}")
-
+    entries = [
+        (name, data, _is_counter(name, data["total_seconds"])) for name, data in report.items()
+    ]
+    time_lines = [
+        f"  {name:30s} " + _format_time(data["total_seconds"], int(data["count"]), data["avg_ms"])
+        for name, data, is_counter in entries
+        if not is_counter
+    ]
+    counter_lines = [
+        f"  {name.replace('propagation_', '  '):30s} {data['count']:,}"
+        for name, data, is_counter in entries
+        if is_counter
+    ]
+
+    lines = ["", "Timing breakdown:", *time_lines]
+    if counter_lines:
+        lines.extend(["", "Propagation stats:", *counter_lines])
     return "\n".join(lines)
 
 
 def _print_report_on_exit() -> None:
     """Print timing report on program exit."""
-    if not _stats.enabled or not _stats.timings:
+    if not _stats.enabled or not _stats.stats:
         return
 
     report_str = format_report()
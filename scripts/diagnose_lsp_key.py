@@ -25,6 +25,7 @@ def main() -> None:
 
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     from bubble.extractor import extract_from_directory
+    from bubble.models import RaiseSite
     from bubble.propagation import (
         build_forward_call_graph,
         compute_exception_flow,
@@ -41,16 +42,27 @@ def main() -> None:
     print(f"  {len(model.functions)} functions, {len(model.raise_sites)} raise sites")
     print()
 
+    keys_by_file: dict[str, list[str]] = {}
+    for key, func in model.functions.items():
+        if func.file not in keys_by_file:
+            keys_by_file[func.file] = []
+        keys_by_file[func.file].append(key)
+
+    raises_by_file: dict[str, list[RaiseSite]] = {}
+    for raise_site in model.raise_sites:
+        if raise_site.file not in raises_by_file:
+            raises_by_file[raise_site.file] = []
+        raises_by_file[raise_site.file].append(raise_site)
+
     print("=" * 60)
     print("1. MODEL.FUNCTIONS KEY FORMAT (single colon)")
     print("=" * 60)
-    single_colon_matches = [
-        k for k in model.functions
-        if function_name in k and relative_file in k
+    all_func_keys_for_file = [
+        k for file, keys in keys_by_file.items() if relative_file in file for k in keys
     ]
+    single_colon_matches = [k for k in all_func_keys_for_file if function_name in k]
     print(f"  Keys matching '{function_name}' + '{relative_file}': {single_colon_matches}")
 
-    all_func_keys_for_file = [k for k in model.functions if relative_file in k]
     print(f"  All keys for file ({len(all_func_keys_for_file)} total):")
     for k in all_func_keys_for_file[:10]:
         print(f"    {k}")
@@ -61,8 +73,9 @@ def main() -> None:
     print("=" * 60)
     print("2. FUNCTIONDEF FIELDS")
     print("=" * 60)
-    for key, func in model.functions.items():
-        if function_name in func.qualified_name and relative_file in (func.file or key):
+    for key in all_func_keys_for_file:
+        func = model.functions[key]
+        if function_name in func.qualified_name:
             print(f"  key:            {key}")
             print(f"  func.file:      {func.file}")
             print(f"  func.name:      {func.name}")
@@ -120,7 +133,9 @@ def main() -> None:
     print("=" * 60)
     print("6. RAISE SITES IN THIS FILE")
     print("=" * 60)
-    file_raises = [r for r in model.raise_sites if relative_file in r.file]
+    file_raises = [
+        r for file, raises in raises_by_file.items() if relative_file in file for r in raises
+    ]
     for r in file_raises[:10]:
         print(f"  {r.file}::{r.function} raises {r.exception_type} (line {r.line})")
     if not file_raises:
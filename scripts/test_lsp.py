@@ -1,6 +1,7 @@
 """Minimal LSP client that tests the bubble-lsp server over stdio.
 
-Spawns the server as a subprocess, sends initialize + hover, prints responses.
+Spawns the server as a subprocess with a Unix socketpair as its stdio, sends
+initialize + hover, prints responses.
 No dependencies beyond the standard library.
 
 Usage:
@@ -12,6 +13,7 @@ from __future__ import annotations
 
 import json
 import shutil
+import socket
 import subprocess
 import sys
 from pathlib import Path
@@ -25,27 +27,49 @@ def make_notification(method: str, params: dict) -> dict:
     return {"jsonrpc": "2.0", "method": method, "params": params}
 
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
 def encode_message(obj: dict) -> bytes:
-    body = json.dumps(obj).encode("utf-8")
+    body = _JSON_ENCODER.encode(obj).encode("utf-8")
     header = f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
     return header + body
 
 
-def read_response(proc: subprocess.Popen) -> dict:
-    """Read one LSP message from the server's stdout."""
-    assert proc.stdout is not None
-    headers: dict[str, str] = {}
-    while True:
-        line = proc.stdout.readline().decode("ascii")
-        if line == "\r\n":
-            break
-        if ":" in line:
-            key, value = line.split(":", 1)
-            headers[key.strip()] = value.strip()
+class LSPReader:
+    """Reads LSP messages from a socket with bulk reads into one buffer."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.buf = bytearray()
+
+    def _fill(self) -> None:
+        chunk = self.sock.recv(65536)
+        if not chunk:
+            raise EOFError("LSP server closed its output")
+        self.buf += chunk
+
+    def read_message(self) -> dict:
+        """Read one LSP message."""
+        sep = self.buf.find(b"\r\n\r\n")
+        while sep < 0:
+            self._fill()
+            sep = self.buf.find(b"\r\n\r\n")
+
+        content_length = 0
+        for line in bytes(self.buf[:sep]).split(b"\r\n"):
+            key, _, value = line.partition(b":")
+            if key.strip().lower() == b"content-length":
+                content_length = int(value)
+
+        body_start = sep + 4
+        body_end = body_start + content_length
+        while len(self.buf) < body_end:
+            self._fill()
 
-    content_length = int(headers["Content-Length"])
-    body = proc.stdout.read(content_length)
-    return json.loads(body)
+        body = bytes(self.buf[body_start:body_end])
+        del self.buf[:body_end]
+        return json.loads(body)
 
 
 def find_python(project_root: Path) -> str:
@@ -65,14 +89,17 @@ def main() -> None:
     python = find_python(project_root)
 
     print(f"Starting bubble-lsp server with {python}...")
+    parent, child = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    parent.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
     proc = subprocess.Popen(
         [python, "-m", "bubble.lsp"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
+        stdin=child,
+        stdout=child,
         stderr=subprocess.PIPE,
         cwd=str(project_root),
     )
-    assert proc.stdin is not None
+    child.close()
+    reader = LSPReader(parent)
 
     try:
         print("Sending initialize...")
@@ -85,15 +112,13 @@ def main() -> None:
             },
             request_id=1,
         )
-        proc.stdin.write(encode_message(init_request))
-        proc.stdin.flush()
+        parent.sendall(encode_message(init_request))
 
-        init_response = read_response(proc)
+        init_response = reader.read_message()
         print(f"Server name: {init_response['result']['serverInfo']['name']}")
         print(f"Capabilities: {list(init_response['result']['capabilities'].keys())}")
 
-        proc.stdin.write(encode_message(make_notification("initialized", {})))
-        proc.stdin.flush()
+        parent.sendall(encode_message(make_notification("initialized", {})))
 
         test_file = project_root / "bubble" / "cli.py"
         test_uri = test_file.as_uri()
@@ -111,8 +136,7 @@ def main() -> None:
                 },
             },
         )
-        proc.stdin.write(encode_message(did_open))
-        proc.stdin.flush()
+        parent.sendall(encode_message(did_open))
 
         hover_line = 175
         print(f"Sending hover at line {hover_line + 1} (inside escapes function)...")
@@ -124,10 +148,9 @@ def main() -> None:
             },
             request_id=2,
         )
-        proc.stdin.write(encode_message(hover_request))
-        proc.stdin.flush()
+        parent.sendall(encode_message(hover_request))
 
-        hover_response = read_response(proc)
+        hover_response = reader.read_message()
         if "result" in hover_response and hover_response["result"]:
             content = hover_response["result"]["contents"]["value"]
             print(f"\nHover response:\n{content}")
@@ -137,15 +160,14 @@ def main() -> None:
             print("\n--- FAIL ---")
 
         print("\nShutting down...")
-        proc.stdin.write(encode_message(make_request("shutdown", {}, request_id=3)))
-        proc.stdin.flush()
-        read_response(proc)
+        parent.sendall(encode_message(make_request("shutdown", {}, request_id=3)))
+        reader.read_message()
 
-        proc.stdin.write(encode_message(make_notification("exit", {})))
-        proc.stdin.flush()
+        parent.sendall(encode_message(make_notification("exit", {})))
 
     finally:
         proc.wait(timeout=5)
+        parent.close()
         stderr_output = proc.stderr.read().decode() if proc.stderr else ""
         if stderr_output:
             print(f"\nServer stderr:\n{stderr_output}")
@@ -36,14 +36,14 @@ def main():
     scope = compute_forward_reachability(test_func, model, forward_graph)
     p(f"  Scope: {time.perf_counter() - t0:.2f}s, {len(scope)} functions (vs {len(model.functions)} total)")
 
-    p("Running scoped propagation...")
     clear_propagation_cache()
+
+    p("Running scoped propagation...")
     t0 = time.perf_counter()
     prop = propagate_exceptions(model, skip_evidence=True, scope=scope)
     p(f"  Propagation: {time.perf_counter() - t0:.2f}s, {len(prop.propagated_raises)} functions with raises")
 
     p("Running full propagation (for comparison)...")
-    clear_propagation_cache()
     t0 = time.perf_counter()
     prop_full = propagate_exceptions(model, skip_evidence=True)
     p(f"  Propagation: {time.perf_counter() - t0:.2f}s, {len(prop_full.propagated_raises)} functions with raises")
@@ -1,107 +1,230 @@
+import hashlib
 import json
+import os
+import pickle
 import subprocess
 import sys
-import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, partial
+from importlib.metadata import version
 from pathlib import Path
 
 import pytest
+from typer.testing import CliRunner
 
+from bubble.cli import app
 from bubble.extractor import extract_from_directory
 from bubble.models import ProgramModel
 from bubble.propagation import clear_propagation_cache
 
 FIXTURES = Path(__file__).parent / "fixtures"
-
-
-@pytest.fixture(autouse=True)
-def _clear_caches() -> None:
-    """Clear propagation caches before each test to prevent test pollution."""
-    clear_propagation_cache()
-
-
-@pytest.fixture
-def flask_model() -> ProgramModel:
-    """Pre-built model for flask_app fixture."""
-    return extract_from_directory(FIXTURES / "flask_app", use_cache=False)
-
-
-@pytest.fixture
-def fastapi_model() -> ProgramModel:
-    """Pre-built model for fastapi_app fixture."""
-    return extract_from_directory(FIXTURES / "fastapi_app", use_cache=False)
-
-
-@pytest.fixture
-def cli_model() -> ProgramModel:
-    """Pre-built model for cli_scripts fixture."""
-    return extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
-
-
-@pytest.fixture
-def hierarchy_model() -> ProgramModel:
-    """Pre-built model for exception_hierarchy fixture."""
-    return extract_from_directory(FIXTURES / "exception_hierarchy", use_cache=False)
-
-
-@pytest.fixture
-def mixed_model() -> ProgramModel:
-    """Pre-built model for mixed_app fixture."""
-    return extract_from_directory(FIXTURES / "mixed_app", use_cache=False)
+BUBBLE_SOURCE = Path(__file__).parent.parent / "bubble"
+MODEL_LOCK_TIMEOUT = 300.0
+
+_CLI_RUNNER = CliRunner()
+
+_MODEL_FIXTURES = {
+    "flask_model": "flask_app",
+    "fastapi_model": "fastapi_app",
+    "cli_model": "cli_scripts",
+    "hierarchy_model": "exception_hierarchy",
+    "mixed_model": "mixed_app",
+    "resolution_model": "resolution_test",
+    "flask_appbuilder_model": "flask_appbuilder_app",
+    "generic_handler_model": "generic_handler_app",
+    "flask_restful_model": "flask_restful_app",
+    "flask_restful_crossfile_model": "flask_restful_crossfile",
+    "catches_flow_model": "catches_flow_test",
+    "factory_raise_model": "factory_raise",
+    "remote_handler_model": "remote_handler_app",
+    "drf_model": "drf_app",
+    "global_handler_model": "global_handler_app",
+}
+
+_models: dict[str, ProgramModel] = {}
+_requested_models: list[str] = []
+_prewarmed = False
+_model_cache_dir: Path | None = None
+
+_STALE_PICKLE_ERRORS = (pickle.UnpicklingError, EOFError, AttributeError, ImportError)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep pickled fixture models in pytest's cache, so they follow cache_dir and --cache-clear."""
+    global _model_cache_dir
+    assert config.cache is not None
+    _model_cache_dir = config.cache.mkdir("bubble_models")
 
 
 @pytest.fixture
-def resolution_model() -> ProgramModel:
-    """Pre-built model for resolution_test fixture."""
-    return extract_from_directory(FIXTURES / "resolution_test", use_cache=False)
+def clear_propagation() -> None:
+    """Clear propagation caches for tests that inspect the cache itself.
 
-
-@pytest.fixture
-def flask_appbuilder_model() -> ProgramModel:
-    """Pre-built model for flask_appbuilder_app fixture."""
-    return extract_from_directory(FIXTURES / "flask_appbuilder_app", use_cache=False)
-
-
-@pytest.fixture
-def generic_handler_model() -> ProgramModel:
-    """Pre-built model for generic_handler_app fixture."""
-    return extract_from_directory(FIXTURES / "generic_handler_app", use_cache=False)
-
-
-@pytest.fixture
-def flask_restful_model() -> ProgramModel:
-    """Pre-built model for flask_restful_app fixture."""
-    return extract_from_directory(FIXTURES / "flask_restful_app", use_cache=False)
-
-
-@pytest.fixture
-def flask_restful_crossfile_model() -> ProgramModel:
-    """Pre-built model for flask_restful_crossfile fixture (cross-file correlation test)."""
-    return extract_from_directory(FIXTURES / "flask_restful_crossfile", use_cache=False)
-
-
-@pytest.fixture
-def catches_flow_model() -> ProgramModel:
-    """Pre-built model for catches_flow_test fixture (flow-aware catches testing)."""
-    return extract_from_directory(FIXTURES / "catches_flow_test", use_cache=False)
+    Request it with @pytest.mark.usefixtures("clear_propagation").
+    """
+    clear_propagation_cache()
 
 
-@pytest.fixture
-def factory_raise_model() -> ProgramModel:
-    """Pre-built model for factory_raise fixture."""
-    return extract_from_directory(FIXTURES / "factory_raise", use_cache=False)
+@cache
+def _source_digest() -> bytes:
+    """Hash the bubble sources and runtime, so a cached model is rebuilt when extraction changes."""
+    digest = hashlib.sha256()
+    digest.update(sys.version.encode())
+    digest.update(version("libcst").encode())
+    for path in sorted(BUBBLE_SOURCE.rglob("*.py")):
+        digest.update(str(path.relative_to(BUBBLE_SOURCE)).encode())
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+@cache
+def _model_cache_path(name: str) -> Path:
+    """Locate the pickled model for a fixture, keyed by its sources and location."""
+    assert _model_cache_dir is not None
+    fixture_dir = FIXTURES / name
+    digest = hashlib.sha256(_source_digest())
+    digest.update(str(fixture_dir).encode())
+    for path in sorted(fixture_dir.rglob("*.py")):
+        digest.update(str(path.relative_to(fixture_dir)).encode())
+        digest.update(path.read_bytes())
+    return _model_cache_dir / f"{digest.hexdigest()}.pkl"
+
+
+def _read_cached_model(cache_path: Path) -> ProgramModel | None:
+    """Unpickle a cached model, or return None if it is missing, truncated or incompatible.
+
+    An unreadable pickle is removed so it gets rebuilt.
+    """
+    try:
+        data = cache_path.read_bytes()
+    except FileNotFoundError:
+        return None
+    try:
+        return pickle.loads(data)
+    except _STALE_PICKLE_ERRORS:
+        cache_path.unlink(missing_ok=True)
+        return None
+
+
+def _store_model(name: str, model: ProgramModel) -> None:
+    """Pickle a fixture model atomically into the model cache, then prune stale pickles."""
+    cache_path = _model_cache_path(name)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_bytes(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp_path, cache_path)
+
+    current = {_model_cache_path(fixture).name for fixture in _MODEL_FIXTURES.values()}
+    for stale in cache_path.parent.glob("*.pkl"):
+        if stale.name not in current:
+            stale.unlink(missing_ok=True)
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    """Record which model fixtures the selected tests use, so only those are prewarmed."""
+    requested = {name for item in session.items for name in getattr(item, "fixturenames", ())}
+    _requested_models.extend(
+        directory for fixture, directory in _MODEL_FIXTURES.items() if fixture in requested
+    )
+
+
+def _prewarm_models() -> None:
+    """Load cached requested models and extract the rest in parallel worker processes."""
+    for name in _requested_models:
+        model = _read_cached_model(_model_cache_path(name))
+        if model is not None:
+            _models[name] = model
+
+    missing = [name for name in _requested_models if name not in _models]
+    if len(missing) < 2 or (os.cpu_count() or 1) < 2 or "PYTEST_XDIST_WORKER" in os.environ:
+        return
+
+    workers = min(os.cpu_count() or 1, len(missing))
+    extract = partial(extract_from_directory, use_cache=False)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        models = pool.map(extract, [FIXTURES / name for name in missing])
+        for name, model in zip(missing, models, strict=True):
+            _models[name] = model
+            _store_model(name, model)
+
+
+def _load_or_build_model(name: str) -> ProgramModel:
+    """Load a cached fixture model, or build it while holding a lock file.
+
+    Concurrent xdist workers wait for the first one to write the model instead
+    of each extracting it. A lock older than MODEL_LOCK_TIMEOUT is treated as
+    left behind by a crashed worker and removed.
+    """
+    cache_path = _model_cache_path(name)
+    lock_path = cache_path.with_suffix(".lock")
+    while True:
+        model = _read_cached_model(cache_path)
+        if model is not None:
+            return model
+        try:
+            lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > MODEL_LOCK_TIMEOUT:
+                    lock_path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            time.sleep(0.05)
+            continue
+
+        try:
+            model = _read_cached_model(cache_path)
+            if model is None:
+                model = extract_from_directory(FIXTURES / name, use_cache=False)
+                _store_model(name, model)
+            return model
+        finally:
+            os.close(lock_fd)
+            lock_path.unlink(missing_ok=True)
+
+
+def _fixture_model(name: str) -> ProgramModel:
+    """Extract a fixture directory once per session; tests must not mutate the model.
+
+    Models are pickled into pytest's cache directory and reused while neither
+    the fixture, the bubble sources, Python nor libcst change. The first request loads every cached model
+    the selected tests use, and builds the missing ones across processes when
+    more than one CPU is available and the run is not already split by xdist.
+    """
+    global _prewarmed
+    if not _prewarmed:
+        _prewarmed = True
+        _prewarm_models()
+    if name not in _models:
+        _models[name] = _load_or_build_model(name)
+    return _models[name]
+
+
+def _model_fixture(name: str) -> Callable[[], ProgramModel]:
+    """Create a fixture function returning the shared model for a fixture directory."""
+
+    def model() -> ProgramModel:
+        return _fixture_model(name)
+
+    model.__doc__ = f"Pre-built model for {name} fixture."
+    return model
+
+
+for _fixture_name, _directory in _MODEL_FIXTURES.items():
+    globals()[_fixture_name] = pytest.fixture(scope="session", name=_fixture_name)(
+        _model_fixture(_directory)
+    )
 
 
 @pytest.fixture
-def remote_handler_model() -> ProgramModel:
-    """Pre-built model for remote_handler_app fixture (cross-file handler testing)."""
-    return extract_from_directory(FIXTURES / "remote_handler_app", use_cache=False)
+def temp_project(tmp_path: Path) -> Path:
+    """Create a temporary project directory under the session's temp root.
 
-
-@pytest.fixture
-def temp_project():
-    """Create a temporary project directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    Directories are left for pytest to prune on later runs rather than
+    removed after each test.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -111,11 +234,12 @@ def flask_fixture():
 
 
 def run_cli(*args: str, fixture: str | None = "flask_app") -> subprocess.CompletedProcess[str]:
-    """Run flow CLI command via subprocess (for smoke tests only)."""
-    cmd = [sys.executable, "-m", "bubble.cli", *args]
+    """Run flow CLI command in-process, returning its output like a finished subprocess."""
+    cli_args = list(args)
     if fixture is not None:
-        cmd.extend(["--no-cache", "-d", str(FIXTURES / fixture)])
-    return subprocess.run(cmd, capture_output=True, text=True)
+        cli_args.extend(["--no-cache", "-d", str(FIXTURES / fixture)])
+    result = _CLI_RUNNER.invoke(app, cli_args)
+    return subprocess.CompletedProcess(cli_args, result.exit_code, result.stdout, result.stderr)
 
 
 def run_cli_json(*args: str, fixture: str | None = "flask_app") -> dict:
@@ -1,6 +1,10 @@
 """Tests for catch site detection."""
 
+import pytest
+
 from bubble import queries
+from bubble.models import ProgramModel
+from bubble.results import CatchesResult
 
 
 def test_finds_global_handler(flask_model):
@@ -30,40 +34,56 @@ def test_no_handlers_in_cli(cli_model):
     assert len(cli_model.global_handlers) == 0
 
 
+@pytest.fixture(scope="module")
+def catches_results(catches_flow_model: ProgramModel) -> dict[str, CatchesResult]:
+    """Run each find_catches query the flow-aware tests read, once per module.
+
+    ServiceError is searched with include_subclasses=True.
+    """
+    results = {
+        name: queries.find_catches(catches_flow_model, name)
+        for name in ("ValidationError", "NetworkError", "UnusedException", "DoesNotExistError")
+    }
+    results["ServiceError"] = queries.find_catches(
+        catches_flow_model, "ServiceError", include_subclasses=True
+    )
+    return results
+
+
 class TestFlowAwareCatches:
     """Tests for flow-aware catches functionality."""
 
-    def test_finds_catches_in_call_path(self, catches_flow_model):
+    def test_finds_catches_in_call_path(self, catches_results):
         """Catches in the call path from raise site are found."""
-        result = queries.find_catches(catches_flow_model, "ValidationError")
+        result = catches_results["ValidationError"]
 
         catch_functions = {c.function for c in result.local_catches}
         assert "api_endpoint" in catch_functions
 
-    def test_excludes_catches_not_in_call_path(self, catches_flow_model):
+    def test_excludes_catches_not_in_call_path(self, catches_results):
         """Catches NOT in the call path are excluded."""
-        result = queries.find_catches(catches_flow_model, "ValidationError")
+        result = catches_results["ValidationError"]
 
         catch_functions = {c.function for c in result.local_catches}
         assert "unrelated_function" not in catch_functions
 
-    def test_no_catches_when_exception_not_raised(self, catches_flow_model):
+    def test_no_catches_when_exception_not_raised(self, catches_results):
         """No catches returned when exception is never raised."""
-        result = queries.find_catches(catches_flow_model, "UnusedException")
+        result = catches_results["UnusedException"]
 
         assert len(result.local_catches) == 0
         assert result.raise_site_count == 0
 
-    def test_raise_site_count_populated(self, catches_flow_model):
+    def test_raise_site_count_populated(self, catches_results):
         """raise_site_count reflects actual raise sites."""
-        result = queries.find_catches(catches_flow_model, "ValidationError")
+        result = catches_results["ValidationError"]
 
         assert result.raise_site_count == 1
 
-    def test_different_exception_different_catches(self, catches_flow_model):
+    def test_different_exception_different_catches(self, catches_results):
         """Different exceptions have different catch sites in call path."""
-        validation_result = queries.find_catches(catches_flow_model, "ValidationError")
-        network_result = queries.find_catches(catches_flow_model, "NetworkError")
+        validation_result = catches_results["ValidationError"]
+        network_result = catches_results["NetworkError"]
 
         validation_functions = {c.function for c in validation_result.local_catches}
         network_functions = {c.function for c in network_result.local_catches}
@@ -72,9 +92,9 @@ class TestFlowAwareCatches:
         assert "api_endpoint" not in network_functions
         assert "another_unrelated" in network_functions
 
-    def test_parent_exception_catches_child(self, catches_flow_model):
+    def test_parent_exception_catches_child(self, catches_results):
         """Catch of parent exception (ServiceError) catches child (ValidationError)."""
-        result = queries.find_catches(catches_flow_model, "ValidationError")
+        result = catches_results["ValidationError"]
 
         caught_types = set()
         for c in result.local_catches:
@@ -82,24 +102,24 @@ class TestFlowAwareCatches:
 
         assert "ValidationError" in caught_types
 
-    def test_nonexistent_exception_returns_empty(self, catches_flow_model):
+    def test_nonexistent_exception_returns_empty(self, catches_results):
         """Exception that doesn't exist returns empty result."""
-        result = queries.find_catches(catches_flow_model, "DoesNotExistError")
+        result = catches_results["DoesNotExistError"]
 
         assert len(result.local_catches) == 0
         assert len(result.global_handlers) == 0
         assert result.raise_site_count == 0
 
-    def test_include_subclasses_finds_child_raises(self, catches_flow_model):
+    def test_include_subclasses_finds_child_raises(self, catches_results):
         """include_subclasses=True finds catches for parent when child is raised."""
-        result = queries.find_catches(catches_flow_model, "ServiceError", include_subclasses=True)
+        result = catches_results["ServiceError"]
 
         assert result.raise_site_count >= 1
         assert "ValidationError" in result.types_searched
 
-    def test_broad_except_in_path_is_included(self, catches_flow_model):
+    def test_broad_except_in_path_is_included(self, catches_results):
         """Broad except Exception in call path is included."""
-        result = queries.find_catches(catches_flow_model, "NetworkError")
+        result = catches_results["NetworkError"]
 
         assert result.raise_site_count == 1
         catch_functions = {c.function for c in result.local_catches}
@@ -1,8 +1,27 @@
-"""CLI smoke tests - verify commands run via subprocess."""
+"""CLI smoke tests - verify commands run through the Typer app."""
 
+import pytest
 from conftest import run_cli, run_cli_json
 
 
+@pytest.mark.parametrize(
+    ("args", "fixture"),
+    [
+        pytest.param(("flask", "entrypoints"), "flask_app", id="flask-entrypoints"),
+        pytest.param(("raises", "ValidationError"), "flask_app", id="raises"),
+        pytest.param(("exceptions",), "exception_hierarchy", id="exceptions"),
+        pytest.param(("callers", "validate_input"), "flask_app", id="callers"),
+        pytest.param(("escapes", "validate_input"), "flask_app", id="escapes"),
+        pytest.param(("escapes", "validate_input", "--strict"), "flask_app", id="escapes-strict"),
+        pytest.param(("catches", "AppError"), "flask_app", id="catches"),
+    ],
+)
+def test_cli_command_runs(args: tuple[str, ...], fixture: str):
+    """Command runs against a fixture project without error."""
+    result = run_cli(*args, fixture=fixture)
+    assert result.returncode == 0
+
+
 def test_cli_stats_runs():
     """Stats command runs and returns valid output."""
     result = run_cli("stats")
@@ -17,42 +36,6 @@ def test_cli_stats_json():
     assert "functions" in data["results"]
 
 
-def test_cli_flask_entrypoints_runs():
-    """Flask entrypoints command runs."""
-    result = run_cli("flask", "entrypoints")
-    assert result.returncode == 0
-
-
-def test_cli_raises_runs():
-    """Raises command runs."""
-    result = run_cli("raises", "ValidationError")
-    assert result.returncode == 0
-
-
-def test_cli_exceptions_runs():
-    """Exceptions command runs."""
-    result = run_cli("exceptions", fixture="exception_hierarchy")
-    assert result.returncode == 0
-
-
-def test_cli_callers_runs():
-    """Callers command runs."""
-    result = run_cli("callers", "validate_input")
-    assert result.returncode == 0
-
-
-def test_cli_escapes_runs():
-    """Escapes command runs."""
-    result = run_cli("escapes", "validate_input")
-    assert result.returncode == 0
-
-
-def test_cli_catches_runs():
-    """Catches command runs."""
-    result = run_cli("catches", "AppError")
-    assert result.returncode == 0
-
-
 def test_cli_trace_runs():
     """Trace command runs and shows tree output."""
     result = run_cli("trace", "create_user")
@@ -67,12 +50,6 @@ def test_cli_trace_json():
     assert data["tree"]["function"] == "create_user"
 
 
-def test_cli_escapes_strict():
-    """Escapes command with --strict flag runs."""
-    result = run_cli("escapes", "validate_input", "--strict")
-    assert result.returncode == 0
-
-
 def test_cli_stubs_list():
     """Stubs list command runs and shows loaded stubs."""
     result = run_cli("stubs", "list", fixture=None)
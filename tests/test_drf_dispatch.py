@@ -4,56 +4,68 @@ Verifies that synthetic call edges are created from DRF view classes
 to their HTTP method handlers (get, post, list, create, etc.).
 """
 
-from pathlib import Path
+import pytest
 
 from bubble.enums import ResolutionKind
-from bubble.extractor import extract_from_directory
 from bubble.integrations.django import DjangoIntegration
+from bubble.integrations.models import RoutesToResult
 from bubble.integrations.queries import trace_routes_to_exception
-
-FIXTURES = Path(__file__).parent / "fixtures"
+from bubble.models import CallSite, ProgramModel
+
+
+@pytest.fixture(scope="module")
+def drf_dispatch_calls(drf_model: ProgramModel) -> list[CallSite]:
+    """Implicit dispatch call sites injected for the DRF fixture's views."""
+    return [
+        c for c in drf_model.call_sites if c.resolution_kind == ResolutionKind.IMPLICIT_DISPATCH
+    ]
+
+
+@pytest.fixture(scope="module")
+def drf_dispatch_pairs(drf_dispatch_calls: list[CallSite]) -> set[tuple[str, str]]:
+    """(caller_function, callee_name) pairs of the implicit dispatch call sites."""
+    return {(c.caller_function, c.callee_name) for c in drf_dispatch_calls}
+
+
+@pytest.fixture(scope="module")
+def drf_routes_to(drf_model: ProgramModel) -> dict[str, RoutesToResult]:
+    """Trace each exception the routes-to tests read, once per module.
+
+    LookupError and Exception are searched with include_subclasses=True.
+    """
+    entrypoints = [e for e in drf_model.entrypoints if e.metadata.get("framework") == "django"]
+    integration = DjangoIntegration()
+    results = {
+        name: trace_routes_to_exception(drf_model, integration, entrypoints, name)
+        for name in ("ValueError", "KeyError")
+    }
+    for name in ("LookupError", "Exception"):
+        results[name] = trace_routes_to_exception(
+            drf_model, integration, entrypoints, name, include_subclasses=True
+        )
+    return results
 
 
 class TestDRFDispatchInjection:
     """Tests for implicit dispatch call edge injection."""
 
-    def test_apiview_has_dispatch_edges(self):
+    def test_apiview_has_dispatch_edges(self, drf_dispatch_pairs):
         """APIView class has edges to get and post methods."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        dispatch_calls = [
-            c for c in model.call_sites if c.resolution_kind == ResolutionKind.IMPLICIT_DISPATCH
-        ]
+        assert ("UserAPIView", "get") in drf_dispatch_pairs
+        assert ("UserAPIView", "post") in drf_dispatch_pairs
 
-        caller_callee_pairs = {(c.caller_function, c.callee_name) for c in dispatch_calls}
-
-        assert ("UserAPIView", "get") in caller_callee_pairs
-        assert ("UserAPIView", "post") in caller_callee_pairs
-
-    def test_viewset_has_action_edges(self):
+    def test_viewset_has_action_edges(self, drf_dispatch_pairs):
         """ViewSet class has edges to DRF action methods."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        dispatch_calls = [
-            c for c in model.call_sites if c.resolution_kind == ResolutionKind.IMPLICIT_DISPATCH
-        ]
+        assert ("ItemViewSet", "list") in drf_dispatch_pairs
+        assert ("ItemViewSet", "retrieve") in drf_dispatch_pairs
+        assert ("ItemViewSet", "create") in drf_dispatch_pairs
 
-        caller_callee_pairs = {(c.caller_function, c.callee_name) for c in dispatch_calls}
-
-        assert ("ItemViewSet", "list") in caller_callee_pairs
-        assert ("ItemViewSet", "retrieve") in caller_callee_pairs
-        assert ("ItemViewSet", "create") in caller_callee_pairs
-
-    def test_dispatch_edges_have_qualified_names(self):
+    def test_dispatch_edges_have_qualified_names(self, drf_dispatch_calls):
         """Dispatch edges have proper qualified caller/callee names."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
         user_view_dispatch = [
             c
-            for c in model.call_sites
-            if c.resolution_kind == ResolutionKind.IMPLICIT_DISPATCH
-            and c.caller_function == "UserAPIView"
-            and c.callee_name == "get"
+            for c in drf_dispatch_calls
+            if c.caller_function == "UserAPIView" and c.callee_name == "get"
         ]
 
         assert len(user_view_dispatch) == 1
@@ -62,45 +74,26 @@ class TestDRFDispatchInjection:
         assert "UserAPIView" in edge.caller_qualified
         assert "UserAPIView.get" in edge.callee_qualified
 
-    def test_non_http_methods_not_injected(self):
+    def test_non_http_methods_not_injected(self, drf_dispatch_calls):
         """Helper methods are not added as dispatch edges."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        dispatch_calls = [
-            c for c in model.call_sites if c.resolution_kind == ResolutionKind.IMPLICIT_DISPATCH
-        ]
-
-        callee_names = {c.callee_name for c in dispatch_calls}
+        callee_names = {c.callee_name for c in drf_dispatch_calls}
 
         assert "validate_request" not in callee_names
         assert "process_data" not in callee_names
         assert "get_items" not in callee_names
         assert "validate_item" not in callee_names
 
-    def test_dispatch_edges_are_method_calls(self):
+    def test_dispatch_edges_are_method_calls(self, drf_dispatch_calls):
         """All dispatch edges are marked as method calls."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        dispatch_calls = [
-            c for c in model.call_sites if c.resolution_kind == ResolutionKind.IMPLICIT_DISPATCH
-        ]
-
-        assert all(c.is_method_call for c in dispatch_calls)
+        assert all(c.is_method_call for c in drf_dispatch_calls)
 
 
 class TestDRFRoutesToException:
     """Tests that routes-to traces through DRF class-based views."""
 
-    def test_routes_to_finds_exception_in_view_method(self):
+    def test_routes_to_finds_exception_in_view_method(self, drf_routes_to):
         """ValueError in validate_request connects to UserAPIView entrypoint."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        django_entrypoints = [
-            e for e in model.entrypoints if e.metadata.get("framework") == "django"
-        ]
-
-        integration = DjangoIntegration()
-        result = trace_routes_to_exception(model, integration, django_entrypoints, "ValueError")
+        result = drf_routes_to["ValueError"]
 
         traces_with_entrypoints = [t for t in result.traces if t.entrypoints]
         assert len(traces_with_entrypoints) >= 2
@@ -113,16 +106,9 @@ class TestDRFRoutesToException:
         assert any("UserAPIView" in name for name in entrypoint_names)
         assert any("ItemViewSet" in name for name in entrypoint_names)
 
-    def test_routes_to_keyerror_finds_viewset(self):
+    def test_routes_to_keyerror_finds_viewset(self, drf_routes_to):
         """KeyError in get_item connects to ItemViewSet entrypoint."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        django_entrypoints = [
-            e for e in model.entrypoints if e.metadata.get("framework") == "django"
-        ]
-
-        integration = DjangoIntegration()
-        result = trace_routes_to_exception(model, integration, django_entrypoints, "KeyError")
+        result = drf_routes_to["KeyError"]
 
         traces_with_entrypoints = [t for t in result.traces if t.entrypoints]
         assert len(traces_with_entrypoints) >= 1
@@ -130,35 +116,17 @@ class TestDRFRoutesToException:
         entrypoint_names = {ep.function for t in traces_with_entrypoints for ep in t.entrypoints}
         assert any("ItemViewSet" in name for name in entrypoint_names)
 
-    def test_routes_to_lookuperror_finds_keyerror_via_hierarchy(self):
+    def test_routes_to_lookuperror_finds_keyerror_via_hierarchy(self, drf_routes_to):
         """LookupError -s search finds KeyError via built-in exception hierarchy."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        django_entrypoints = [
-            e for e in model.entrypoints if e.metadata.get("framework") == "django"
-        ]
-
-        integration = DjangoIntegration()
-        result = trace_routes_to_exception(
-            model, integration, django_entrypoints, "LookupError", include_subclasses=True
-        )
+        result = drf_routes_to["LookupError"]
 
         assert "KeyError" in result.types_searched
         traces_with_entrypoints = [t for t in result.traces if t.entrypoints]
         assert len(traces_with_entrypoints) >= 1
 
-    def test_routes_to_exception_finds_all_via_hierarchy(self):
+    def test_routes_to_exception_finds_all_via_hierarchy(self, drf_routes_to):
         """Exception -s search finds all exceptions via built-in hierarchy."""
-        model = extract_from_directory(FIXTURES / "drf_app", use_cache=False)
-
-        django_entrypoints = [
-            e for e in model.entrypoints if e.metadata.get("framework") == "django"
-        ]
-
-        integration = DjangoIntegration()
-        result = trace_routes_to_exception(
-            model, integration, django_entrypoints, "Exception", include_subclasses=True
-        )
+        result = drf_routes_to["Exception"]
 
         assert "ValueError" in result.types_searched
         assert "KeyError" in result.types_searched
@@ -7,22 +7,14 @@ def test_direct_raises_escape(flask_model):
     """Direct raises are tracked in propagation."""
     result = propagate_exceptions(flask_model)
 
-    validate_raises = set()
-    for func, exceptions in result.direct_raises.items():
-        if "validate_input" in func:
-            validate_raises.update(exceptions)
-
-    assert "ValidationError" in validate_raises
+    assert "ValidationError" in result.direct_raises["app.py::validate_input"]
 
 
 def test_propagation_through_call(cli_model):
     """Exceptions propagate through call chain."""
     result = propagate_exceptions(cli_model)
 
-    main_exceptions = set()
-    for func, exceptions in result.propagated_raises.items():
-        if "main" in func:
-            main_exceptions.update(exceptions)
+    main_exceptions = result.propagated_raises["process.py::main"]
 
     assert "ValueError" in main_exceptions
     assert "FileNotFoundError" in main_exceptions
@@ -1,9 +1,12 @@
 """Tests for generic detector to ensure it matches existing framework-specific detectors."""
 
+from collections import Counter
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from bubble.integrations.base import Entrypoint
 from bubble.integrations.fastapi.detector import (
     detect_fastapi_entrypoints,
 )
@@ -16,113 +19,101 @@ from bubble.integrations.generic.frameworks import FASTAPI_CONFIG, FLASK_CONFIG
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
+RoutePair = tuple[list[Entrypoint], list[Entrypoint]]
 
-class TestFlaskGenericDetector:
-    """Test that generic detector matches Flask-specific detector."""
 
-    @pytest.fixture
-    def flask_source(self) -> str:
-        return (FIXTURES / "flask_app" / "app.py").read_text()
+def _assert_same_by(expected: list[Entrypoint], actual: list[Entrypoint], key: Callable) -> None:
+    """Assert both detectors found the same multiset of values for key."""
+    assert Counter(map(key, actual)) == Counter(map(key, expected))
 
-    def test_detects_same_routes_as_flask_detector(self, flask_source: str):
-        """Generic detector finds same routes as Flask detector."""
-        flask_routes = detect_flask_entrypoints(flask_source, "app.py")
-        generic_routes = detect_entrypoints(flask_source, "app.py", FLASK_CONFIG)
 
-        assert len(generic_routes) == len(flask_routes)
+def _methods_by_function(routes: list[Entrypoint]) -> dict[str, str | None]:
+    """Map each route function to its detected HTTP method."""
+    return {e.function: e.metadata.get("http_method") for e in routes}
 
-        flask_functions = {e.function for e in flask_routes}
-        generic_functions = {e.function for e in generic_routes}
-        assert generic_functions == flask_functions
 
-    def test_extracts_same_paths(self, flask_source: str):
-        """Generic detector extracts same HTTP paths."""
-        flask_routes = detect_flask_entrypoints(flask_source, "app.py")
-        generic_routes = detect_entrypoints(flask_source, "app.py", FLASK_CONFIG)
+@pytest.fixture(scope="module")
+def flask_source() -> str:
+    return (FIXTURES / "flask_app" / "app.py").read_text()
 
-        flask_paths = {e.metadata.get("http_path") for e in flask_routes}
-        generic_paths = {e.metadata.get("http_path") for e in generic_routes}
-        assert generic_paths == flask_paths
 
-    def test_extracts_same_methods(self, flask_source: str):
-        """Generic detector extracts same HTTP methods."""
-        flask_routes = detect_flask_entrypoints(flask_source, "app.py")
-        generic_routes = detect_entrypoints(flask_source, "app.py", FLASK_CONFIG)
+@pytest.fixture(scope="module")
+def fastapi_source() -> str:
+    return (FIXTURES / "fastapi_app" / "main.py").read_text()
 
-        flask_by_func = {e.function: e for e in flask_routes}
-        generic_by_func = {e.function: e for e in generic_routes}
 
-        for func in flask_by_func:
-            flask_method = flask_by_func[func].metadata.get("http_method")
-            generic_method = generic_by_func[func].metadata.get("http_method")
-            assert generic_method == flask_method, f"Method mismatch for {func}"
+@pytest.fixture(scope="module")
+def fab_source() -> str | None:
+    path = FIXTURES / "flask_appbuilder_app" / "views.py"
+    if path.exists():
+        return path.read_text()
+    return None
 
-    def test_detects_same_error_handlers(self, flask_source: str):
-        """Generic detector finds same error handlers as Flask detector."""
-        flask_handlers = detect_flask_global_handlers(flask_source, "app.py")
-        generic_handlers = detect_global_handlers(flask_source, "app.py", FLASK_CONFIG)
 
-        assert len(generic_handlers) == len(flask_handlers)
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(
+            ("flask_source", "app.py", detect_flask_entrypoints, FLASK_CONFIG), id="flask"
+        ),
+        pytest.param(
+            ("fastapi_source", "main.py", detect_fastapi_entrypoints, FASTAPI_CONFIG), id="fastapi"
+        ),
+    ],
+)
+def route_pair(request: pytest.FixtureRequest) -> RoutePair:
+    """Routes found by a framework-specific detector and by the generic detector."""
+    source_fixture, file_path, detect_specific, config = request.param
+    source = request.getfixturevalue(source_fixture)
+    return (
+        detect_specific(source, file_path),
+        detect_entrypoints(source, file_path, config),
+    )
 
-        flask_types = {h.handled_type for h in flask_handlers}
-        generic_types = {h.handled_type for h in generic_handlers}
-        assert generic_types == flask_types
 
+class TestGenericDetectorMatchesFrameworks:
+    """Test that generic detector matches each framework-specific detector."""
 
-class TestFastAPIGenericDetector:
-    """Test that generic detector matches FastAPI-specific detector."""
+    def test_detects_same_routes(self, route_pair: RoutePair):
+        """Generic detector finds same routes as the framework detector."""
+        framework_routes, generic_routes = route_pair
 
-    @pytest.fixture
-    def fastapi_source(self) -> str:
-        return (FIXTURES / "fastapi_app" / "main.py").read_text()
+        _assert_same_by(framework_routes, generic_routes, lambda e: e.function)
 
-    def test_detects_same_routes_as_fastapi_detector(self, fastapi_source: str):
-        """Generic detector finds same routes as FastAPI detector."""
-        fastapi_routes = detect_fastapi_entrypoints(fastapi_source, "main.py")
-        generic_routes = detect_entrypoints(fastapi_source, "main.py", FASTAPI_CONFIG)
+    def test_extracts_same_paths(self, route_pair: RoutePair):
+        """Generic detector extracts same HTTP paths."""
+        framework_routes, generic_routes = route_pair
 
-        assert len(generic_routes) == len(fastapi_routes)
+        _assert_same_by(framework_routes, generic_routes, lambda e: e.metadata.get("http_path"))
 
-        fastapi_functions = {e.function for e in fastapi_routes}
-        generic_functions = {e.function for e in generic_routes}
-        assert generic_functions == fastapi_functions
+    def test_extracts_same_methods(self, route_pair: RoutePair):
+        """Generic detector extracts same HTTP methods."""
+        framework_routes, generic_routes = route_pair
 
-    def test_extracts_same_paths(self, fastapi_source: str):
-        """Generic detector extracts same HTTP paths."""
-        fastapi_routes = detect_fastapi_entrypoints(fastapi_source, "main.py")
-        generic_routes = detect_entrypoints(fastapi_source, "main.py", FASTAPI_CONFIG)
+        assert _methods_by_function(generic_routes) == _methods_by_function(framework_routes)
 
-        fastapi_paths = {e.metadata.get("http_path") for e in fastapi_routes}
-        generic_paths = {e.metadata.get("http_path") for e in generic_routes}
-        assert generic_paths == fastapi_paths
 
-    def test_extracts_same_methods(self, fastapi_source: str):
-        """Generic detector extracts same HTTP methods."""
-        fastapi_routes = detect_fastapi_entrypoints(fastapi_source, "main.py")
-        generic_routes = detect_entrypoints(fastapi_source, "main.py", FASTAPI_CONFIG)
+class TestFlaskGenericDetector:
+    """Test that generic detector matches Flask-specific handler detection."""
+
+    def test_detects_same_error_handlers(self, flask_source: str):
+        """Generic detector finds same error handlers as Flask detector."""
+        flask_handlers = detect_flask_global_handlers(flask_source, "app.py")
+        generic_handlers = detect_global_handlers(flask_source, "app.py", FLASK_CONFIG)
 
-        fastapi_by_func = {e.function: e for e in fastapi_routes}
-        generic_by_func = {e.function: e for e in generic_routes}
+        assert len(generic_handlers) == len(flask_handlers)
 
-        for func in fastapi_by_func:
-            fastapi_method = fastapi_by_func[func].metadata.get("http_method")
-            generic_method = generic_by_func[func].metadata.get("http_method")
-            assert generic_method == fastapi_method, f"Method mismatch for {func}"
+        flask_types = {h.handled_type for h in flask_handlers}
+        generic_types = {h.handled_type for h in generic_handlers}
+        assert generic_types == flask_types
 
 
 class TestFlaskAppBuilderGenericDetector:
     """Test Flask-AppBuilder @expose decorator detection."""
 
-    @pytest.fixture
-    def fab_source(self) -> str:
-        path = FIXTURES / "flask_appbuilder_app" / "views.py"
-        if path.exists():
-            return path.read_text()
-        return ""
-
-    def test_detects_expose_decorator(self, fab_source: str):
+    def test_detects_expose_decorator(self, fab_source: str | None):
         """Generic detector finds @expose routes."""
-        if not fab_source:
+        if fab_source is None:
             pytest.skip("Flask-AppBuilder fixture not available")
 
         routes = detect_entrypoints(fab_source, "views.py", FLASK_CONFIG)
@@ -152,6 +143,44 @@ class TestPatternMatching:
         assert not pattern.matches_decorator("Route")
         assert not pattern.matches_decorator("routes")
 
+    def test_prefix_wildcard_is_case_sensitive(self):
+        """Wildcard patterns match case-sensitively, like exact ones."""
+        from bubble.integrations.generic.config import DecoratorRoutePattern
+
+        pattern = DecoratorRoutePattern(decorator_pattern="get*")
+        assert pattern.matches_decorator("get_user")
+        assert not pattern.matches_decorator("Get_user")
+        assert not pattern.matches_decorator("post")
+
+    def test_pattern_follows_reassigned_decorator_pattern(self):
+        """Matching uses the current decorator_pattern, not the one it was built with."""
+        from bubble.integrations.generic.config import DecoratorRoutePattern
+
+        pattern = DecoratorRoutePattern(decorator_pattern="*.route")
+        pattern.decorator_pattern = "expose"
+        assert pattern.matches_decorator("expose")
+        assert not pattern.matches_decorator("app.route")
+
+        pattern.decorator_pattern = "*.get"
+        assert pattern.matches_decorator("router.get")
+        assert not pattern.matches_decorator("expose")
+
+    def test_handler_pattern_is_case_sensitive(self):
+        """Handler patterns match decorator and call names with the same case rules as routes."""
+        from bubble.integrations.generic.config import HandlerPattern
+
+        decorator = HandlerPattern(decorator_pattern="*.errorhandler")
+        assert decorator.matches_decorator("app.errorhandler")
+        assert not decorator.matches_decorator("app.ErrorHandler")
+
+        call = HandlerPattern(call_pattern="*.add_exception_handler")
+        assert call.matches_call("app.add_exception_handler")
+        assert not call.matches_call("app.Add_Exception_Handler")
+
+        exact = HandlerPattern(decorator_pattern="exception_handler")
+        assert exact.matches_decorator("exception_handler")
+        assert not exact.matches_decorator("Exception_Handler")
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -1,9 +1,21 @@
 """Tests for generic exception handler detection."""
 
+import pytest
+
 from bubble.integrations import get_integration_by_name, load_builtin_integrations
+from bubble.integrations.base import Integration
 from bubble.integrations.queries import audit_integration
 
 
+@pytest.fixture(scope="module")
+def flask_integration() -> Integration:
+    """The registered Flask integration, looked up once for the module."""
+    load_builtin_integrations()
+    integration = get_integration_by_name("flask")
+    assert integration is not None
+    return integration
+
+
 def test_generic_handler_detected(generic_handler_model):
     """Generic Exception handler is detected."""
     handlers = generic_handler_model.global_handlers
@@ -17,34 +29,23 @@ def test_generic_handler_detected(generic_handler_model):
     assert specific_handlers[0].handled_type == "AppError"
 
 
-def test_specific_handler_covers_subclass(generic_handler_model):
+def test_specific_handler_covers_subclass(generic_handler_model, flask_integration):
     """ValidationError (subclass of AppError) is caught by specific handler."""
-    load_builtin_integrations()
-    integration = get_integration_by_name("flask")
-    assert integration is not None
-
     entrypoints = [e for e in generic_handler_model.entrypoints if e.function == "create_user"]
     handlers = generic_handler_model.global_handlers
 
-    result = audit_integration(generic_handler_model, integration, entrypoints, handlers)
+    result = audit_integration(generic_handler_model, flask_integration, entrypoints, handlers)
 
     assert result.clean_count == 1
     assert len(result.issues) == 0
 
 
-def test_generic_only_exceptions_flagged(generic_handler_model):
+def test_generic_only_exceptions_flagged(generic_handler_model, flask_integration):
     """UnknownError (only caught by generic handler) is flagged as an issue."""
-    load_builtin_integrations()
-    integration = get_integration_by_name("flask")
-    assert integration is not None
-
     entrypoints = [e for e in generic_handler_model.entrypoints if e.function == "get_data"]
     handlers = generic_handler_model.global_handlers
 
-    result = audit_integration(generic_handler_model, integration, entrypoints, handlers)
+    result = audit_integration(generic_handler_model, flask_integration, entrypoints, handlers)
 
     assert len(result.issues) == 1
-    issue = result.issues[0]
-    assert "UnknownError" in issue.caught_by_generic or any(
-        "UnknownError" in k for k in issue.caught_by_generic
-    )
+    assert "UnknownError" in result.issues[0].caught_by_generic
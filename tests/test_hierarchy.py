@@ -4,61 +4,52 @@ Verifies that standard Python exceptions are recognized in the hierarchy
 without needing explicit class definitions in user code.
 """
 
-from pathlib import Path
+import pytest
 
-from bubble.extractor import extract_from_directory
 from bubble.integrations.flask import FlaskIntegration
 from bubble.integrations.queries import audit_integration
-from bubble.models import BUILTIN_EXCEPTION_HIERARCHY, ClassHierarchy
+from bubble.models import BUILTIN_EXCEPTION_HIERARCHY, ClassDef, ClassHierarchy
 
-FIXTURES = Path(__file__).parent / "fixtures"
+
+@pytest.fixture(scope="module")
+def hierarchy() -> ClassHierarchy:
+    """A hierarchy holding only the bootstrapped builtins; tests must not mutate it."""
+    return ClassHierarchy()
 
 
 class TestBuiltinHierarchy:
     """Tests for built-in Python exception hierarchy."""
 
-    def test_builtin_hierarchy_bootstrapped(self):
+    def test_builtin_hierarchy_bootstrapped(self, hierarchy):
         """ClassHierarchy includes built-in exceptions on creation."""
-        hierarchy = ClassHierarchy()
-
         assert "ValueError" in hierarchy.parent_map
         assert "Exception" in hierarchy.parent_map
         assert "KeyError" in hierarchy.parent_map
 
-    def test_valueerror_is_subclass_of_exception(self):
+    def test_valueerror_is_subclass_of_exception(self, hierarchy):
         """ValueError is recognized as a subclass of Exception."""
-        hierarchy = ClassHierarchy()
-
         assert hierarchy.is_subclass_of("ValueError", "Exception")
         assert hierarchy.is_subclass_of("ValueError", "BaseException")
 
-    def test_keyerror_is_subclass_of_lookuperror(self):
+    def test_keyerror_is_subclass_of_lookuperror(self, hierarchy):
         """KeyError → LookupError → Exception chain is correct."""
-        hierarchy = ClassHierarchy()
-
         assert hierarchy.is_subclass_of("KeyError", "LookupError")
         assert hierarchy.is_subclass_of("KeyError", "Exception")
         assert hierarchy.is_subclass_of("LookupError", "Exception")
 
-    def test_oserror_subclasses(self):
+    def test_oserror_subclasses(self, hierarchy):
         """OSError subclasses (FileNotFoundError, PermissionError) are correct."""
-        hierarchy = ClassHierarchy()
-
         assert hierarchy.is_subclass_of("FileNotFoundError", "OSError")
         assert hierarchy.is_subclass_of("PermissionError", "OSError")
         assert hierarchy.is_subclass_of("FileNotFoundError", "Exception")
 
-    def test_notimplementederror_chain(self):
+    def test_notimplementederror_chain(self, hierarchy):
         """NotImplementedError → RuntimeError → Exception chain."""
-        hierarchy = ClassHierarchy()
-
         assert hierarchy.is_subclass_of("NotImplementedError", "RuntimeError")
         assert hierarchy.is_subclass_of("NotImplementedError", "Exception")
 
-    def test_get_subclasses_of_exception(self):
+    def test_get_subclasses_of_exception(self, hierarchy):
         """get_subclasses returns built-in exceptions."""
-        hierarchy = ClassHierarchy()
-
         subclasses = hierarchy.get_subclasses("Exception")
 
         assert "ValueError" in subclasses
@@ -66,54 +57,68 @@ class TestBuiltinHierarchy:
         assert "KeyError" in subclasses
         assert "RuntimeError" in subclasses
 
-    def test_get_subclasses_of_oserror(self):
+    def test_get_subclasses_of_oserror(self, hierarchy):
         """get_subclasses returns OSError subclasses."""
-        hierarchy = ClassHierarchy()
-
         subclasses = hierarchy.get_subclasses("OSError")
 
         assert "FileNotFoundError" in subclasses
         assert "PermissionError" in subclasses
         assert "TimeoutError" in subclasses
 
-    def test_unrelated_exceptions_not_subclasses(self):
+    def test_unrelated_exceptions_not_subclasses(self, hierarchy):
         """Unrelated exceptions are not subclasses of each other."""
-        hierarchy = ClassHierarchy()
-
         assert not hierarchy.is_subclass_of("ValueError", "KeyError")
         assert not hierarchy.is_subclass_of("TypeError", "ValueError")
         assert not hierarchy.is_subclass_of("OSError", "ValueError")
 
-    def test_baseexception_hierarchy(self):
+    def test_baseexception_hierarchy(self, hierarchy):
         """BaseException subclasses include KeyboardInterrupt, SystemExit."""
-        hierarchy = ClassHierarchy()
-
         assert hierarchy.is_subclass_of("KeyboardInterrupt", "BaseException")
         assert hierarchy.is_subclass_of("SystemExit", "BaseException")
         assert not hierarchy.is_subclass_of("KeyboardInterrupt", "Exception")
 
-    def test_all_builtin_exceptions_have_parents(self):
+    def test_all_builtin_exceptions_have_parents(self, hierarchy):
         """Every built-in exception has parent_map entry."""
-        hierarchy = ClassHierarchy()
-
         for exc_name in BUILTIN_EXCEPTION_HIERARCHY:
             assert exc_name in hierarchy.parent_map
 
-    def test_child_map_populated(self):
+    def test_child_map_populated(self, hierarchy):
         """child_map is populated correctly for built-ins."""
-        hierarchy = ClassHierarchy()
-
         assert "ValueError" in hierarchy.child_map.get("Exception", [])
         assert "KeyError" in hierarchy.child_map.get("LookupError", [])
         assert "FileNotFoundError" in hierarchy.child_map.get("OSError", [])
 
+    def test_descendants_of_matches_is_subclass_of(self, hierarchy):
+        """descendants_of includes the class itself and agrees with is_subclass_of."""
+        descendants = hierarchy.descendants_of("LookupError")
+
+        assert "LookupError" in descendants
+        assert "KeyError" in descendants
+        assert "IndexError" in descendants
+        assert "ValueError" not in descendants
+        for exc_name in BUILTIN_EXCEPTION_HIERARCHY:
+            assert (exc_name in descendants) == hierarchy.is_subclass_of(exc_name, "LookupError")
+
+    def test_user_class_shadowing_builtin_name(self):
+        """A user class named like a built-in is checked against its own bases."""
+        shadowed = ClassHierarchy()
+        shadowed.add_class(
+            ClassDef(
+                name="ValueError", qualified_name="e.py::ValueError", file="e.py", line=1, bases=[]
+            )
+        )
+
+        assert not shadowed.is_subclass_of("ValueError", "Exception")
+        assert not shadowed.is_subclass_of("UnicodeError", "Exception")
+        assert shadowed.is_subclass_of("KeyError", "Exception")
+
 
 class TestGlobalExceptionHandler:
     """Tests that global Exception handlers catch built-in exceptions."""
 
-    def test_global_exception_handler_flags_generic_catches(self):
+    def test_global_exception_handler_flags_generic_catches(self, global_handler_model):
         """@errorhandler(Exception) catches ValueError but flags it as generic-only."""
-        model = extract_from_directory(FIXTURES / "global_handler_app", use_cache=False)
+        model = global_handler_model
 
         flask_entrypoints = [e for e in model.entrypoints if e.metadata.get("framework") == "flask"]
         flask_handlers = [h for h in model.global_handlers if "handle_all_errors" in h.function]
@@ -1,54 +1,46 @@
-"""Tests for flow init command (requires subprocess)."""
+"""Tests for flow init command."""
 
 import subprocess
 import sys
+from pathlib import Path
 
+import pytest
+from conftest import run_cli
 
-def test_init_creates_flow_directory(temp_project):
-    """Init creates .flow/ directory."""
+
+@pytest.fixture(scope="module")
+def inited_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project initialised once through the module entry point, shared read-only."""
+    project = tmp_path_factory.mktemp("flow_proj")
     result = subprocess.run(
-        [sys.executable, "-m", "bubble.cli", "init", "-d", str(temp_project)],
+        [sys.executable, "-m", "bubble.cli", "init", "-d", str(project)],
         capture_output=True,
         text=True,
     )
+    assert result.returncode == 0, result.stderr
+    return project
 
-    assert result.returncode == 0
-    assert (temp_project / ".flow").is_dir()
 
+def test_init_creates_flow_directory(inited_project):
+    """Init creates .flow/ directory when run through the module entry point."""
+    assert (inited_project / ".flow").is_dir()
 
-def test_init_creates_config(temp_project):
-    """Init creates config.yaml file."""
-    subprocess.run(
-        [sys.executable, "-m", "bubble.cli", "init", "-d", str(temp_project)],
-        capture_output=True,
-        text=True,
-    )
 
-    config_path = temp_project / ".flow" / "config.yaml"
+def test_init_creates_config(inited_project):
+    """Init creates config.yaml file."""
+    config_path = inited_project / ".flow" / "config.yaml"
     assert config_path.exists()
 
 
-def test_init_creates_detectors_dir(temp_project):
+def test_init_creates_detectors_dir(inited_project):
     """Init creates detectors/ directory."""
-    subprocess.run(
-        [sys.executable, "-m", "bubble.cli", "init", "-d", str(temp_project)],
-        capture_output=True,
-        text=True,
-    )
-
-    detectors_path = temp_project / ".flow" / "detectors"
+    detectors_path = inited_project / ".flow" / "detectors"
     assert detectors_path.is_dir()
 
 
-def test_init_creates_example_detector(temp_project):
+def test_init_creates_example_detector(inited_project):
     """Init creates example detector file."""
-    subprocess.run(
-        [sys.executable, "-m", "bubble.cli", "init", "-d", str(temp_project)],
-        capture_output=True,
-        text=True,
-    )
-
-    example_path = temp_project / ".flow" / "detectors" / "_example.py"
+    example_path = inited_project / ".flow" / "detectors" / "_example.py"
     assert example_path.exists()
 
 
@@ -60,11 +52,7 @@ def test_init_detects_flask(flask_fixture, temp_project):
     errors_content = (flask_fixture / "errors.py").read_text()
     (temp_project / "errors.py").write_text(errors_content)
 
-    result = subprocess.run(
-        [sys.executable, "-m", "bubble.cli", "init", "-d", str(temp_project)],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli("init", "-d", str(temp_project), fixture=None)
 
     assert result.returncode == 0
     config_content = (temp_project / ".flow" / "config.yaml").read_text()
@@ -75,10 +63,6 @@ def test_init_already_exists(temp_project):
     """Init fails if .flow/ already exists."""
     (temp_project / ".flow").mkdir()
 
-    result = subprocess.run(
-        [sys.executable, "-m", "bubble.cli", "init", "-d", str(temp_project)],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli("init", "-d", str(temp_project), fixture=None)
 
     assert result.returncode != 0
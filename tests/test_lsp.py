@@ -4,7 +4,6 @@ from pathlib import Path
 
 import pytest
 
-from bubble.extractor import extract_from_directory
 from bubble.lsp import (
     RERAISE_PATTERNS,
     _find_call_sites_at_line,
@@ -17,20 +16,33 @@ from bubble.lsp import (
     _is_reraise,
     _parse_ignore_comment,
 )
-from bubble.models import ProgramModel
-from bubble.propagation import ExceptionFlow, RaiseSite, propagate_exceptions
+from bubble.models import CallSite, FunctionDef
+from bubble.propagation import (
+    ExceptionFlow,
+    RaiseSite,
+    compute_exception_flow,
+    propagate_exceptions,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
+CLI_WORKSPACE = FIXTURES / "cli_scripts"
+PROCESS_PY = CLI_WORKSPACE / "process.py"
 
 
-@pytest.fixture
-def cli_model() -> ProgramModel:
-    return extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
+@pytest.fixture(scope="module")
+def main_func(cli_model) -> FunctionDef:
+    """main in cli_scripts/process.py, found from its def line."""
+    func = _find_function_def_at_line(cli_model, PROCESS_PY, 4)
+    assert func is not None
+    return func
 
 
-@pytest.fixture
-def flask_model() -> ProgramModel:
-    return extract_from_directory(FIXTURES / "flask_app", use_cache=False)
+@pytest.fixture(scope="module")
+def main_calls(cli_model) -> list[CallSite]:
+    """Call sites on line 7 of cli_scripts/process.py, inside main."""
+    calls = _find_call_sites_at_line(cli_model, PROCESS_PY, 7)
+    assert len(calls) >= 1
+    return calls
 
 
 class TestIsReraise:
@@ -46,18 +58,18 @@ class TestIsReraise:
 
 class TestFindFunctionDefAtLine:
     def test_finds_function_on_exact_def_line(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+        file_path = PROCESS_PY
         func = _find_function_def_at_line(cli_model, file_path, 4)
         assert func is not None
         assert func.name == "main"
 
     def test_returns_none_for_body_line(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+        file_path = PROCESS_PY
         func = _find_function_def_at_line(cli_model, file_path, 6)
         assert func is None
 
     def test_returns_none_for_blank_line(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+        file_path = PROCESS_PY
         func = _find_function_def_at_line(cli_model, file_path, 1)
         assert func is None
 
@@ -69,14 +81,14 @@ class TestFindFunctionDefAtLine:
 
 class TestFindCallSitesAtLine:
     def test_finds_call_on_correct_line(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+        file_path = PROCESS_PY
         calls = _find_call_sites_at_line(cli_model, file_path, 7)
         assert len(calls) >= 1
         callee_names = {cs.callee_name for cs in calls}
         assert "process_data" in callee_names
 
     def test_returns_empty_for_non_call_line(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+        file_path = PROCESS_PY
         calls = _find_call_sites_at_line(cli_model, file_path, 4)
         assert calls == []
 
@@ -87,106 +99,96 @@ class TestFindCallSitesAtLine:
 
 
 class TestFunctionKey:
-    def test_builds_relative_key(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
-        func = _find_function_def_at_line(cli_model, file_path, 4)
-        assert func is not None
-        key = _function_key(func, file_path, FIXTURES / "cli_scripts")
+    def test_builds_relative_key(self, main_func):
+        file_path = PROCESS_PY
+        key = _function_key(main_func, file_path, CLI_WORKSPACE)
         assert key == "process.py::main"
 
-    def test_falls_back_to_func_file_on_unrelated_path(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
-        func = _find_function_def_at_line(cli_model, file_path, 4)
-        assert func is not None
-        key = _function_key(func, file_path, Path("/unrelated/root"))
+    def test_falls_back_to_func_file_on_unrelated_path(self, main_func):
+        file_path = PROCESS_PY
+        key = _function_key(main_func, file_path, Path("/unrelated/root"))
         assert "::main" in key
 
 
 class TestGetUncaughtExceptions:
-    def test_finds_uncaught_exceptions(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
-        workspace = FIXTURES / "cli_scripts"
-        func = _find_function_def_at_line(cli_model, file_path, 4)
-        assert func is not None
+    def test_finds_uncaught_exceptions(self, cli_model, main_func):
+        file_path = PROCESS_PY
+        workspace = CLI_WORKSPACE
         propagation = propagate_exceptions(cli_model, skip_evidence=True)
-        uncaught = _get_uncaught_exceptions(func, file_path, workspace, cli_model, propagation)
+        uncaught = _get_uncaught_exceptions(main_func, file_path, workspace, cli_model, propagation)
         assert "ValueError" in uncaught
         assert "FileNotFoundError" in uncaught
 
-    def test_filters_reraise_patterns(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
-        workspace = FIXTURES / "cli_scripts"
-        func = _find_function_def_at_line(cli_model, file_path, 4)
-        assert func is not None
+    def test_filters_reraise_patterns(self, cli_model, main_func):
+        file_path = PROCESS_PY
+        workspace = CLI_WORKSPACE
         propagation = propagate_exceptions(cli_model, skip_evidence=True)
-        uncaught = _get_uncaught_exceptions(func, file_path, workspace, cli_model, propagation)
-        for pattern in RERAISE_PATTERNS:
-            assert pattern not in uncaught
+        uncaught = _get_uncaught_exceptions(main_func, file_path, workspace, cli_model, propagation)
+        assert uncaught.isdisjoint(RERAISE_PATTERNS), uncaught & RERAISE_PATTERNS
 
 
-class TestFormatDefHover:
-    def test_returns_none_when_no_exceptions(self):
-        flow = ExceptionFlow()
-        result = _format_def_hover(flow, "clean_func")
-        assert result is None
+def _flow(uncaught: tuple[str, ...] = (), caught_locally: tuple[str, ...] = ()) -> ExceptionFlow:
+    """Build an ExceptionFlow with one raise site per named exception."""
+    flow = ExceptionFlow()
+    for line, exc in enumerate(uncaught, start=1):
+        flow.uncaught[exc] = [RaiseSite("f.py", line, "func", exc, False, f"raise {exc}")]
+    for line, exc in enumerate(caught_locally, start=len(uncaught) + 1):
+        flow.caught_locally[exc] = [RaiseSite("f.py", line, "func", exc, False, f"raise {exc}")]
+    return flow
 
-    def test_returns_none_when_only_reraise_patterns(self):
-        flow = ExceptionFlow()
-        flow.uncaught["e"] = [RaiseSite("f.py", 1, "func", "e", False, "raise e")]
-        flow.uncaught["exc"] = [RaiseSite("f.py", 2, "func", "exc", False, "raise exc")]
-        result = _format_def_hover(flow, "func")
-        assert result is None
 
-    def test_shows_uncaught_exceptions(self):
-        flow = ExceptionFlow()
-        flow.uncaught["ValueError"] = [
-            RaiseSite("f.py", 1, "func", "ValueError", False, "raise ValueError()")
-        ]
+class TestFormatDefHover:
+    @pytest.mark.parametrize(
+        "flow",
+        [
+            pytest.param(_flow(), id="no-exceptions"),
+            pytest.param(_flow(uncaught=("e", "exc")), id="only-reraise-patterns"),
+        ],
+    )
+    def test_returns_none(self, flow):
+        assert _format_def_hover(flow, "func") is None
+
+    @pytest.mark.parametrize(
+        ("flow", "expected", "unexpected"),
+        [
+            pytest.param(
+                _flow(uncaught=("ValueError",)),
+                ["ValueError", "my_func", "Uncaught"],
+                [],
+                id="uncaught",
+            ),
+            pytest.param(
+                _flow(uncaught=("ValueError",), caught_locally=("KeyError",)),
+                ["ValueError", "KeyError", "Uncaught", "Caught locally"],
+                [],
+                id="multiple-categories",
+            ),
+            pytest.param(
+                _flow(uncaught=("ValueError", "e")),
+                ["ValueError"],
+                ["`e`"],
+                id="reraise-filtered-from-mixed",
+            ),
+        ],
+    )
+    def test_shows_exceptions(self, flow, expected, unexpected):
         result = _format_def_hover(flow, "my_func")
         assert result is not None
-        assert "ValueError" in result
-        assert "my_func" in result
-        assert "Uncaught" in result
-
-    def test_shows_multiple_categories(self):
-        flow = ExceptionFlow()
-        flow.uncaught["ValueError"] = [
-            RaiseSite("f.py", 1, "func", "ValueError", False, "raise ValueError()")
-        ]
-        flow.caught_locally["KeyError"] = [
-            RaiseSite("f.py", 2, "func", "KeyError", False, "raise KeyError()")
-        ]
-        result = _format_def_hover(flow, "func")
-        assert result is not None
-        assert "ValueError" in result
-        assert "KeyError" in result
-        assert "Uncaught" in result
-        assert "Caught locally" in result
-
-    def test_filters_reraise_from_mixed(self):
-        flow = ExceptionFlow()
-        flow.uncaught["ValueError"] = [
-            RaiseSite("f.py", 1, "func", "ValueError", False, "raise ValueError()")
-        ]
-        flow.uncaught["e"] = [RaiseSite("f.py", 2, "func", "e", False, "raise e")]
-        result = _format_def_hover(flow, "func")
-        assert result is not None
-        assert "ValueError" in result
-        assert "`e`" not in result
+        for text in expected:
+            assert text in result
+        for text in unexpected:
+            assert text not in result
 
 
 class TestFormatCallHover:
-    def test_shows_callee_exceptions(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+    def test_shows_callee_exceptions(self, cli_model, main_calls):
         propagation = propagate_exceptions(cli_model, skip_evidence=True)
-        calls = _find_call_sites_at_line(cli_model, file_path, 7)
-        assert len(calls) >= 1
-        result = _format_call_hover(calls, propagation, cli_model)
+        result = _format_call_hover(main_calls, propagation, cli_model)
         assert result is not None
         assert "FileNotFoundError" in result
 
     def test_returns_none_for_no_exceptions(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+        file_path = PROCESS_PY
         propagation = propagate_exceptions(cli_model, skip_evidence=True)
         calls = _find_call_sites_at_line(cli_model, file_path, 5)
         result = _format_call_hover(calls, propagation, cli_model)
@@ -196,35 +198,27 @@ class TestFormatCallHover:
 class TestHoverContextSensitive:
     """Integration tests verifying the three-way hover dispatch logic."""
 
-    def test_def_line_returns_exception_flow(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
-        workspace = FIXTURES / "cli_scripts"
-        func = _find_function_def_at_line(cli_model, file_path, 4)
-        assert func is not None
+    def test_def_line_returns_exception_flow(self, cli_model, main_func):
+        file_path = PROCESS_PY
+        workspace = CLI_WORKSPACE
 
         propagation = propagate_exceptions(cli_model, skip_evidence=True)
-        from bubble.propagation import compute_exception_flow
-
-        function_key = _function_key(func, file_path, workspace)
+        function_key = _function_key(main_func, file_path, workspace)
         flow = compute_exception_flow(function_key, cli_model, propagation)
-        hover_text = _format_def_hover(flow, func.qualified_name)
+        hover_text = _format_def_hover(flow, main_func.qualified_name)
         assert hover_text is not None
         assert "ValueError" in hover_text
         assert "FileNotFoundError" in hover_text
 
-    def test_call_line_returns_callee_exceptions(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
-        calls = _find_call_sites_at_line(cli_model, file_path, 7)
-        assert len(calls) >= 1
-
+    def test_call_line_returns_callee_exceptions(self, cli_model, main_calls):
         propagation = propagate_exceptions(cli_model, skip_evidence=True)
-        result = _format_call_hover(calls, propagation, cli_model)
+        result = _format_call_hover(main_calls, propagation, cli_model)
         assert result is not None
         assert "process_data" in result
         assert "FileNotFoundError" in result
 
     def test_blank_line_returns_nothing(self, cli_model):
-        file_path = FIXTURES / "cli_scripts" / "process.py"
+        file_path = PROCESS_PY
         func = _find_function_def_at_line(cli_model, file_path, 1)
         assert func is None
         calls = _find_call_sites_at_line(cli_model, file_path, 1)
@@ -308,71 +302,72 @@ class TestFindRouteDecoratorRange:
         propagation = propagate_exceptions(flask_model, skip_evidence=True)
 
         for func in flask_model.functions.values():
-            fp = workspace / func.file.split("/")[-1] if "/" in func.file else Path(func.file)
+            fp = workspace / Path(func.file).name
             uncaught = _get_uncaught_exceptions(func, fp, workspace, flask_model, propagation)
-            for exc in uncaught:
-                assert exc not in RERAISE_PATTERNS
+            assert uncaught.isdisjoint(RERAISE_PATTERNS), uncaught & RERAISE_PATTERNS
 
 
 class TestParseIgnoreComment:
     """Tests for the # bubble: ignore comment parsing."""
 
-    def test_blanket_ignore_on_decorator(self):
-        source_lines = [
-            "@app.route('/users')  # bubble: ignore",
-            "def create_user():",
-        ]
-        result = _parse_ignore_comment(source_lines, 0, 2)
-        assert result is True
-
-    def test_blanket_ignore_on_def_line(self):
-        source_lines = [
-            "@app.route('/users')",
-            "def create_user():  # bubble: ignore",
-        ]
-        result = _parse_ignore_comment(source_lines, 0, 2)
-        assert result is True
-
-    def test_selective_ignore_single_type(self):
-        source_lines = [
-            "@app.route('/users')  # bubble: ignore[ValueError]",
-            "def create_user():",
-        ]
-        result = _parse_ignore_comment(source_lines, 0, 2)
-        assert result == {"ValueError"}
-
-    def test_selective_ignore_multiple_types(self):
-        source_lines = [
-            "@app.route('/users')  # bubble: ignore[ValueError, KeyError]",
-            "def create_user():",
-        ]
-        result = _parse_ignore_comment(source_lines, 0, 2)
-        assert result == {"ValueError", "KeyError"}
-
-    def test_ignore_between_decorator_and_def(self):
-        source_lines = [
-            "@app.route('/users')",
-            "@login_required  # bubble: ignore[HTTPException]",
-            "def create_user():",
-        ]
-        result = _parse_ignore_comment(source_lines, 0, 3)
-        assert result == {"HTTPException"}
-
-    def test_no_ignore_returns_false(self):
-        source_lines = [
-            "@app.route('/users')",
-            "def create_user():",
-        ]
-        result = _parse_ignore_comment(source_lines, 0, 2)
-        assert result is False
-
-    def test_unrelated_comment_not_matched(self):
-        source_lines = [
-            "@app.route('/users')  # TODO: fix this",
-            "def create_user():",
-        ]
-        result = _parse_ignore_comment(source_lines, 0, 2)
-        assert result is False
+    @pytest.mark.parametrize(
+        ("source_lines", "def_line", "expected"),
+        [
+            pytest.param(
+                ["@app.route('/users')  # bubble: ignore", "def create_user():"],
+                2,
+                True,
+                id="blanket-ignore-on-decorator",
+            ),
+            pytest.param(
+                ["@app.route('/users')", "def create_user():  # bubble: ignore"],
+                2,
+                True,
+                id="blanket-ignore-on-def-line",
+            ),
+            pytest.param(
+                ["@app.route('/users')  # bubble: ignore[ValueError]", "def create_user():"],
+                2,
+                {"ValueError"},
+                id="selective-ignore-single-type",
+            ),
+            pytest.param(
+                [
+                    "@app.route('/users')  # bubble: ignore[ValueError, KeyError]",
+                    "def create_user():",
+                ],
+                2,
+                {"ValueError", "KeyError"},
+                id="selective-ignore-multiple-types",
+            ),
+            pytest.param(
+                [
+                    "@app.route('/users')",
+                    "@login_required  # bubble: ignore[HTTPException]",
+                    "def create_user():",
+                ],
+                3,
+                {"HTTPException"},
+                id="ignore-between-decorator-and-def",
+            ),
+            pytest.param(
+                ["@app.route('/users')", "def create_user():"],
+                2,
+                False,
+                id="no-ignore-returns-false",
+            ),
+            pytest.param(
+                ["@app.route('/users')  # TODO: fix this", "def create_user():"],
+                2,
+                False,
+                id="unrelated-comment-not-matched",
+            ),
+        ],
+    )
+    def test_parse_ignore_comment(self, source_lines, def_line, expected):
+        result = _parse_ignore_comment(source_lines, 0, def_line)
+        assert result == expected
+        assert type(result) is type(expected)
 
     def test_selective_removes_from_uncaught(self):
         """Selective ignore should only suppress listed types."""
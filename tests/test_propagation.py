@@ -4,30 +4,35 @@ These are the only unit tests - for the complex fixed-point iteration logic
 that is hard to exercise end-to-end.
 """
 
+import gc
 from pathlib import Path
 
+import pytest
+
+from bubble import propagation
 from bubble.extractor import extract_from_directory
-from bubble.propagation import compute_direct_raises, propagate_exceptions
+from bubble.models import ClassDef, ClassHierarchy
+from bubble.propagation import (
+    compute_direct_raises,
+    expand_polymorphic_call,
+    propagate_exceptions,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-def test_direct_raises_found():
+def test_direct_raises_found(flask_model):
     """Direct raises are identified correctly."""
-    model = extract_from_directory(FIXTURES / "flask_app", use_cache=False)
-
-    direct = compute_direct_raises(model)
+    direct = compute_direct_raises(flask_model)
 
     functions_that_raise = {func for func in direct if direct[func]}
-    assert "validate_input" in str(functions_that_raise)
-    assert "get_user" in str(functions_that_raise)
+    assert "app.py::validate_input" in functions_that_raise
+    assert "app.py::get_user" in functions_that_raise
 
 
-def test_propagation_through_call():
+def test_propagation_through_call(cli_model):
     """Exceptions propagate through call chain."""
-    model = extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
-
-    result = propagate_exceptions(model)
+    result = propagate_exceptions(cli_model)
 
     main_exceptions = set()
     for func, exceptions in result.propagated_raises.items():
@@ -38,11 +43,9 @@ def test_propagation_through_call():
     assert "FileNotFoundError" in main_exceptions
 
 
-def test_exception_hierarchy_subclass():
+def test_exception_hierarchy_subclass(hierarchy_model):
     """Exception hierarchy correctly identifies subclasses."""
-    model = extract_from_directory(FIXTURES / "exception_hierarchy", use_cache=False)
-
-    hierarchy = model.exception_hierarchy
+    hierarchy = hierarchy_model.exception_hierarchy
 
     assert hierarchy.is_subclass_of("ValidationError", "ClientError")
     assert hierarchy.is_subclass_of("ValidationError", "BaseAppError")
@@ -50,11 +53,9 @@ def test_exception_hierarchy_subclass():
     assert not hierarchy.is_subclass_of("ValidationError", "ServerError")
 
 
-def test_get_subclasses():
+def test_get_subclasses(hierarchy_model):
     """Get all subclasses of a base exception."""
-    model = extract_from_directory(FIXTURES / "exception_hierarchy", use_cache=False)
-
-    hierarchy = model.exception_hierarchy
+    hierarchy = hierarchy_model.exception_hierarchy
     subclasses = hierarchy.get_subclasses("BaseAppError")
 
     assert "ClientError" in subclasses
@@ -62,3 +63,86 @@ def test_get_subclasses():
     assert "ValidationError" in subclasses
     assert "AuthError" in subclasses
     assert "DatabaseError" in subclasses
+
+
+def test_expand_polymorphic_call_matches_exact_class():
+    """Implementations resolve to their own class, not one whose name contains it."""
+    hierarchy = ClassHierarchy()
+    hierarchy.add_class(
+        ClassDef(
+            name="Handler",
+            qualified_name="h.py::Handler",
+            file="h.py",
+            line=1,
+            is_abstract=True,
+            abstract_methods={"handle"},
+        )
+    )
+    hierarchy.add_class(
+        ClassDef(name="Json", qualified_name="h.py::Json", file="h.py", line=5, bases=["Handler"])
+    )
+    method_to_qualified = {"handle": ["h.py::JsonStream.handle", "h.py::Json.handle"]}
+
+    expanded = expand_polymorphic_call("Handler.handle", hierarchy, method_to_qualified)
+
+    assert expanded == ["h.py::Json.handle"]
+
+
+@pytest.mark.usefixtures("clear_propagation")
+def test_propagation_cache_released_with_model():
+    """Cached results are dropped once their model is garbage collected."""
+    model = extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
+    first = propagate_exceptions(model)
+
+    assert propagate_exceptions(model) is first
+
+    del model, first
+    gc.collect()
+
+    assert propagation._propagation_cache == {}
+
+
+@pytest.mark.usefixtures("clear_propagation")
+def test_scoped_propagation_not_cached():
+    """Scoped runs are recomputed each time and leave the cached full result in place."""
+    model = extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
+    scope = {next(iter(model.functions))}
+    full = propagate_exceptions(model)
+    scoped = propagate_exceptions(model, scope=scope)
+
+    assert propagate_exceptions(model, scope=scope) is not scoped
+    assert len(propagation._propagation_cache) == 1
+    assert propagate_exceptions(model) is full
+
+
+def test_decompose_memo_is_bounded_and_cleared(cli_model):
+    """Key decomposition is memoized in a bounded cache that clear_propagation_cache resets."""
+    propagate_exceptions(cli_model, skip_evidence=True, scope=set(cli_model.functions))
+
+    assert propagation._decompose.cache_info().maxsize is not None
+    assert propagation._decompose.cache_info().currsize > 0
+
+    propagation.clear_propagation_cache()
+
+    assert propagation._decompose.cache_info().currsize == 0
+
+
+def test_resolved_callee_does_not_keep_name_fallback_raises(tmp_path: Path):
+    """A resolved callee that only gains raises later never adds a same-named function's raises."""
+    (tmp_path / "app.py").write_text(
+        "class Handler:\n"
+        "    def handle(self):\n"
+        "        self.load()\n\n"
+        "    def load(self):\n"
+        "        self._read()\n\n"
+        "    def _read(self):\n"
+        "        raise KeyError('missing')\n"
+    )
+    (tmp_path / "other.py").write_text(
+        "class Other:\n    def load(self):\n        raise ValueError('bad')\n"
+    )
+    model = extract_from_directory(tmp_path, use_cache=False)
+
+    result = propagate_exceptions(model)
+
+    assert result.propagated_raises["app.py::Handler.handle"] == {"KeyError"}
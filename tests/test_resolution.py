@@ -1,9 +1,35 @@
 """Tests for call resolution improvements."""
 
+import pytest
+
 from bubble.enums import ConfidenceLevel, ResolutionKind
-from bubble.models import ProgramModel, ResolutionEdge, compute_confidence
+from bubble.models import CallSite, ProgramModel, ResolutionEdge, compute_confidence
 from bubble.propagation import compute_direct_raises, propagate_exceptions
 
+CallerCalls = dict[str, list[CallSite]]
+
+
+@pytest.fixture(scope="module")
+def caller_calls(resolution_model: ProgramModel) -> CallerCalls:
+    """Call sites made by caller() in the resolution fixture, grouped by callee name."""
+    calls: CallerCalls = {}
+    for cs in resolution_model.call_sites:
+        if cs.caller_function != "caller":
+            continue
+        if cs.callee_name not in calls:
+            calls[cs.callee_name] = []
+        calls[cs.callee_name].append(cs)
+    return calls
+
+
+@pytest.fixture(scope="module")
+def caller_exceptions(resolution_model: ProgramModel) -> frozenset[str]:
+    """Exceptions propagated to caller() in the resolution fixture."""
+    propagated = propagate_exceptions(resolution_model).propagated_raises
+    caller_key = next((key for key in propagated if key.endswith("::caller")), None)
+    assert caller_key is not None, "Should find caller in propagated_raises"
+    return frozenset(propagated[caller_key])
+
 
 class TestCanonicalNaming:
     """Tests for canonical path::Class.method naming across all data structures."""
@@ -31,15 +57,13 @@ class TestCanonicalNaming:
         assert not rs.file.startswith("/"), f"RaiseSite.file should be relative, got '{rs.file}'"
         assert rs.file == "services.py", f"RaiseSite.file should be 'services.py', got '{rs.file}'"
 
-    def test_direct_raises_key_matches_callee_qualified(self, resolution_model: ProgramModel):
+    def test_direct_raises_key_matches_callee_qualified(
+        self, resolution_model: ProgramModel, caller_calls: CallerCalls
+    ):
         """compute_direct_raises keys should match CallSite.callee_qualified format."""
         direct = compute_direct_raises(resolution_model)
 
-        process_call = next(
-            cs
-            for cs in resolution_model.call_sites
-            if cs.callee_name == "process" and cs.caller_function == "caller"
-        )
+        process_call = caller_calls["process"][0]
 
         assert process_call.callee_qualified is not None
 
@@ -57,27 +81,16 @@ class TestMethodExceptionPropagation:
     """Tests for exception propagation through constructor-resolved method calls."""
 
     def test_runtime_error_propagates_through_constructor_call(
-        self, resolution_model: ProgramModel
+        self, caller_exceptions: frozenset[str]
     ):
         """RuntimeError from ServiceA.process() should propagate to caller()."""
-        propagation = propagate_exceptions(resolution_model)
-
-        caller_key = None
-        for key in propagation.propagated_raises:
-            if key.endswith("::caller"):
-                caller_key = key
-                break
-
-        assert caller_key is not None, "Should find caller in propagated_raises"
-        caller_exceptions = propagation.propagated_raises.get(caller_key, set())
-
         assert "RuntimeError" in caller_exceptions, (
             f"RuntimeError should propagate from ServiceA.process() to caller(), "
             f"but caller only has: {caller_exceptions}"
         )
 
     def test_exceptions_do_not_leak_between_same_named_methods(
-        self, resolution_model: ProgramModel
+        self, caller_exceptions: frozenset[str]
     ):
         """OSError from ServiceB.process() should NOT leak to caller() which uses ServiceA.
 
@@ -85,17 +98,6 @@ class TestMethodExceptionPropagation:
         only RuntimeError from ServiceA should propagate, not OSError from ServiceB.process().
         Without proper normalization, name-based fallback matches ALL .process() methods.
         """
-        propagation = propagate_exceptions(resolution_model)
-
-        caller_key = None
-        for key in propagation.propagated_raises:
-            if key.endswith("::caller"):
-                caller_key = key
-                break
-
-        assert caller_key is not None, "Should find caller in propagated_raises"
-        caller_exceptions = propagation.propagated_raises.get(caller_key, set())
-
         assert "OSError" not in caller_exceptions, (
             f"OSError from ServiceB.process() should NOT leak to caller() which uses ServiceA, "
             f"but caller has: {caller_exceptions}"
@@ -105,26 +107,18 @@ class TestMethodExceptionPropagation:
 class TestModuleAttributeResolution:
     """Tests for module attribute resolution (e.g., requests.get())."""
 
-    def test_requests_get_resolved(self, resolution_model: ProgramModel):
+    def test_requests_get_resolved(self, caller_calls: CallerCalls):
         """Module attribute calls should be resolved via import map."""
-        call_sites = [
-            cs
-            for cs in resolution_model.call_sites
-            if cs.callee_name == "get" and cs.caller_function == "caller"
-        ]
+        call_sites = caller_calls["get"]
 
         assert len(call_sites) >= 1
         call_site = call_sites[0]
         assert call_site.resolution_kind == ResolutionKind.MODULE_ATTRIBUTE
         assert call_site.callee_qualified == "requests.get"
 
-    def test_module_call_not_marked_as_method(self, resolution_model: ProgramModel):
+    def test_module_call_not_marked_as_method(self, caller_calls: CallerCalls):
         """Module attribute calls should not be marked as method calls."""
-        call_sites = [
-            cs
-            for cs in resolution_model.call_sites
-            if cs.callee_name == "get" and cs.caller_function == "caller"
-        ]
+        call_sites = caller_calls["get"]
 
         assert len(call_sites) >= 1
         call_site = call_sites[0]
@@ -134,23 +128,15 @@ class TestModuleAttributeResolution:
 class TestFallbackSeparation:
     """Tests for separating methods from functions in fallback lookup."""
 
-    def test_method_does_not_match_function(self, resolution_model: ProgramModel):
+    def test_method_does_not_match_function(self, caller_calls: CallerCalls):
         """Method calls should not match function definitions in fallback."""
-        call_sites = [
-            cs
-            for cs in resolution_model.call_sites
-            if cs.callee_name == "process" and cs.caller_function == "caller"
-        ]
+        call_sites = caller_calls["process"]
         assert len(call_sites) >= 1
         process_call = call_sites[0]
 
         assert process_call.is_method_call is True
 
-        func_call_sites = [
-            cs
-            for cs in resolution_model.call_sites
-            if cs.callee_name == "helper_func" and cs.caller_function == "caller"
-        ]
+        func_call_sites = caller_calls["helper_func"]
         assert len(func_call_sites) >= 1
         helper_call = func_call_sites[0]
 
@@ -160,80 +146,56 @@ class TestFallbackSeparation:
 class TestMatchCountAndConfidence:
     """Tests for match_count tracking and confidence computation."""
 
-    def test_compute_confidence_high_for_resolved_calls(self):
-        """High confidence when no fallback is used."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.IMPORT,
-                is_heuristic=False,
-                match_count=1,
+    @pytest.mark.parametrize(
+        ("kind", "is_heuristic", "match_count", "expected"),
+        [
+            pytest.param(
+                ResolutionKind.IMPORT, False, 1, ConfidenceLevel.HIGH, id="resolved-call-high"
             ),
-        ]
-        assert compute_confidence(edges) == ConfidenceLevel.HIGH
-
-    def test_compute_confidence_high_for_module_attribute(self):
-        """High confidence for MODULE_ATTRIBUTE resolution."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="requests.get",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.MODULE_ATTRIBUTE,
-                is_heuristic=False,
-                match_count=1,
+            pytest.param(
+                ResolutionKind.MODULE_ATTRIBUTE,
+                False,
+                1,
+                ConfidenceLevel.HIGH,
+                id="module-attribute-high",
             ),
-        ]
-        assert compute_confidence(edges) == ConfidenceLevel.HIGH
-
-    def test_unambiguous_fallback_is_medium_confidence(self):
-        """Medium confidence when fallback has exactly one match."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.NAME_FALLBACK,
-                is_heuristic=True,
-                match_count=1,
+            pytest.param(
+                ResolutionKind.NAME_FALLBACK,
+                True,
+                1,
+                ConfidenceLevel.MEDIUM,
+                id="unambiguous-fallback-medium",
             ),
-        ]
-        assert compute_confidence(edges) == ConfidenceLevel.MEDIUM
-
-    def test_ambiguous_fallback_is_low_confidence(self):
-        """Low confidence when fallback has multiple matches."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.NAME_FALLBACK,
-                is_heuristic=True,
-                match_count=3,
+            pytest.param(
+                ResolutionKind.NAME_FALLBACK,
+                True,
+                3,
+                ConfidenceLevel.LOW,
+                id="ambiguous-fallback-low",
             ),
-        ]
-        assert compute_confidence(edges) == ConfidenceLevel.LOW
-
-    def test_polymorphic_is_low_confidence(self):
-        """Low confidence when polymorphic resolution is used."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.POLYMORPHIC,
-                is_heuristic=True,
-                match_count=1,
+            pytest.param(
+                ResolutionKind.POLYMORPHIC, True, 1, ConfidenceLevel.LOW, id="polymorphic-low"
             ),
-        ]
-        assert compute_confidence(edges) == ConfidenceLevel.LOW
+        ],
+    )
+    def test_compute_confidence_for_single_edge(
+        self,
+        kind: ResolutionKind,
+        is_heuristic: bool,
+        match_count: int,
+        expected: ConfidenceLevel,
+    ):
+        """Confidence of a one-edge path follows its resolution kind and match count."""
+        edge = ResolutionEdge(
+            caller="a",
+            callee="b",
+            file="f.py",
+            line=1,
+            resolution_kind=kind,
+            is_heuristic=is_heuristic,
+            match_count=match_count,
+        )
+        assert compute_confidence([edge]) == expected
 
     def test_empty_path_is_high_confidence(self):
         """High confidence for empty path (direct raise)."""
@@ -243,47 +205,21 @@ class TestMatchCountAndConfidence:
 class TestScopedFallback:
     """Tests for scoped fallback search prioritization."""
 
-    def test_same_file_takes_priority(self, resolution_model: ProgramModel):
+    def test_same_file_takes_priority(self, caller_exceptions: frozenset[str]):
         """Same-file matches should take priority over other matches."""
-        propagation = propagate_exceptions(resolution_model)
-
-        caller_key = None
-        for key in propagation.propagated_raises:
-            if key.endswith("::caller"):
-                caller_key = key
-                break
-
-        assert caller_key is not None
-
-        caller_exceptions = propagation.propagated_raises.get(caller_key, set())
         assert "TypeError" in caller_exceptions
 
-    def test_direct_import_takes_priority(self, resolution_model: ProgramModel):
+    def test_direct_import_takes_priority(self, caller_exceptions: frozenset[str]):
         """Directly imported functions should take priority over project-wide matches."""
-        propagation = propagate_exceptions(resolution_model)
-
-        caller_key = None
-        for key in propagation.propagated_raises:
-            if key.endswith("::caller"):
-                caller_key = key
-                break
-
-        assert caller_key is not None
-        caller_exceptions = propagation.propagated_raises.get(caller_key, set())
-
         assert "ValueError" in caller_exceptions
 
 
 class TestConstructorResolution:
     """Tests for constructor tracking resolution."""
 
-    def test_constructor_call_resolved(self, resolution_model: ProgramModel):
+    def test_constructor_call_resolved(self, caller_calls: CallerCalls):
         """Constructor calls should be resolved."""
-        call_sites = [
-            cs
-            for cs in resolution_model.call_sites
-            if cs.callee_name == "process" and cs.caller_function == "caller"
-        ]
+        call_sites = caller_calls["process"]
 
         assert len(call_sites) >= 1
         call_site = call_sites[0]
@@ -294,13 +230,9 @@ class TestConstructorResolution:
 class TestImportResolution:
     """Tests for import resolution."""
 
-    def test_imported_function_resolved(self, resolution_model: ProgramModel):
+    def test_imported_function_resolved(self, caller_calls: CallerCalls):
         """Imported functions should be resolved via import map."""
-        call_sites = [
-            cs
-            for cs in resolution_model.call_sites
-            if cs.callee_name == "helper_func" and cs.caller_function == "caller"
-        ]
+        call_sites = caller_calls["helper_func"]
 
         assert len(call_sites) >= 1
         call_site = call_sites[0]
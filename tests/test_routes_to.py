@@ -5,15 +5,55 @@ back to entrypoints. This was a bug where routes-to would fail to find
 connections that audit found successfully.
 """
 
+import pytest
+
+from bubble.integrations.base import Entrypoint
 from bubble.integrations.flask import FlaskIntegration
+from bubble.integrations.models import RoutesToResult
 from bubble.integrations.queries import trace_routes_to_exception
 from bubble.models import ProgramModel
 
 
+@pytest.fixture(scope="module")
+def flask_integration() -> FlaskIntegration:
+    """One Flask integration shared by the module's traces."""
+    return FlaskIntegration()
+
+
+@pytest.fixture(scope="module")
+def flask_routes(flask_model: ProgramModel) -> list[Entrypoint]:
+    """HTTP route entrypoints of the flask_app fixture."""
+    return [e for e in flask_model.entrypoints if e.kind == "http_route"]
+
+
+@pytest.fixture(scope="module")
+def validation_error_trace(
+    flask_model: ProgramModel,
+    flask_integration: FlaskIntegration,
+    flask_routes: list[Entrypoint],
+) -> RoutesToResult:
+    """Routes-to result for ValidationError, traced once for the module."""
+    return trace_routes_to_exception(
+        flask_model,
+        flask_integration,
+        flask_routes,
+        "ValidationError",
+        include_subclasses=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def validation_error_routes(validation_error_trace: RoutesToResult) -> set[str]:
+    """Entrypoint functions that ValidationError was traced back to."""
+    return {ep.function for trace in validation_error_trace.traces for ep in trace.entrypoints}
+
+
 class TestRoutesToTracesCallChains:
     """Test that routes-to finds exceptions that propagate through helper functions."""
 
-    def test_routes_to_finds_indirect_exception(self, flask_model: ProgramModel) -> None:
+    def test_routes_to_finds_indirect_exception(
+        self, validation_error_trace: RoutesToResult, validation_error_routes: set[str]
+    ) -> None:
         """Routes-to should find exceptions raised in helper functions called by routes.
 
         In flask_app fixture:
@@ -21,59 +61,28 @@ class TestRoutesToTracesCallChains:
         - validate_input() raises ValidationError
         - routes-to ValidationError should find create_user route
         """
-        integration = FlaskIntegration()
-        entrypoints = [e for e in flask_model.entrypoints if e.kind == "http_route"]
-
-        result = trace_routes_to_exception(
-            flask_model,
-            integration,
-            entrypoints,
-            "ValidationError",
-            include_subclasses=False,
-        )
-
-        assert len(result.traces) > 0, "Should find at least one raise site"
-
-        entrypoint_functions_found = set()
-        for trace in result.traces:
-            for ep in trace.entrypoints:
-                entrypoint_functions_found.add(ep.function)
-
-        assert "create_user" in entrypoint_functions_found, (
+        assert len(validation_error_trace.traces) > 0, "Should find at least one raise site"
+        assert "create_user" in validation_error_routes, (
             "Should trace ValidationError back to create_user route"
         )
 
-    def test_routes_to_finds_direct_exception(self, flask_model: ProgramModel) -> None:
+    def test_routes_to_finds_direct_exception(self, validation_error_routes: set[str]) -> None:
         """Routes-to should also find exceptions raised directly in routes."""
-        integration = FlaskIntegration()
-        entrypoints = [e for e in flask_model.entrypoints if e.kind == "http_route"]
-
-        result = trace_routes_to_exception(
-            flask_model,
-            integration,
-            entrypoints,
-            "ValidationError",
-            include_subclasses=False,
-        )
-
-        entrypoint_functions_found = set()
-        for trace in result.traces:
-            for ep in trace.entrypoints:
-                entrypoint_functions_found.add(ep.function)
-
-        assert "get_user" in entrypoint_functions_found, (
+        assert "get_user" in validation_error_routes, (
             "Should find ValidationError raised directly in get_user route"
         )
 
-    def test_routes_to_with_subclasses(self, flask_model: ProgramModel) -> None:
+    def test_routes_to_with_subclasses(
+        self,
+        flask_model: ProgramModel,
+        flask_integration: FlaskIntegration,
+        flask_routes: list[Entrypoint],
+    ) -> None:
         """Routes-to should find subclasses when include_subclasses=True."""
-        integration = FlaskIntegration()
-        entrypoints = [e for e in flask_model.entrypoints if e.kind == "http_route"]
-
         result = trace_routes_to_exception(
             flask_model,
-            integration,
-            entrypoints,
+            flask_integration,
+            flask_routes,
             "AppError",
             include_subclasses=True,
         )
@@ -102,10 +111,10 @@ class TestRoutesToCLI:
         data = run_cli_json("flask", "routes-to", "ValidationError")
         assert "results" in data
 
-        found_create_user = False
-        for result in data["results"]:
-            for ep in result.get("entrypoints", []):
-                if ep.get("function") == "create_user":
-                    found_create_user = True
+        found_create_user = any(
+            ep.get("function") == "create_user"
+            for result in data["results"]
+            for ep in result.get("entrypoints", [])
+        )
 
         assert found_create_user, f"Should find create_user in JSON output: {data}"
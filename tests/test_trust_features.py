@@ -2,15 +2,44 @@
 
 from pathlib import Path
 
+import msgpack  # type: ignore[import-untyped]
+import pytest
+
 from bubble.config import FlowConfig, load_config
 from bubble.detectors import FRAMEWORK_EXCEPTION_RESPONSES
 from bubble.enums import ConfidenceLevel, ResolutionKind, ResolutionMode
 from bubble.extractor import extract_from_directory
-from bubble.models import ResolutionEdge, compute_confidence
-from bubble.propagation import propagate_exceptions
-from bubble.stubs import load_stubs, validate_stub_file
+from bubble.models import ProgramModel, ResolutionEdge, compute_confidence
+from bubble.propagation import PropagationResult, propagate_exceptions
+from bubble.stubs import STUB_CACHE_FILENAME, StubLibrary, load_stubs, validate_stub_file
 
 FIXTURES = Path(__file__).parent / "fixtures"
+BUILTIN_STUB_FILES = sorted((Path(__file__).parent.parent / "bubble" / "stubs").glob("*.yaml"))
+
+
+def _edge(kind: ResolutionKind, is_heuristic: bool = False, match_count: int = 1) -> ResolutionEdge:
+    """A call edge whose confidence depends only on how it was resolved."""
+    return ResolutionEdge(
+        caller="a",
+        callee="b",
+        file="f.py",
+        line=1,
+        resolution_kind=kind,
+        is_heuristic=is_heuristic,
+        match_count=match_count,
+    )
+
+
+@pytest.fixture(scope="module")
+def stub_library() -> StubLibrary:
+    """Built-in stubs, parsed once for the module."""
+    return load_stubs(Path("."), use_cache=False)
+
+
+@pytest.fixture(scope="module")
+def cli_propagation(cli_model: ProgramModel) -> PropagationResult:
+    """Default-mode propagation over the cli_scripts fixture."""
+    return propagate_exceptions(cli_model)
 
 
 class TestResolutionEdgeAndConfidence:
@@ -18,152 +47,192 @@ class TestResolutionEdgeAndConfidence:
 
     def test_compute_confidence_high(self):
         """High confidence when all resolutions are precise."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.IMPORT,
-                is_heuristic=False,
-            ),
-            ResolutionEdge(
-                caller="b",
-                callee="c",
-                file="f.py",
-                line=2,
-                resolution_kind=ResolutionKind.SELF,
-                is_heuristic=False,
-            ),
-        ]
+        edges = [_edge(ResolutionKind.IMPORT), _edge(ResolutionKind.SELF)]
         assert compute_confidence(edges) == ConfidenceLevel.HIGH
 
     def test_compute_confidence_medium(self):
         """Medium confidence when return_type resolution is used."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.RETURN_TYPE,
-                is_heuristic=False,
-            ),
-        ]
+        edges = [_edge(ResolutionKind.RETURN_TYPE)]
         assert compute_confidence(edges) == ConfidenceLevel.MEDIUM
 
     def test_compute_confidence_medium_unambiguous_name_fallback(self):
         """Medium confidence when unambiguous name_fallback is used (match_count=1)."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.NAME_FALLBACK,
-                is_heuristic=True,
-                match_count=1,
-            ),
-        ]
+        edges = [_edge(ResolutionKind.NAME_FALLBACK, is_heuristic=True, match_count=1)]
         assert compute_confidence(edges) == ConfidenceLevel.MEDIUM
 
     def test_compute_confidence_low_ambiguous_name_fallback(self):
         """Low confidence when ambiguous name_fallback is used (match_count>1)."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.NAME_FALLBACK,
-                is_heuristic=True,
-                match_count=3,
-            ),
-        ]
+        edges = [_edge(ResolutionKind.NAME_FALLBACK, is_heuristic=True, match_count=3)]
         assert compute_confidence(edges) == ConfidenceLevel.LOW
 
     def test_compute_confidence_low_polymorphic(self):
         """Low confidence when polymorphic resolution is used."""
-        edges = [
-            ResolutionEdge(
-                caller="a",
-                callee="b",
-                file="f.py",
-                line=1,
-                resolution_kind=ResolutionKind.POLYMORPHIC,
-                is_heuristic=True,
-            ),
-        ]
+        edges = [_edge(ResolutionKind.POLYMORPHIC, is_heuristic=True)]
         assert compute_confidence(edges) == ConfidenceLevel.LOW
 
     def test_compute_confidence_empty_path(self):
         """High confidence for empty path (direct raise)."""
         assert compute_confidence([]) == ConfidenceLevel.HIGH
 
+    def test_compute_confidence_low_after_medium(self):
+        """A later low-confidence edge outranks an earlier medium one."""
+        edges = [
+            _edge(ResolutionKind.RETURN_TYPE),
+            _edge(ResolutionKind.POLYMORPHIC, is_heuristic=True),
+        ]
+        assert compute_confidence(edges) == ConfidenceLevel.LOW
+
 
 class TestResolutionModes:
     """Tests for resolution mode filtering."""
 
-    def test_strict_mode_filters_heuristics(self):
+    def test_strict_mode_filters_heuristics(
+        self, cli_model: ProgramModel, cli_propagation: PropagationResult
+    ):
         """Strict mode filters out heuristic-based resolutions."""
-        model = extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
+        strict_result = propagate_exceptions(cli_model, resolution_mode=ResolutionMode.STRICT)
 
-        default_result = propagate_exceptions(model, resolution_mode=ResolutionMode.DEFAULT)
-        strict_result = propagate_exceptions(model, resolution_mode=ResolutionMode.STRICT)
-
-        default_total = sum(len(excs) for excs in default_result.propagated_raises.values())
-        strict_total = sum(len(excs) for excs in strict_result.propagated_raises.values())
+        default_total = sum(map(len, cli_propagation.propagated_raises.values()))
+        strict_total = sum(map(len, strict_result.propagated_raises.values()))
 
         assert strict_total <= default_total
 
-    def test_default_mode_includes_fallback(self):
+    def test_strict_mode_skips_stubs_for_name_fallback_calls(self, tmp_path: Path):
+        """Strict mode drops a call that resolves by name fallback instead of using its stub."""
+        (tmp_path / "app.py").write_text(
+            "import requests\n\n\ndef fetch():\n    return requests.get('http://x')\n"
+        )
+        (tmp_path / "other.py").write_text("def get():\n    raise KeyError('x')\n")
+        model = extract_from_directory(tmp_path, use_cache=False)
+        stubs = load_stubs(tmp_path, use_cache=False)
+
+        default_result = propagate_exceptions(model, stub_library=stubs)
+        strict_result = propagate_exceptions(
+            model, resolution_mode=ResolutionMode.STRICT, stub_library=stubs
+        )
+
+        assert default_result.propagated_raises["app.py::fetch"] == {"KeyError"}
+        assert strict_result.propagated_raises["app.py::fetch"] == set()
+
+    def test_stub_raises_propagate_without_evidence(self, tmp_path: Path):
+        """A call only covered by a stub propagates the stub's raises and records no evidence."""
+        (tmp_path / "app.py").write_text(
+            "import requests\n\n\ndef fetch():\n    return requests.get('http://x')\n"
+        )
+        model = extract_from_directory(tmp_path, use_cache=False)
+        stubs = load_stubs(tmp_path, use_cache=False)
+
+        result = propagate_exceptions(model, stub_library=stubs)
+
+        assert result.propagated_raises["app.py::fetch"] == set(stubs.get_raises("requests", "get"))
+        assert result.propagated_with_evidence["app.py::fetch"] == {}
+
+    def test_default_mode_includes_fallback(self, cli_propagation: PropagationResult):
         """Default mode includes name_fallback resolutions."""
-        model = extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
-        result = propagate_exceptions(model, resolution_mode=ResolutionMode.DEFAULT)
-
-        has_propagation = any(excs for excs in result.propagated_raises.values() if excs)
+        has_propagation = any(cli_propagation.propagated_raises.values())
         assert has_propagation
 
 
 class TestStubLibrary:
     """Tests for exception stub loading."""
 
-    def test_load_builtin_stubs(self):
+    def test_load_builtin_stubs(self, stub_library: StubLibrary):
         """Built-in stubs are loaded correctly."""
-        library = load_stubs(Path("."))
+        assert "requests" in stub_library.modules()
+        assert "sqlalchemy" in stub_library.modules()
+        assert "boto3" in stub_library.modules()
 
-        assert "requests" in library.stubs
-        assert "sqlalchemy" in library.stubs
-        assert "boto3" in library.stubs
-
-    def test_stub_get_raises(self):
+    def test_stub_get_raises(self, stub_library: StubLibrary):
         """Stub library returns exceptions for known functions."""
-        library = load_stubs(Path("."))
-
-        requests_get_raises = library.get_raises("requests", "get")
+        requests_get_raises = stub_library.get_raises("requests", "get")
         assert len(requests_get_raises) > 0
         assert any("ConnectionError" in exc for exc in requests_get_raises)
 
-    def test_stub_unknown_function(self):
+    def test_stub_unknown_function(self, stub_library: StubLibrary):
         """Stub library returns empty list for unknown functions."""
-        library = load_stubs(Path("."))
+        raises = stub_library.get_raises("requests", "nonexistent_function")
+        assert raises == ()
 
-        raises = library.get_raises("requests", "nonexistent_function")
-        assert raises == []
-
-    def test_stub_unknown_module(self):
+    def test_stub_unknown_module(self, stub_library: StubLibrary):
         """Stub library returns empty list for unknown modules."""
-        library = load_stubs(Path("."))
-
-        raises = library.get_raises("nonexistent_module", "get")
-        assert raises == []
-
-    def test_validate_stub_file(self):
+        raises = stub_library.get_raises("nonexistent_module", "get")
+        assert raises == ()
+
+    def test_stub_cache_skipped_without_flow_dir(self, tmp_path):
+        """Loading stubs with the cache on never creates a .flow directory."""
+        missing = tmp_path / "missing"
+
+        load_stubs(tmp_path, use_cache=True)
+        load_stubs(missing, use_cache=True)
+
+        assert not (tmp_path / ".flow").exists()
+        assert not missing.exists()
+
+    def test_stub_cache_round_trip(self, tmp_path):
+        """Cached stubs are read back until a stub file changes."""
+        user_dir = tmp_path / ".flow" / "stubs"
+        user_dir.mkdir(parents=True)
+        user_stub = user_dir / "custom.yaml"
+        user_stub.write_text("module: custom\nfunctions:\n  call: [ValueError]\n")
+        cache_path = tmp_path / ".flow" / STUB_CACHE_FILENAME
+
+        load_stubs(tmp_path, use_cache=True)
+        cached = msgpack.unpackb(cache_path.read_bytes())
+        cached["stubs"] = [["custom", "call", ["TamperedError"]]]
+        cache_path.write_bytes(msgpack.packb(cached))
+
+        assert load_stubs(tmp_path, use_cache=True).stubs == {
+            ("custom", "call"): ("TamperedError",)
+        }
+
+        user_stub.write_text("module: custom\nfunctions:\n  call: [KeyError]\n")
+        reloaded = load_stubs(tmp_path, use_cache=True)
+
+        assert reloaded.get_raises("custom", "call") == ("KeyError",)
+        assert "requests" in reloaded.modules()
+
+    @pytest.mark.parametrize(
+        "stubs",
+        [
+            pytest.param(None, id="missing-stubs"),
+            pytest.param("not-a-list", id="stubs-not-a-list"),
+            pytest.param([["custom", "call"]], id="short-row"),
+            pytest.param([["custom", "call", [1]]], id="non-string-exception"),
+        ],
+    )
+    def test_stub_cache_malformed_payload_falls_back(self, tmp_path, stubs):
+        """A cache whose key matches but whose rows are malformed is ignored."""
+        (tmp_path / ".flow").mkdir()
+        cache_path = tmp_path / ".flow" / STUB_CACHE_FILENAME
+        load_stubs(tmp_path, use_cache=True)
+        cached = msgpack.unpackb(cache_path.read_bytes())
+        if stubs is None:
+            del cached["stubs"]
+        else:
+            cached["stubs"] = stubs
+        cache_path.write_bytes(msgpack.packb(cached))
+
+        assert "requests" in load_stubs(tmp_path, use_cache=True).modules()
+
+    def test_load_stubs_validate(self, tmp_path):
+        """Validating load reports errors per file and skips invalid files."""
+        user_dir = tmp_path / ".flow" / "stubs"
+        user_dir.mkdir(parents=True)
+        bad_file = user_dir / "broken.yaml"
+        bad_file.write_text("functions:\n  call: [ValueError]\n")
+
+        assert "broken" in load_stubs(tmp_path).modules()
+
+        library = load_stubs(tmp_path, validate=True)
+
+        assert library.errors[str(bad_file)] == ["Missing 'module' key"]
+        assert "broken" not in library.modules()
+        assert "requests" in library.modules()
+
+    @pytest.mark.parametrize("yaml_file", BUILTIN_STUB_FILES, ids=lambda p: p.name)
+    def test_validate_stub_file(self, yaml_file: Path):
         """Built-in stub files pass validation."""
-        stub_dir = Path(__file__).parent.parent / "flow" / "stubs"
-        for yaml_file in stub_dir.glob("*.yaml"):
-            errors = validate_stub_file(yaml_file)
-            assert errors == [], f"Errors in {yaml_file.name}: {errors}"
+        assert validate_stub_file(yaml_file) == []
 
 
 class TestFrameworkDetection:
@@ -190,15 +259,13 @@ class TestFrameworkDetection:
         assert "ValidationError" in fastapi_responses
         assert "422" in fastapi_responses["ValidationError"]
 
-    def test_flask_framework_detected_from_imports(self):
+    def test_flask_framework_detected_from_imports(self, flask_model):
         """Flask framework is detected from imports."""
-        model = extract_from_directory(FIXTURES / "flask_app", use_cache=False)
-        assert "flask" in model.detected_frameworks
+        assert "flask" in flask_model.detected_frameworks
 
-    def test_fastapi_framework_detected_from_imports(self):
+    def test_fastapi_framework_detected_from_imports(self, fastapi_model):
         """FastAPI framework is detected from imports."""
-        model = extract_from_directory(FIXTURES / "fastapi_app", use_cache=False)
-        assert "fastapi" in model.detected_frameworks
+        assert "fastapi" in fastapi_model.detected_frameworks
 
 
 class TestConfig:
@@ -230,19 +297,27 @@ class TestConfig:
 class TestPropagationEvidence:
     """Tests for propagation evidence tracking."""
 
-    def test_propagated_with_evidence_populated(self):
+    def test_propagated_with_evidence_populated(self, cli_propagation: PropagationResult):
         """Propagation result includes evidence."""
-        model = extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
-        result = propagate_exceptions(model)
-
-        assert hasattr(result, "propagated_with_evidence")
+        assert hasattr(cli_propagation, "propagated_with_evidence")
 
-    def test_evidence_has_raise_site(self):
+    def test_evidence_has_raise_site(self, cli_propagation: PropagationResult):
         """Evidence includes raise site information."""
-        model = extract_from_directory(FIXTURES / "cli_scripts", use_cache=False)
-        result = propagate_exceptions(model)
-
-        for func_evidence in result.propagated_with_evidence.values():
+        assert any(cli_propagation.propagated_with_evidence.values()), "Should have evidence"
+        for func, func_evidence in cli_propagation.propagated_with_evidence.items():
             for key, prop_raise in func_evidence.items():
-                assert prop_raise.raise_site is not None
-                assert prop_raise.exception_type == key[0]
+                assert prop_raise.raise_site is not None, f"{func} {key}: missing raise site"
+                assert prop_raise.exception_type == key[0], (
+                    f"{func} {key}: exception type {prop_raise.exception_type!r} does not match key"
+                )
+
+    def test_evidence_path_starts_at_function(self, cli_propagation: PropagationResult):
+        """Materialized evidence paths start at the function that holds the evidence."""
+        propagated_paths = 0
+        for func, func_evidence in cli_propagation.propagated_with_evidence.items():
+            for prop_raise in func_evidence.values():
+                edges = prop_raise.edges()
+                if edges:
+                    propagated_paths += 1
+                    assert edges[0].caller == func
+        assert propagated_paths > 0